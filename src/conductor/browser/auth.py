@@ -47,6 +47,9 @@ class AuthenticationFlow:
         ".session-container",  # Session container
     ]
 
+    # How long to look for an existing login before asking the user to log in
+    LOGGED_IN_CHECK_TIMEOUT = 3.0
+
     def __init__(
         self,
         browser: BrowserController,
@@ -89,12 +92,19 @@ class AuthenticationFlow:
             logger.info("Starting authentication flow")
             self.status = AuthStatus.BROWSER_LAUNCHED
 
+            # Step 2: Navigate to Claude Code, launching straight onto it
+            # rather than loading a blank page first
+            logger.info(f"Navigating to {self.CLAUDE_CODE_URL}")
             if not self.browser.is_launched:
-                await self.browser.launch_browser(headless=headless)
+                await self.browser.launch_browser(headless=headless, url=self.CLAUDE_CODE_URL)
+            else:
+                await self.browser.navigate(self.CLAUDE_CODE_URL)
 
-            # Step 2: Navigate to Claude Code
-            logger.info(f"Navigating to {self.CLAUDE_CODE_URL}")
-            await self.browser.navigate(self.CLAUDE_CODE_URL)
+            # A browser profile kept from an earlier run may still be logged in
+            if await self._is_logged_in():
+                self.status = AuthStatus.AUTHENTICATED
+                logger.info("Already logged in to Claude Code")
+                return AuthStatus.AUTHENTICATED
 
             # Step 3: Wait for user to authenticate
             self.status = AuthStatus.WAITING_FOR_USER
@@ -126,6 +136,19 @@ class AuthenticationFlow:
             self.status = AuthStatus.FAILED
             raise MCPError(f"Authentication failed: {e}") from e
 
+    async def _is_logged_in(self) -> bool:
+        """
+        Check whether the page already shows a logged-in session.
+
+        Returns:
+            True if any login success selector is visible
+        """
+        return await self.browser.wait_for_selector(
+            ", ".join(self.LOGIN_SUCCESS_SELECTORS),
+            timeout=self.LOGGED_IN_CHECK_TIMEOUT,
+            state="visible",
+        )
+
     async def _wait_for_user_confirmation(self) -> bool:
         """
         Wait for user to confirm they've logged in by pressing Enter.
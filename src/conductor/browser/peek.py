@@ -106,7 +106,8 @@ class BrowserPeek:
             Dictionary with url, branch, and preview
         """
         try:
-            url = await self.browser.get_current_url()
+            # The preview is informational, so a URL up to one refresh old is fine
+            url = await self.browser.get_current_url(cache_ttl=self.update_interval)
 
             # Extract branch from URL or page
             # Simplified - would need actual implementation
@@ -144,7 +144,9 @@ class PRAutomation:
             logger.info("Clicked PR button")
 
             # Wait for PR creation
-            await asyncio.sleep(3.0)
+            await self.browser.wait_for_selector(
+                ", ".join(self.PR_CREATED_SELECTORS), timeout=10.0, state="attached"
+            )
 
             # Try to extract PR URL
             pr_url = await self._extract_pr_url(timeout)
@@ -75,6 +75,8 @@ class SessionManager:
         """
         self.log_file = log_file or Path.home() / ".conductor" / "sessions.jsonl"
         self.sessions: List[SessionInfo] = []
+        # Ordered set of known branch names, loaded from the log on first use
+        self._branches: Optional[Dict[str, None]] = None
         self._ensure_log_file()
 
     def _ensure_log_file(self) -> None:
@@ -111,6 +113,7 @@ class SessionManager:
 
         self.sessions.append(session)
         self._persist_session(session)
+        self._remember_branch(branch_name)
 
         logger.info(f"Added session {session_id} for task {task_id}")
         if branch_name:
@@ -146,6 +149,7 @@ class SessionManager:
             session.url = url
 
         self._persist_session(session)
+        self._remember_branch(branch_name)
         return session
 
     def get_session(self, session_id: str) -> Optional[SessionInfo]:
@@ -179,13 +183,28 @@ class SessionManager:
         """
         Get all branch names ever created.
 
+        The persistent log is read once; later sessions are added as they are
+        recorded.
+
         Returns:
-            List of branch names
+            List of branch names, oldest first
+        """
+        if self._branches is None:
+            self._branches = dict.fromkeys(self._load_all_branches_from_log())
+            self._branches.update(
+                dict.fromkeys(s.branch_name for s in self.sessions if s.branch_name)
+            )
+        return list(self._branches)
+
+    def _remember_branch(self, branch_name: Optional[str]) -> None:
+        """
+        Add a branch name to the cache once it has been loaded.
+
+        Args:
+            branch_name: Branch name to record
         """
-        branches = [s.branch_name for s in self.sessions if s.branch_name]
-        # Also load from persistent log
-        branches.extend(self._load_all_branches_from_log())
-        return list(set(branches))  # Deduplicate
+        if branch_name and self._branches is not None:
+            self._branches[branch_name] = None
 
     def _persist_session(self, session: SessionInfo) -> None:
         """
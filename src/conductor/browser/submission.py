@@ -42,9 +42,12 @@ class TaskSubmitter:
     SELECTORS = {
         "input_field": "textarea[placeholder*='message']",
         "submit_button": "button[type='submit']",
+        "submit_enabled": "button[type='submit']:not([disabled])",
         "session_indicator": "[data-testid='session-active']",
         "repository_selector": "[data-testid='repository-select']",
         "repository_input": "input[placeholder*='repository']",
+        "repository_options": "[role='listbox']",
+        "pr_link": "a[href*='/pull/']",
     }
 
     def __init__(self, browser: BrowserController, repository: Optional[str] = None):
@@ -156,9 +159,11 @@ class TaskSubmitter:
                     self.SELECTORS["repository_input"], repository, timeout=timeout
                 )
 
-                # Press Enter to select
+                # Wait for the filtered options to show
                 # TODO: This might need to be adjusted based on actual UI
-                await asyncio.sleep(0.5)
+                await self.browser.wait_for_selector(
+                    self.SELECTORS["repository_options"], timeout=5.0, state="visible"
+                )
 
                 logger.info(f"Repository set to: {repository}")
 
@@ -230,7 +235,7 @@ class TaskSubmitter:
         """
         # Wait for submit button to be enabled
         button_found = await self.browser.wait_for_selector(
-            self.SELECTORS["submit_button"],
+            self.SELECTORS["submit_enabled"],
             timeout=timeout,
             state="visible",
         )
@@ -243,9 +248,6 @@ class TaskSubmitter:
 
         logger.info("Clicked submit button")
 
-        # Brief pause for submission to process
-        await asyncio.sleep(1.0)
-
     async def _verify_submission(self, timeout: float) -> Optional[dict]:
         """
         Verify that the task was submitted successfully.
@@ -377,7 +379,9 @@ class TaskSubmitter:
                     continue
 
             # Wait for PR to be created
-            await asyncio.sleep(2.0)
+            await self.browser.wait_for_selector(
+                self.SELECTORS["pr_link"], timeout=min(timeout, 10.0), state="attached"
+            )
 
             # Try to extract PR URL
             current_url = await self.browser.get_current_url()
@@ -91,6 +91,7 @@ class DoctorDiagnostics:
                 server_url=self.config.mcp.server_url,
                 timeout=self.config.mcp.timeout,
                 max_retries=self.config.mcp.max_retries,
+                server_args=self.config.mcp.server_args(),
             )
 
             await self.mcp_client.connect()
@@ -14,6 +14,7 @@ from conductor.tui.splash import show_splash
 from conductor.tasks.loader import TaskLoader, TaskLoadError
 from conductor.utils.config import load_config
 from conductor.orchestrator import Orchestrator
+from conductor.mcp.client import MCPClient
 
 
 # Set up logging
@@ -27,6 +28,24 @@ logger = logging.getLogger(__name__)
 console = Console()
 
 
+def run_async(coro):
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop when it is installed (the ``fast`` extra), since the
+    orchestrators spend most of their time in event loop wakeups.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
 @click.group()
 @click.version_option(version=__version__)
 def cli():
@@ -79,6 +98,11 @@ def cli():
     default=None,
     help="Enable parallel execution with N concurrent tasks (1-10)",
 )
+@click.option(
+    "--no-reuse",
+    is_flag=True,
+    help="Close the MCP connection after each run instead of keeping it open",
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -93,6 +117,7 @@ def run(
     headless: bool,
     no_tui: bool,
     parallel: int | None,
+    no_reuse: bool,
     debug: bool,
 ):
     """
@@ -116,6 +141,8 @@ def run(
             cfg.auth.headless = True
         if repo:
             cfg.default_repository = repo
+        if no_reuse:
+            cfg.mcp.reuse_connection = False
         if parallel is not None:
             if parallel < 1 or parallel > 10:
                 console.print("[red]Error:[/red] Parallel tasks must be between 1 and 10")
@@ -137,11 +164,11 @@ def run(
         if no_tui:
             # Use simple console orchestrator
             if cfg.execution.parallel_mode:
-                console.print("[yellow]Note:[/yellow] Parallel mode works best with TUI. Using sequential execution in console mode.")
-            asyncio.run(run_orchestrator_simple(cfg, task_list))
+                console.print("[yellow]Note:[/yellow] Parallel mode works best with TUI. Console output may interleave.")
+            run_async(run_orchestrator_simple(cfg, task_list))
         else:
             # Use TUI orchestrator (parallel or sequential based on config)
-            asyncio.run(run_orchestrator_tui(cfg, task_list))
+            run_async(run_orchestrator_tui(cfg, task_list))
 
     except TaskLoadError as e:
         console.print(f"[red]Error loading tasks:[/red] {e}")
@@ -160,19 +187,33 @@ def run(
 async def run_orchestrator_simple(config, task_list):
     """Run the simple console orchestrator."""
     orchestrator = Orchestrator(config, task_list)
-    await orchestrator.run()
+    try:
+        await orchestrator.run()
+    finally:
+        # Shared sessions are bound to this event loop, so close them before it ends
+        await MCPClient.close_shared()
 
 
 async def run_orchestrator_tui(config, task_list):
     """Run the TUI orchestrator (parallel or sequential based on config)."""
-    if config.execution.parallel_mode:
-        from conductor.orchestrator_parallel import run_with_tui_parallel
-
-        await run_with_tui_parallel(config, task_list)
-    else:
-        from conductor.orchestrator_tui import run_with_tui
+    try:
+        if config.execution.parallel_mode:
+            from conductor.orchestrator_parallel import (
+                close_warm_browsers,
+                run_with_tui_parallel,
+            )
+
+            try:
+                await run_with_tui_parallel(config, task_list)
+            finally:
+                await close_warm_browsers()
+        else:
+            from conductor.orchestrator_tui import run_with_tui
 
-        await run_with_tui(config, task_list)
+            await run_with_tui(config, task_list)
+    finally:
+        # Shared sessions are bound to this event loop, so close them before it ends
+        await MCPClient.close_shared()
 
 
 @cli.command()
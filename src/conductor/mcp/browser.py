@@ -5,9 +5,11 @@ Updated to properly use accessibility snapshots instead of CSS selectors.
 """
 
 import asyncio
+import json
 import logging
 import re
 import yaml
+from time import monotonic
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
@@ -22,6 +24,13 @@ from .browser_snapshot_parser import (
 
 logger = logging.getLogger(__name__)
 
+# Result parsers run on every evaluation, so compile them once
+_STRING_RESULT_RE = re.compile(r'^\s*("(?:[^"\\]|\\.)*"|null)\s*$', re.MULTILINE)
+_BOOL_RESULT_RE = re.compile(r"^\s*(true|false)\s*$", re.MULTILINE)
+_URL_RE = re.compile(r"(https?://[^\s\"'`]+)")
+_TAB_LINE_RE = re.compile(r"(\d+)[\.:)\-]\s*(.+)")
+_TAB_INDEX_RE = re.compile(r"index\s*[:=]\s*(\d+)", re.IGNORECASE)
+
 
 class BrowserController:
     """
@@ -41,12 +50,13 @@ class BrowserController:
         self.client = mcp_client
         self._browser_launched = False
 
-    async def launch_browser(self, headless: bool = False) -> None:
+    async def launch_browser(self, headless: bool = False, url: str = "about:blank") -> None:
         """
         Launch browser instance.
 
         Args:
             headless: Whether to run in headless mode
+            url: Page to open the browser at
 
         Raises:
             MCPError: If browser launch fails
@@ -57,7 +67,7 @@ class BrowserController:
             await self.client.call_tool(
                 "browser_navigate",
                 {
-                    "url": "about:blank",
+                    "url": url,
                 },
             )
 
@@ -268,14 +278,12 @@ class BrowserController:
         Raises:
             MCPError: If wait fails
         """
-        import time
-
-        start_time = time.time()
+        start_time = monotonic()
 
         try:
             logger.debug(f"Waiting for element: {element_description} (timeout={timeout}s)")
 
-            while time.time() - start_time < timeout:
+            while monotonic() - start_time < timeout:
                 try:
                     # Take a snapshot and check for element
                     snapshot = await self.get_snapshot()
@@ -299,12 +307,22 @@ class BrowserController:
             logger.warning(f"Wait for element failed: {e}")
             return False
 
-    async def get_text(self, element_description: str = "body") -> str:
+    async def get_text(
+        self,
+        element_description: str = "body",
+        max_chars: Optional[int] = None,
+    ) -> str:
         """
         Get text content from the page or a specific element.
 
+        Without ``max_chars`` the full accessibility snapshot text is returned.
+        With it, ``element_description`` is treated as a CSS selector (falling
+        back to the body) and only the last ``max_chars`` characters of its
+        rendered text are transferred.
+
         Args:
             element_description: Description of element (default: entire page)
+            max_chars: Return only this many trailing characters
 
         Returns:
             Element text content
@@ -313,6 +331,14 @@ class BrowserController:
             MCPError: If operation fails
         """
         try:
+            if max_chars is not None:
+                text = await self.evaluate(
+                    "() => { const el = document.querySelector("
+                    f"{json.dumps(element_description)}) || document.body;"
+                    f" return (el ? el.innerText : '').slice(-{int(max_chars)}); }}"
+                )
+                return self._parse_string_result(text) or ""
+
             snapshot = await self.get_snapshot()
             return extract_snapshot_text(snapshot) or ""
 
@@ -320,10 +346,256 @@ class BrowserController:
             logger.error(f"Get text failed: {e}")
             raise MCPError(f"Failed to get text: {e}") from e
 
-    async def get_current_url(self) -> str:
+    async def evaluate(self, function: str) -> str:
+        """
+        Evaluate a JavaScript function in the current page.
+
+        Args:
+            function: JavaScript function source, e.g. "() => document.title"
+
+        Returns:
+            Text of the evaluation result
+
+        Raises:
+            MCPError: If evaluation fails
+        """
+        try:
+            result = await self.client.call_tool("browser_evaluate", {"function": function})
+        except Exception as e:
+            logger.error(f"Evaluate failed: {e}")
+            raise MCPError(f"Failed to evaluate script: {e}") from e
+
+        if "content" in result and isinstance(result["content"], list):
+            for item in result["content"]:
+                text = self._get_content_attr(item, "text")
+                if text:
+                    return text
+            return ""
+        if "result" in result:
+            return str(result["result"])
+        return str(result)
+
+    async def probe_completion(
+        self,
+        indicator_selector: str,
+        branch_selector: str,
+        keyword_pattern: str,
+        tail_chars: int = 4096,
+    ) -> Dict[str, Any]:
+        """
+        Gather every task completion signal in a single evaluation.
+
+        The page text is scanned in the browser, so only a small summary
+        crosses the MCP channel. A MutationObserver installed on the first
+        probe keeps the summary until the page changes, so probing a page
+        that is idle, or still unchanged since the last poll, skips the scan.
+
+        Args:
+            indicator_selector: CSS selector of an explicit completion indicator
+            branch_selector: CSS selector of an element showing the branch name,
+                read from its data-branch-name attribute or its text
+            keyword_pattern: Case-insensitive regex of completion phrases
+            tail_chars: How much of the end of the conversation to scan
+
+        Returns:
+            Dictionary with "indicator" and "pr_enabled" booleans, "branch"
+            (str or None), "keyword" (bool, a phrase in the text tail) and
+            "length" (int, size of the conversation text, to notice changes)
+        """
+        probe = self._completion_probe_js(
+            indicator_selector, branch_selector, keyword_pattern, tail_chars
+        )
+        key = json.dumps([indicator_selector, branch_selector, keyword_pattern, tail_chars])
+        text = await self.evaluate(
+            "() => {"
+            " let state = window.__conductorProbe;"
+            " if (!state) {"
+            " state = window.__conductorProbe = { key: null, summary: null };"
+            " new MutationObserver(() => { state.summary = null; }).observe("
+            " document.documentElement,"
+            " { childList: true, subtree: true, attributes: true, characterData: true });"
+            " }"
+            f" if (state.summary === null || state.key !== {json.dumps(key)}) {{"
+            f" state.key = {json.dumps(key)}; state.summary = JSON.stringify(({probe})()); }}"
+            " return state.summary; }"
+        )
+        return self._decode_probe(text)
+
+    async def wait_for_completion(
+        self,
+        indicator_selector: str,
+        branch_selector: str,
+        keyword_pattern: str,
+        timeout: float = 10.0,
+        tail_chars: int = 4096,
+    ) -> Dict[str, Any]:
+        """
+        Wait in the page until a completion signal appears.
+
+        The page is re-probed when a MutationObserver sees it change, at most
+        every 250ms while it streams, so completion is seen as soon as it
+        shows instead of at the next poll. This holds the current tab for up
+        to ``timeout``, so it suits a browser driving one task at a time.
+
+        Args:
+            indicator_selector: CSS selector of an explicit completion indicator
+            branch_selector: CSS selector of an element showing the branch name
+            keyword_pattern: Case-insensitive regex of completion phrases
+            timeout: Maximum time to wait in seconds
+            tail_chars: How much of the end of the conversation to scan
+
+        Returns:
+            The last completion probe, see probe_completion. It has a true
+            "indicator", "pr_enabled" or "keyword" unless the wait timed out
+        """
+        probe = self._completion_probe_js(
+            indicator_selector, branch_selector, keyword_pattern, tail_chars
+        )
+        text = await self.evaluate(
+            "() => new Promise((resolve) => {"
+            f" const probe = {probe};"
+            " let pending = null;"
+            " const finish = (summary) => { observer.disconnect(); clearTimeout(pending);"
+            " clearTimeout(timer); resolve(JSON.stringify(summary)); };"
+            " const check = () => { pending = null; const summary = probe();"
+            " if (summary.indicator || summary.pr_enabled || summary.keyword) finish(summary); };"
+            " const observer = new MutationObserver(() => {"
+            " if (pending === null) pending = setTimeout(check, 250); });"
+            f" const timer = setTimeout(() => finish(probe()), {int(timeout * 1000)});"
+            " observer.observe(document.documentElement,"
+            " { childList: true, subtree: true, attributes: true, characterData: true });"
+            " check();"
+            " })"
+        )
+        return self._decode_probe(text)
+
+    @staticmethod
+    def _completion_probe_js(
+        indicator_selector: str, branch_selector: str, keyword_pattern: str, tail_chars: int
+    ) -> str:
+        """Build the in-page function computing the completion summary."""
+        # The patterns are compiled once per evaluation rather than per probe,
+        # and match case-insensitively instead of lowercasing copies of the text
+        return (
+            "(() => {"
+            f" const keyword = new RegExp({json.dumps(keyword_pattern)}, 'i');"
+            " const createPr = /create pr/i;"
+            " return () => {"
+            " const root = document.querySelector('main') || document.body;"
+            " const text = root ? root.innerText : '';"
+            f" const tail = text.slice(-{int(tail_chars)});"
+            f" const badge = document.querySelector({json.dumps(branch_selector)});"
+            " const match = tail.match(/claude\\/[A-Za-z0-9_-]+/);"
+            " return {"
+            f" indicator: !!document.querySelector({json.dumps(indicator_selector)}),"
+            " pr_enabled: Array.from(document.querySelectorAll('button')).some((b) =>"
+            " !b.disabled && createPr.test(b.textContent)),"
+            " branch: badge ? (badge.getAttribute('data-branch-name') || badge.textContent.trim())"
+            " : (match ? match[0] : null),"
+            " keyword: keyword.test(tail),"
+            " length: text.length,"
+            " }; }; })()"
+        )
+
+    def _decode_probe(self, text: str) -> Dict[str, Any]:
+        """Decode a completion summary returned as a JSON string."""
+        probe = json.loads(self._parse_string_result(text) or "{}")
+        return {
+            "indicator": bool(probe.get("indicator")),
+            "pr_enabled": bool(probe.get("pr_enabled")),
+            "branch": probe.get("branch") or None,
+            "keyword": bool(probe.get("keyword")),
+            "length": int(probe.get("length") or 0),
+        }
+
+    async def follow_link(self, url: str) -> bool:
+        """
+        Click a link to a URL on the current page, if there is one.
+
+        Lets a single-page app route in place instead of reloading.
+
+        Args:
+            url: Absolute URL the link should point to
+
+        Returns:
+            True if a matching link was clicked
+        """
+        text = await self.evaluate(
+            f"() => {{ const target = {json.dumps(url.rstrip('/'))};"
+            " const link = Array.from(document.links).find("
+            "(a) => a.href.replace(/\\/$/, '') === target);"
+            " if (!link) return false; link.click(); return true; }"
+        )
+        return self._parse_bool_result(text)
+
+    async def wait_for_selector(
+        self,
+        selector: str,
+        timeout: float = 30.0,
+        state: str = "visible",
+    ) -> bool:
+        """
+        Wait for an element matching a CSS selector to reach a state.
+
+        The wait runs inside the page with a MutationObserver, so it returns
+        as soon as the condition holds and costs a single MCP round-trip.
+
+        Args:
+            selector: CSS selector to wait for
+            timeout: Maximum time to wait in seconds
+            state: One of "attached", "visible", "hidden" or "detached"
+
+        Returns:
+            True if the state was reached, False on timeout or error
+        """
+        checks = {
+            "attached": "!!el",
+            "visible": "!!el && el.getClientRects().length > 0",
+            "hidden": "!el || el.getClientRects().length === 0",
+            "detached": "!el",
+        }
+        if state not in checks:
+            raise ValueError(f"Unsupported selector state: {state}")
+
+        function = (
+            "() => new Promise((resolve) => {"
+            f" const matches = () => {{ const el = document.querySelector({json.dumps(selector)});"
+            f" return {checks[state]}; }};"
+            " if (matches()) { resolve(true); return; }"
+            " const observer = new MutationObserver(() => {"
+            " if (matches()) { observer.disconnect(); clearTimeout(timer); resolve(true); } });"
+            " const timer = setTimeout(() => { observer.disconnect(); resolve(false); },"
+            f" {int(timeout * 1000)});"
+            " observer.observe(document.documentElement,"
+            " { childList: true, subtree: true, attributes: true });"
+            " })"
+        )
+
+        try:
+            logger.debug(f"Waiting for selector {selector} to be {state} (timeout={timeout}s)")
+            return self._parse_bool_result(await self.evaluate(function))
+        except Exception as e:
+            logger.debug(f"Wait for selector {selector} failed: {e}")
+            return False
+
+    def _parse_string_result(self, text: str) -> Optional[str]:
+        """Decode the JSON string literal of a string evaluation result."""
+        match = _STRING_RESULT_RE.search(text)
+        return json.loads(match.group(1)) if match else None
+
+    def _parse_bool_result(self, text: str) -> bool:
+        """Interpret the text of a boolean evaluation result."""
+        match = _BOOL_RESULT_RE.search(text)
+        return bool(match) and match.group(1) == "true"
+
+    async def get_current_url(self, cache_ttl: Optional[float] = None) -> str:
         """
         Get current page URL.
 
+        Args:
+            cache_ttl: Seconds a previously read URL may be reused, for callers
+                that can tolerate a slightly stale value (default: always read)
+
         Returns:
             Current URL
 
@@ -334,6 +606,7 @@ class BrowserController:
             result = await self.client.call_tool(
                 "browser_evaluate",
                 {"function": "() => window.location.href"},
+                cache_ttl=cache_ttl,
             )
 
             text_value: Optional[str] = None
@@ -341,10 +614,7 @@ class BrowserController:
             # Handle MCP response format
             if "content" in result and isinstance(result["content"], list):
                 for item in result["content"]:
-                    if hasattr(item, "text"):
-                        text_value = item.text
-                    elif isinstance(item, dict) and "text" in item:
-                        text_value = item["text"]
+                    text_value = self._get_content_attr(item, "text")
 
                     if text_value:
                         url = self._extract_url_from_text(text_value)
@@ -368,7 +638,7 @@ class BrowserController:
         if not text:
             return None
 
-        match = re.search(r"(https?://[^\s\"'`]+)", text)
+        match = _URL_RE.search(text)
         if match:
             return match.group(1)
         return None
@@ -478,6 +748,110 @@ class BrowserController:
             logger.error(f"Failed to switch to tab {index}: {e}")
             raise MCPError(f"Tab switch failed: {e}") from e
 
+    async def switch_and_navigate(self, index: int, url: str) -> None:
+        """
+        Switch to a tab and navigate it to a URL.
+
+        Both steps go to the server as one batch when it supports batching.
+
+        Args:
+            index: Index of the tab to switch to
+            url: URL to navigate to
+
+        Raises:
+            MCPError: If the switch or navigation fails
+        """
+        try:
+            logger.debug(f"Switching to tab {index} and navigating to {url}")
+
+            await self.client.batch_call_tool(
+                [
+                    {"tool": "browser_tabs", "arguments": {"action": "select", "index": index}},
+                    {"tool": "browser_navigate", "arguments": {"url": url}},
+                ]
+            )
+
+            logger.info(f"Tab {index} navigated to {url}")
+
+        except Exception as e:
+            logger.error(f"Failed to open {url} in tab {index}: {e}")
+            raise MCPError(f"Failed to open {url} in tab {index}: {e}") from e
+
+    async def open_new_task_tab(self, url: str) -> int:
+        """
+        Open a new tab and navigate it to a URL.
+
+        The server selects the tab it opens, so creating and navigating go out
+        as one batch when it supports batching. If that fails partway, the tab
+        list is checked for a tab it already opened before opening another.
+
+        Args:
+            url: URL to open in the new tab
+
+        Returns:
+            Index of the new tab
+
+        Raises:
+            MCPError: If the tab cannot be opened
+        """
+        try:
+            logger.debug(f"Opening new tab at {url}")
+            results = await self.client.batch_call_tool(
+                [
+                    {"tool": "browser_tabs", "arguments": {"action": "new"}},
+                    {"tool": "browser_navigate", "arguments": {"url": url}},
+                ]
+            )
+        except Exception as e:
+            logger.debug(f"Opening a tab at {url} failed ({e}); checking the open tabs")
+            index = await self._find_opened_tab(url)
+            if index is None:
+                index = await self.create_tab()
+            await self.switch_and_navigate(index, url)
+            return index
+
+        new_tab_index = None
+        for result in results:
+            new_tab_index = self._extract_tab_index(result)
+            if new_tab_index is None:
+                tabs_from_result = self._extract_tabs_from_result(result)
+                if tabs_from_result:
+                    new_tab_index = tabs_from_result[-1].get("index")
+            if new_tab_index is not None:
+                break
+
+        if new_tab_index is None:
+            tabs = await self.list_tabs()
+            if tabs:
+                new_tab_index = max(tab.get("index", -1) for tab in tabs)
+
+        if new_tab_index is None or new_tab_index < 0:
+            raise MCPError("Unable to determine new tab index after creation")
+
+        logger.info(f"Opened {url} in new tab {new_tab_index}")
+        return int(new_tab_index)
+
+    async def _find_opened_tab(self, url: str) -> Optional[int]:
+        """
+        Find a tab left behind by an open_new_task_tab call that failed partway.
+
+        The server selects the tab it opens, so such a tab is the selected,
+        last tab, still blank or already at the URL.
+
+        Returns:
+            Index of that tab, or None if no tab was opened
+        """
+        tabs = await self.list_tabs()
+        if not tabs:
+            return None
+
+        last = max(tabs, key=lambda tab: tab.get("index", -1))
+        description = f"{last.get('title', '')} {last.get('url', '')}"
+        selected = last.get("active") or "(current)" in description
+        urls = {found.rstrip(")/") for found in _URL_RE.findall(description)}
+        blank = "about:blank" in description or url.rstrip("/") in urls
+        return int(last["index"]) if selected and blank and last["index"] > 0 else None
+
     async def close_tab(self, index: int) -> None:
         """
         Close a specific browser tab.
@@ -526,7 +900,7 @@ class BrowserController:
             if line.startswith("#"):  # Skip markdown headings like ### Tabs
                 continue
 
-            match = re.match(r"(\d+)[\.:)\-]\s*(.+)", line)
+            match = _TAB_LINE_RE.match(line)
             if match:
                 # Most textual lists are 1-based; convert to 0-based
                 idx = int(match.group(1))
@@ -566,7 +940,7 @@ class BrowserController:
 
             text = self._get_content_attr(item, "text")
             if text:
-                match = re.search(r"index\s*[:=]\s*(\d+)", text, re.IGNORECASE)
+                match = _TAB_INDEX_RE.search(text)
                 if match:
                     return int(match.group(1))
 
@@ -660,7 +1034,7 @@ class BrowserController:
             if element_ref:
                 logger.info("Found notification dialog, dismissing...")
                 await self.click("Not Now button")
-                await asyncio.sleep(1.0)
+                await self.wait_for_selector("[role='dialog']", timeout=1.0, state="hidden")
                 return True
 
             return False
@@ -10,6 +10,14 @@ from typing import Dict, Any, Optional, Union, List
 
 logger = logging.getLogger(__name__)
 
+# Claude Code branch names. "Branch: claude/..." and "Working on: claude/..."
+# labels always contain this match too, so one pattern covers them all
+_BRANCH_NAME_RE = re.compile(r"claude/[a-zA-Z0-9\-_]+")
+
+# Per-line patterns for parse_elements, compiled once rather than per line
+_REF_RE = re.compile(r"\[ref=([^\]]+)\]")
+_ELEMENT_TYPE_RE = re.compile(r"([a-zA-Z]+)")
+
 
 def find_element_in_snapshot(snapshot: Union[str, Dict], description: str) -> Optional[str]:
     """
@@ -71,11 +79,10 @@ def extract_snapshot_text(snapshot: Union[str, Dict]) -> str:
 
         if isinstance(content, list):
             for item in content:
-                text = None
-                if hasattr(item, "text"):
-                    text = item.text
-                elif isinstance(item, dict):
+                if isinstance(item, dict):
                     text = item.get("text")
+                else:
+                    text = getattr(item, "text", None)
 
                 if text:
                     return text
@@ -100,7 +107,7 @@ def parse_elements(text: str) -> List[Dict[str, str]]:
         if not line.startswith(("-", "•")):
             continue
 
-        ref_match = re.search(r"\[ref=([^\]]+)\]", line)
+        ref_match = _REF_RE.search(line)
         if not ref_match:
             continue
 
@@ -116,7 +123,7 @@ def parse_elements(text: str) -> List[Dict[str, str]]:
             body = body[1:-1]
 
         # Extract element type
-        type_match = re.match(r"([a-zA-Z]+)", body)
+        type_match = _ELEMENT_TYPE_RE.match(body)
         if not type_match:
             continue
 
@@ -215,11 +222,9 @@ def search_elements(elements: List[Dict[str, str]], description_lower: str) -> O
             if element_type == "button":
                 # Extract button text from description
                 button_text = description_lower.replace(" button", "").replace("button", "").strip()
-                if button_text and (
-                    button_text in element_text.lower()
-                    or button_text in element_name.lower()
-                    or button_text in element_raw
-                ):
+                # Name and text are both cut from the line, so the lowercased
+                # raw line already covers them
+                if button_text and button_text in element_raw:
                     return element_ref
 
     return None
@@ -261,17 +266,5 @@ def extract_branch_name(snapshot_text: str) -> Optional[str]:
         Branch name if found, None otherwise
     """
     # Look for patterns like "claude/test-conductor-011CV4beKrFjCAcPw3r7tC3u"
-    patterns = [
-        r'claude/[a-zA-Z0-9\-_]+',
-        r'Branch:\s*(claude/[a-zA-Z0-9\-_]+)',
-        r'Working on:\s*(claude/[a-zA-Z0-9\-_]+)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, snapshot_text)
-        if match:
-            if "Branch:" in pattern or "Working on:" in pattern:
-                return match.group(1)
-            return match.group(0)
-
-    return None
+    match = _BRANCH_NAME_RE.search(snapshot_text)
+    return match.group(0) if match else None
@@ -3,18 +3,38 @@ MCP client for connecting to and communicating with MCP servers.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any, List
+import random
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from mcp.client.sse import sse_client
+# The mcp package pulls in its transports and type models on import, so it is
+# only loaded once a connection is actually made
+if TYPE_CHECKING:
+    from mcp import ClientSession
 
 
 logger = logging.getLogger(__name__)
 
+# Server-side aggregator tool used to run several tool calls in one round-trip
+BATCH_TOOL_NAME = "batch_execute"
+
+DEFAULT_SERVER_URL = "stdio://playwright-mcp"
+
+# Maximum number of memoized tool results, see MCPClient.call_tool()
+CALL_CACHE_SIZE = 256
+
+# Tools that only read page state and so leave cached results valid
+_READ_ONLY_TOOLS = frozenset({"browser_snapshot", "browser_take_screenshot"})
+
+# Process-wide clients keyed by server URL, see MCPClient.get_shared()
+_SHARED: Dict[str, "MCPClient"] = {}
+
 
 class MCPError(Exception):
     """Base exception for MCP-related errors."""
@@ -32,7 +52,9 @@ class MCPClient:
     """
     Client for communicating with MCP servers.
 
-    Supports both stdio and HTTP/SSE transports based on server URL.
+    Supports both stdio and HTTP/SSE transports based on server URL. The
+    transport and session are opened once in connect() and every tool call
+    reuses them until disconnect(), so there is no per-call handshake.
     """
 
     def __init__(
@@ -40,6 +62,8 @@ class MCPClient:
         server_url: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        tools_cache_ttl: float = 300.0,
+        server_args: Optional[List[str]] = None,
     ):
         """
         Initialize MCP client.
@@ -48,23 +72,101 @@ class MCPClient:
             server_url: URL of the MCP server (http://... for SSE, stdio://... for stdio)
             timeout: Connection timeout in seconds
             max_retries: Maximum number of connection retries
+            tools_cache_ttl: How long list_tools results are reused, in seconds
+            server_args: Command line arguments for a stdio server
+
+        Raises:
+            MCPConnectionError: If the server URL uses an unsupported protocol
         """
-        self.server_url = server_url or "stdio://playwright-mcp"
+        self.server_url = server_url or DEFAULT_SERVER_URL
+
+        # Resolve the transport once rather than on every connection attempt
+        self._scheme = urlparse(self.server_url).scheme
+        if self._scheme in ("http", "https"):
+            self._connect_impl = self._connect_sse
+        elif self._scheme == "stdio":
+            self._connect_impl = self._connect_stdio
+        else:
+            raise MCPConnectionError(f"Unsupported protocol: {self._scheme}")
+
         self.timeout = timeout
         self.max_retries = max_retries
+        self.server_args = list(server_args or [])
         self._connected = False
-        self._session: Optional[ClientSession] = None
+        self._base_delay = 0.5
+        self._max_delay = 10.0
+        self._session: Optional["ClientSession"] = None
         self._read = None
         self._write = None
         self._session_context = None
 
+        # Tool schemas are static for the server's lifetime, so cache them
+        self._tools_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._tools_ttl = tools_cache_ttl
+        self._tools_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+
+        # Opt-in memoized tool results, least recently used first
+        self._call_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @classmethod
+    def get_shared(cls, server_url: Optional[str] = None, **kwargs: Any) -> "MCPClient":
+        """
+        Get the process-wide client for a server, creating it on first use.
+
+        Reusing the client keeps its session warm across orchestrator runs,
+        so the transport handshake only happens once.
+
+        Args:
+            server_url: URL of the MCP server
+            **kwargs: Extra MCPClient arguments, only used when creating the client
+
+        Returns:
+            Shared MCPClient instance
+        """
+        key = server_url or DEFAULT_SERVER_URL
+        client = _SHARED.get(key)
+        if client is None:
+            client = cls(server_url=key, **kwargs)
+            _SHARED[key] = client
+        return client
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """Disconnect and forget all shared clients."""
+        clients = list(_SHARED.values())
+        _SHARED.clear()
+
+        for client in clients:
+            if client.is_connected:
+                await client.disconnect()
+
+    async def ensure_connected(self) -> None:
+        """Connect to the MCP server unless already connected."""
+        if not self.is_connected:
+            await self.connect()
+
     async def connect(self) -> None:
         """
-        Connect to the MCP server with exponential backoff retry.
+        Connect to the MCP server with jittered exponential backoff retry.
+
+        Concurrent callers share a single handshake, and calling this on a
+        connected client does nothing.
 
         Raises:
             MCPConnectionError: If connection fails after all retries
         """
+        async with self._connect_lock:
+            if self.is_connected:
+                return
+
+            await self._connect_with_retry()
+
+    async def _connect_with_retry(self) -> None:
+        """Run the transport handshake, retrying with jittered backoff."""
+        self._tools_cache = None
+        self._call_cache.clear()
+
         for attempt in range(self.max_retries):
             try:
                 logger.info(
@@ -72,17 +174,7 @@ class MCPClient:
                     f"(attempt {attempt + 1}/{self.max_retries})"
                 )
 
-                # Determine transport type based on URL
-                parsed_url = urlparse(self.server_url)
-
-                if parsed_url.scheme in ("http", "https"):
-                    # HTTP/SSE transport
-                    await self._connect_sse()
-                elif parsed_url.scheme == "stdio":
-                    # Stdio transport
-                    await self._connect_stdio()
-                else:
-                    raise MCPConnectionError(f"Unsupported protocol: {parsed_url.scheme}")
+                await self._connect_impl()
 
                 self._connected = True
                 logger.info("Successfully connected to MCP server")
@@ -92,8 +184,12 @@ class MCPClient:
                 logger.warning(f"Connection attempt {attempt + 1} failed: {e}")
 
                 if attempt < self.max_retries - 1:
-                    delay = min(2**attempt, 10)  # Exponential backoff, max 10s
-                    logger.info(f"Retrying in {delay} seconds...")
+                    # Full-jitter exponential backoff so clients starting together
+                    # don't retry in lockstep
+                    delay = random.uniform(
+                        0, min((2**attempt) * self._base_delay, self._max_delay)
+                    )
+                    logger.info(f"Retrying in {delay:.2f} seconds...")
                     await asyncio.sleep(delay)
                 else:
                     raise MCPConnectionError(
@@ -102,6 +198,9 @@ class MCPClient:
 
     async def _connect_sse(self) -> None:
         """Connect using HTTP/SSE transport."""
+        from mcp import ClientSession
+        from mcp.client.sse import sse_client
+
         # Ensure URL ends with /sse for Playwright MCP compatibility
         url = self.server_url
         if not url.endswith('/sse'):
@@ -120,13 +219,16 @@ class MCPClient:
 
     async def _connect_stdio(self) -> None:
         """Connect using stdio transport."""
+        from mcp import ClientSession, StdioServerParameters
+        from mcp.client.stdio import stdio_client
+
         # Extract command from stdio:// URL
         command = self.server_url.replace("stdio://", "")
 
         # Use stdio_client context manager
         server_params = StdioServerParameters(
             command=command,
-            args=[],
+            args=self.server_args,
         )
         self._session_context = stdio_client(server_params)
         self._read, self._write = await self._session_context.__aenter__()
@@ -138,6 +240,9 @@ class MCPClient:
 
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
+        self._tools_cache = None
+        self._call_cache.clear()
+
         if self._session:
             try:
                 logger.info("Disconnecting from MCP server")
@@ -151,14 +256,22 @@ class MCPClient:
                 self._connected = False
 
     async def call_tool(
-        self, tool_name: str, arguments: Optional[Dict[str, Any]] = None
+        self,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Call an MCP tool.
 
+        Read-only calls can opt into memoization with ``cache_ttl``: an identical
+        call within that many seconds returns the stored result. Any uncached
+        call that may change page state clears the cache.
+
         Args:
             tool_name: Name of the tool to call
             arguments: Tool arguments (optional)
+            cache_ttl: Seconds to reuse this call's result (default: no caching)
 
         Returns:
             Tool response as a dictionary
@@ -169,6 +282,20 @@ class MCPClient:
         if not self._connected or not self._session:
             raise MCPError("Not connected to MCP server")
 
+        key = None
+        if cache_ttl:
+            key = hashlib.blake2b(
+                (tool_name + json.dumps(arguments or {}, sort_keys=True)).encode(),
+                digest_size=16,
+            ).hexdigest()
+            cached = self._call_cache.get(key)
+            if cached and time.monotonic() - cached[0] < cache_ttl:
+                self._call_cache.move_to_end(key)
+                logger.debug(f"Using cached result for MCP tool: {tool_name}")
+                return cached[1]
+        elif tool_name not in _READ_ONLY_TOOLS:
+            self._call_cache.clear()
+
         try:
             logger.debug(f"Calling MCP tool: {tool_name} with args: {arguments}")
 
@@ -181,19 +308,72 @@ class MCPClient:
 
             # Convert result to dict format
             # MCP returns a CallToolResult object with content list
-            if hasattr(result, "content"):
-                return {"success": True, "content": result.content}
+            content = getattr(result, "content", None)
+            if content is not None:
+                response = {"success": True, "content": content}
             else:
-                return {"success": True, "result": str(result)}
+                response = {"success": True, "result": str(result)}
+
+            if key:
+                self._call_cache[key] = (time.monotonic(), response)
+                if len(self._call_cache) > CALL_CACHE_SIZE:
+                    self._call_cache.popitem(last=False)
+
+            return response
 
         except Exception as e:
             logger.error(f"MCP tool call failed: {e}")
             raise MCPError(f"Tool call failed: {e}") from e
 
+    async def batch_call_tool(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Call several MCP tools in order, in a single round-trip when possible.
+
+        If the server advertises a ``batch_execute`` tool whose input schema
+        takes an ``operations`` list, the calls are sent as one aggregated
+        request, stopping at the first error where the tool supports it.
+        Otherwise, as with Playwright MCP, they are made one after another.
+
+        Args:
+            calls: List of {"tool": name, "arguments": {...}} dictionaries
+
+        Returns:
+            Tool responses - one per call, or a single aggregated response
+            when the server batched them
+
+        Raises:
+            MCPError: If any tool call fails
+        """
+        tools = await self.list_tools()
+        batch_tool = next((tool for tool in tools if tool["name"] == BATCH_TOOL_NAME), None)
+        schema = (batch_tool or {}).get("inputSchema") or {}
+        properties = schema.get("properties") or {}
+
+        if "operations" in properties:
+            arguments: Dict[str, Any] = {
+                "operations": [
+                    {"tool": call["tool"], "arguments": call.get("arguments") or {}}
+                    for call in calls
+                ]
+            }
+            # Optional settings are only sent to a tool that declares them
+            for option, value in (("stopOnError", True), ("maxConcurrent", 1)):
+                if option in properties:
+                    arguments[option] = value
+            return [await self.call_tool(BATCH_TOOL_NAME, arguments)]
+
+        results = []
+        for call in calls:
+            results.append(await self.call_tool(call["tool"], call.get("arguments")))
+        return results
+
     async def list_tools(self) -> List[Dict[str, Any]]:
         """
         List available tools from the MCP server.
 
+        Results are cached for ``tools_cache_ttl`` seconds; concurrent callers
+        share a single in-flight request.
+
         Returns:
             List of tool descriptions
 
@@ -203,25 +383,29 @@ class MCPClient:
         if not self._connected or not self._session:
             raise MCPError("Not connected to MCP server")
 
-        try:
-            result = await self._session.list_tools()
+        async with self._tools_lock:
+            if self._tools_cache and time.monotonic() - self._tools_cache[0] < self._tools_ttl:
+                return self._tools_cache[1]
+
+            try:
+                result = await self._session.list_tools()
 
-            # Convert to list of dicts
-            tools = []
-            for tool in result.tools:
-                tools.append(
+                # Convert to list of dicts
+                tools = [
                     {
                         "name": tool.name,
-                        "description": tool.description if hasattr(tool, "description") else "",
-                        "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
+                        "description": getattr(tool, "description", ""),
+                        "inputSchema": getattr(tool, "inputSchema", {}),
                     }
-                )
+                    for tool in result.tools
+                ]
 
-            return tools
+                self._tools_cache = (time.monotonic(), tools)
+                return tools
 
-        except Exception as e:
-            logger.error(f"Failed to list tools: {e}")
-            raise MCPError(f"Failed to list tools: {e}") from e
+            except Exception as e:
+                logger.error(f"Failed to list tools: {e}")
+                raise MCPError(f"Failed to list tools: {e}") from e
 
     @property
     def is_connected(self) -> bool:
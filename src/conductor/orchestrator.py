@@ -3,23 +3,61 @@ Main orchestrator for task execution.
 """
 
 import asyncio
+import heapq
 import logging
-from typing import Optional
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from rich.console import Console, Group
+from rich.table import Table
 
-from conductor.mcp.client import MCPClient
+from conductor.mcp.client import MCPClient, MCPConnectionError
 from conductor.mcp.browser import BrowserController
 from conductor.browser.auth import AuthenticationFlow, AuthStatus
 from conductor.browser.session import SessionManager
 from conductor.tasks.models import TaskList, Task, TaskStatus
 from conductor.utils.config import Config
-from conductor.utils.retry import retry_async
+from conductor.utils.retry import retry_async, wait_until
 
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+_CLAUDE_CODE_URL = "https://claude.ai/code"
+
+# Readiness selectors that replace fixed sleeps while driving the page. Their
+# timeouts match the old sleeps, so a selector that never matches costs no more
+_PAGE_READY_SELECTOR = "textarea, [contenteditable='true']"
+_DROPDOWN_SELECTOR = "[role='menu'], [role='listbox']"
+_SUBMIT_READY_SELECTOR = "button[type='submit']:not([disabled])"
+
+# Element carrying the pushed branch name, in an attribute or as its text
+_BRANCH_SELECTOR = "[data-branch-name], .git-branch-badge"
+
+# Explicit completion indicator checked by the completion probe
+_COMPLETION_SELECTOR = "[data-testid='task-complete'], .completion-indicator"
+
+# Only the tail of the conversation is scanned for completion messages
+_TEXT_TAIL_CHARS = 4096
+
+# Longest we wait for the browser to close during cleanup (seconds)
+_CLEANUP_TIMEOUT = 10.0
+
+# Completion polling backs off by this factor up to the cap (seconds) while
+# the page is idle, and drops back to the initial interval when it changes
+_CHECK_BACKOFF = 1.5
+_MAX_CHECK_INTERVAL = 15.0
+
+# Branch names in Claude Code UI: after a "branch:" label, or a bare
+# "claude/..." name, matched in a single scan
+_BRANCH_RE = re.compile(
+    r"branch[:\s]+(?P<labelled>[a-zA-Z0-9/_-]+)|claude/(?P<claude>[a-zA-Z0-9/_-]+)",
+    re.IGNORECASE,
+)
+
+# Completion signs looked for once a branch shows up on the page
+_COMPLETION_KEYWORDS = ("pushed to branch", "create pr", "pull request", "committed", "merged")
+_COMPLETION_RE = re.compile("|".join(_COMPLETION_KEYWORDS), re.IGNORECASE)
+
 
 class Orchestrator:
     """
@@ -39,18 +77,47 @@ class Orchestrator:
         """
         self.config = config
         self.task_list = task_list
+        # Dependency checks look tasks up by ID; the task list is fixed for a run
+        self._task_index: Dict[str, Task] = {t.id: t for t in task_list.tasks}
         self.mcp_client: Optional[MCPClient] = None
         self.browser: Optional[BrowserController] = None
         self.auth_flow: Optional[AuthenticationFlow] = None
         self.session_manager = SessionManager()
 
+        # Concurrency control - tasks share one browser, so tab-scoped
+        # interactions are serialized while completion waits overlap
+        self.max_parallel = (
+            config.execution.max_parallel_tasks if config.execution.parallel_mode else 1
+        )
+        self._browser_lock = asyncio.Lock()
+
+        # A task holds its tab until it completes, so one tab means one task at a time
+        self.tab_reuse_mode = config.execution.tab_reuse_mode
+        if self.tab_reuse_mode == "single":
+            self.max_parallel = 1
+
+        # Idle tabs recycled across tasks, capped at one per concurrent task
+        # (unused in "per_task" mode)
+        self._tab_pool: asyncio.Queue[int] = asyncio.Queue()
+        self._tabs_created = 0
+
+        # Set by cancel() to wake completion polls and stop starting tasks
+        self._cancel_event = asyncio.Event()
+
+    def cancel(self) -> None:
+        """Stop waiting on running tasks and skip the ones not yet started."""
+        self._cancel_event.set()
+
     async def run(self) -> None:
         """Run the orchestration flow."""
         try:
             console.print("[bold cyan]Starting Conductor Orchestrator[/bold cyan]\n")
 
-            # Step 1: Initialize MCP connection
-            await self._initialize_mcp()
+            # Step 1: Initialize MCP connection, showing the login steps while
+            # the connection comes up so the user can read them meanwhile
+            init_task = asyncio.create_task(self._initialize_mcp())
+            self._show_auth_instructions()
+            await init_task
 
             # Step 2: Authenticate
             await self._authenticate()
@@ -62,9 +129,11 @@ class Orchestrator:
             self._show_summary()
 
         except KeyboardInterrupt:
+            self.cancel()
             console.print("\n[yellow]Interrupted by user[/yellow]")
 
         except Exception as e:
+            self.cancel()
             logger.exception("Orchestration failed")
             console.print(f"\n[red]Error:[/red] {e}")
 
@@ -75,18 +144,34 @@ class Orchestrator:
         """Initialize MCP connection."""
         console.print("[cyan]Initializing MCP connection...[/cyan]")
 
-        self.mcp_client = MCPClient(
+        client_factory = MCPClient.get_shared if self.config.mcp.reuse_connection else MCPClient
+        self.mcp_client = client_factory(
             server_url=self.config.mcp.server_url,
             timeout=self.config.mcp.timeout,
             max_retries=self.config.mcp.max_retries,
+            server_args=self.config.mcp.server_args(),
         )
 
-        await self.mcp_client.connect()
+        await self.mcp_client.ensure_connected()
+
+        # Every browser call rides this one long-lived session; fail here
+        # rather than on the first tool call if it isn't up
+        if not self.mcp_client.is_connected:
+            raise MCPConnectionError(f"No MCP session to {self.mcp_client.server_url}")
 
         self.browser = BrowserController(self.mcp_client)
 
         console.print("[green]✓[/green] MCP connected\n")
 
+    def _show_auth_instructions(self) -> None:
+        """Show the manual login steps."""
+        console.print("\n[bold yellow]🌐 A browser will open to Claude Code[/bold yellow]")
+        console.print("[bold]Please complete the following steps:[/bold]")
+        console.print("  1. Log in to Claude Code if not already logged in")
+        console.print("  2. Wait for the page to fully load")
+        console.print("  3. Press [bold cyan]Enter[/bold cyan] in this terminal when ready\n")
+        console.print(f"[dim](Timeout: {self.config.auth.timeout} seconds)[/dim]\n")
+
     async def _authenticate(self) -> None:
         """Run authentication flow."""
         console.print("[cyan]Starting authentication flow...[/cyan]")
@@ -97,14 +182,6 @@ class Orchestrator:
             check_interval=self.config.auth.check_interval,
         )
 
-        # Show instructions
-        console.print("\n[bold yellow]🌐 Browser opened to Claude Code[/bold yellow]")
-        console.print("[bold]Please complete the following steps:[/bold]")
-        console.print("  1. Log in to Claude Code if not already logged in")
-        console.print("  2. Wait for the page to fully load")
-        console.print("  3. Press [bold cyan]Enter[/bold cyan] in this terminal when ready\n")
-        console.print(f"[dim](Timeout: {self.config.auth.timeout} seconds)[/dim]\n")
-
         status = await self.auth_flow.start(
             headless=self.config.auth.headless,
             wait_for_user_input=True
@@ -120,9 +197,40 @@ class Orchestrator:
             raise RuntimeError(f"Authentication failed: {status}")
 
     async def _execute_tasks(self) -> None:
-        """Execute all tasks in order."""
+        """
+        Execute all tasks, starting each one as soon as its dependencies finish.
+
+        A single dispatcher tracks how many dependencies of each task are
+        still unfinished and starts a worker for a task once that reaches
+        zero, so no pending list is rescanned and only up to
+        ``max_parallel`` task coroutines exist at a time. Tasks whose
+        dependencies failed or were skipped are skipped themselves.
+        """
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
         console.print(f"[cyan]Executing {len(self.task_list)} tasks...[/cyan]\n")
 
+        # Free slots go to the ready task ranked first by execution.schedule_policy
+        if self.config.execution.schedule_policy == "descendants":
+            weight = self.task_list.descendant_counts()
+        else:
+            weight = {}
+        priority = {
+            task.id: (-weight.get(task.id, 0), position)
+            for position, task in enumerate(self.task_list.tasks)
+        }
+
+        # TaskList validation guarantees dependencies exist and form no cycles
+        dependents: Dict[str, List[Task]] = {task.id: [] for task in self.task_list.tasks}
+        remaining = {task.id: len(task.dependencies) for task in self.task_list.tasks}
+        for task in self.task_list.tasks:
+            for dep_id in task.dependencies:
+                dependents[dep_id].append(task)
+        ready: List[Tuple[Tuple[int, int], Task]] = [
+            (priority[task.id], task) for task in self.task_list.tasks if not remaining[task.id]
+        ]
+        heapq.heapify(ready)
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -133,40 +241,85 @@ class Orchestrator:
 
             overall = progress.add_task("[cyan]Overall Progress", total=len(self.task_list))
 
-            for task in self.task_list.tasks:
-                # Check if dependencies are met
-                if not self._dependencies_met(task):
-                    console.print(f"[yellow]Skipping {task.id}: dependencies not met[/yellow]")
-                    task.skip()
-                    progress.advance(overall)
-                    continue
-
-                # Execute task
-                task_progress = progress.add_task(
-                    f"[cyan]Task: {task.name}", total=None
-                )
-
-                try:
-                    await self._execute_task(task)
-                    console.print(f"[green]✓[/green] {task.id}: {task.name}")
+            # One row per concurrency slot, relabelled for each task it runs
+            idle_rows = [
+                progress.add_task("", total=None, visible=False) for _ in range(self.max_parallel)
+            ]
+            workers: Dict[asyncio.Task, Tuple[Task, Any]] = {}
 
-                except Exception as e:
-                    logger.error(f"Task {task.id} failed: {e}")
-                    console.print(f"[red]✗[/red] {task.id}: {task.name} - {e}")
-                    task.fail(str(e))
-
-                progress.remove_task(task_progress)
+            def finish(task: Task) -> None:
                 progress.advance(overall)
+                for dependent in dependents[task.id]:
+                    remaining[dependent.id] -= 1
+                    if not remaining[dependent.id]:
+                        heapq.heappush(ready, (priority[dependent.id], dependent))
+
+            try:
+                while ready or workers:
+                    while ready and len(workers) < self.max_parallel:
+                        _, task = heapq.heappop(ready)
+                        if self._dependencies_blocked(task):
+                            console.print(
+                                f"[yellow]Skipping {task.id}: dependencies not met[/yellow]"
+                            )
+                            task.skip()
+                            finish(task)
+                            continue
+
+                        row = idle_rows.pop()
+                        progress.update(row, description=f"[cyan]Task: {task.name}", visible=True)
+                        workers[asyncio.create_task(self._execute_and_report(task))] = (task, row)
+
+                    if not workers:
+                        continue
+
+                    # Every task finished by now is accounted for before the
+                    # freed slots are handed out, so they go to the best ranked
+                    done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_COMPLETED)
+                    for worker in done:
+                        task, row = workers.pop(worker)
+                        if not worker.cancelled() and worker.exception():
+                            logger.error(f"Task worker for {task.id} crashed: {worker.exception()}")
+                        progress.update(row, visible=False)
+                        idle_rows.append(row)
+                        finish(task)
+            finally:
+                # Don't return while any worker is still unwinding
+                for worker in workers:
+                    worker.cancel()
+                if workers:
+                    await asyncio.wait(workers)
 
         console.print("\n[green]All tasks processed![/green]\n")
 
-    def _dependencies_met(self, task: Task) -> bool:
-        """Check if task dependencies are met."""
-        for dep_id in task.dependencies:
-            dep_task = self.task_list.get_task(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                return False
-        return True
+    async def _execute_and_report(self, task: Task) -> None:
+        """
+        Execute a task that holds a concurrency slot, reporting the outcome.
+
+        Args:
+            task: Task to execute
+        """
+        if self._cancel_event.is_set():
+            console.print(f"[yellow]Skipping {task.id}: execution cancelled[/yellow]")
+            task.skip()
+            return
+
+        try:
+            await self._execute_task(task)
+            console.print(f"[green]✓[/green] {task.id}: {task.name}")
+
+        except Exception as e:
+            logger.error(f"Task {task.id} failed: {e}")
+            console.print(f"[red]✗[/red] {task.id}: {task.name} - {e}")
+            task.fail(str(e))
+
+    def _dependencies_blocked(self, task: Task) -> bool:
+        """Check if any task dependency failed or was skipped."""
+        return any(
+            (dep := self._task_index.get(dep_id)) is None
+            or dep.status in (TaskStatus.FAILED, TaskStatus.SKIPPED)
+            for dep_id in task.dependencies
+        )
 
     async def _execute_task(self, task: Task) -> None:
         """
@@ -176,54 +329,80 @@ class Orchestrator:
             task: Task to execute
 
         Raises:
-            Exception: If task execution fails
+            Exception: If task execution fails; _execute_and_report marks
+                the task failed
         """
         task.start()
         tab_index = None
 
         try:
-            # Step 1: Create a new tab for this task
-            logger.info(f"Creating new tab for task {task.id}")
-            tab_index = await self.browser.create_tab()
-
-            # Step 2: Switch to the new tab
-            await self.browser.switch_tab(tab_index)
-
-            # Step 3: Navigate to Claude Code
-            logger.info(f"Navigating to Claude Code for task {task.id}")
-            await self.browser.navigate("https://claude.ai/code")
-
-            # Wait for page to load
-            await asyncio.sleep(3.0)
-
-            # Step 4: Select repository if specified (fallback to config default)
-            repository = getattr(task, "repository", None) or self.config.default_repository
-            if repository:
-                await self._select_repository(repository)
-
-            # Step 5: Fill and submit the prompt
-            await self._submit_prompt(task.prompt)
-
-            # Step 6: Wait for session URL to update
-            await asyncio.sleep(3.0)
-            current_url = await self.browser.get_current_url()
-            logger.info(f"Task {task.id} session URL: {current_url}")
-
-            # Extract session ID from URL (format: https://claude.ai/code/session_<id>)
-            session_id = self._extract_session_id_from_url(current_url)
-
-            # Step 7: Dismiss notification dialog if present
-            await self.browser.dismiss_notification_dialog()
+            # Steps 1-7 drive the shared browser, so hold the lock until the
+            # prompt is submitted and the session is running on its own
+            async with self._browser_lock:
+                # Steps 1-3: Take a tab from the pool for this task and open
+                # Claude Code; new tabs are opened straight at the app, reused
+                # ones route in-app from a previous session instead of reloading
+                logger.info(f"Opening Claude Code for task {task.id}")
+                tab_index, reused = await self._acquire_tab(_CLAUDE_CODE_URL)
+                if reused and not await self._open_in_app(tab_index, _CLAUDE_CODE_URL):
+                    await self.browser.switch_and_navigate(tab_index, _CLAUDE_CODE_URL)
+
+                # Wait for page to load
+                await self.browser.wait_for_selector(_PAGE_READY_SELECTOR, timeout=3.0)
+
+                # Step 4: Select repository if specified (fallback to config default)
+                repository = task.repository or self.config.default_repository
+                if repository:
+                    await self._select_repository(repository)
+
+                # Step 5: Fill and submit the prompt
+                await self._submit_prompt(task.prompt)
+
+                # Steps 6-7: Wait for session URL to update
+                # (format: https://claude.ai/code/session_<id>) while dismissing
+                # the notification dialog if present; the dialog doesn't
+                # change the URL, so both can overlap
+                current_url = ""
+
+                async def read_session_id() -> Optional[str]:
+                    nonlocal current_url
+                    current_url = await self.browser.get_current_url()
+                    return self._extract_session_id_from_url(current_url)
+
+                session_id, _ = await asyncio.gather(
+                    wait_until(read_session_id, timeout=3.0),
+                    self.browser.dismiss_notification_dialog(),
+                )
+                logger.info(f"Task {task.id} session URL: {current_url}")
 
             # Step 8: Monitor for completion (respect task timeout)
-            timeout = getattr(task, 'timeout', 600)  # Default 10 minutes
+            timeout = task.timeout
             logger.info(f"Waiting for task {task.id} to complete (timeout: {timeout}s)...")
-            await self._wait_for_task_completion(task, tab_index, timeout=timeout)
+            probe = await self._wait_for_task_completion(task, tab_index, timeout=timeout)
+            if self._cancel_event.is_set():
+                raise RuntimeError("Execution cancelled before the task completed")
 
-            # Step 9: Extract branch name from the session
+            # Step 9: Read the final URL; the branch normally comes from the
+            # last completion probe, so page text is only scanned without one
             try:
-                page_text = await self.browser.get_text("body")
-                branch_name = self.browser.extract_branch_name(page_text)
+                branch_name = probe["branch"] if probe else None
+
+                async with self._browser_lock:
+                    await self.browser.switch_tab(tab_index)
+                    try:
+                        current_url = await self.browser.get_current_url() or current_url
+                        session_id = self._extract_session_id_from_url(current_url) or session_id
+                    except Exception as e:
+                        logger.debug(f"Could not read final URL: {e}")
+
+                    if not branch_name:
+                        page_text = await self.browser.get_text(
+                            "main", max_chars=_TEXT_TAIL_CHARS
+                        )
+                        branch_name = self.browser.extract_branch_name(
+                            page_text
+                        ) or self._extract_branch_name_from_page(page_text)
+
                 if not branch_name:
                     # Fallback to constructed name
                     branch_name = f"claude/{task.id}-{session_id[:8] if session_id else 'unknown'}"
@@ -247,15 +426,70 @@ class Orchestrator:
 
             logger.info(f"Task {task.id} completed successfully")
 
-        except Exception as e:
-            logger.error(f"Task {task.id} execution failed: {e}")
-            task.fail(str(e))
+        finally:
+            # The session stays reachable through its recorded URL
+            if tab_index is not None:
+                await self._release_tab(tab_index)
+
+    async def _acquire_tab(self, url: str) -> Tuple[int, bool]:
+        """
+        Take an idle tab from the pool, opening a new one while under the pool size.
+
+        Must be called while holding the browser lock.
+
+        Args:
+            url: URL to open when a new tab is needed; reused tabs are
+                returned as they are
+
+        Returns:
+            Index of the tab to use, and whether it ran an earlier task
+        """
+        if self.tab_reuse_mode == "per_task":
+            return await self.browser.open_new_task_tab(url), False
+
+        if not self._tab_pool.empty() or self._tabs_created >= self.max_parallel:
+            return await self._tab_pool.get(), True
+
+        # Claim the slot before opening so concurrent callers can't overshoot,
+        # and give it back if the tab never opens
+        self._tabs_created += 1
+        try:
+            return await self.browser.open_new_task_tab(url), False
+        except BaseException:
+            self._tabs_created -= 1
             raise
 
-        finally:
-            # Keep the tab open for inspection
-            # User can close tabs manually or we can add config option
-            pass
+    async def _release_tab(self, tab_index: int) -> None:
+        """
+        Return a tab to the pool, leaving its finished session open.
+
+        In "per_task" mode the tab is simply left open.
+
+        Args:
+            tab_index: Index of the tab to release
+        """
+        if self.tab_reuse_mode != "per_task":
+            self._tab_pool.put_nowait(tab_index)
+
+    async def _open_in_app(self, tab_index: int, url: str) -> bool:
+        """
+        Open a URL in a tab by following an in-app link to it.
+
+        Must be called while holding the browser lock.
+
+        Args:
+            tab_index: Index of the tab
+            url: URL to open
+
+        Returns:
+            True if the page routed in place, False if a full navigation is needed
+        """
+        try:
+            await self.browser.switch_tab(tab_index)
+            return await self.browser.follow_link(url)
+        except Exception as e:
+            logger.debug(f"Could not open {url} in-app in tab {tab_index}: {e}")
+            return False
 
     async def _select_repository(self, repository: str) -> None:
         """
@@ -272,7 +506,7 @@ class Orchestrator:
                 await self.browser.click("repository selector button")
             except Exception:
                 await self.browser.click("Select repository button")
-            await asyncio.sleep(2.0)
+            await self.browser.wait_for_selector(_DROPDOWN_SELECTOR, timeout=2.0)
 
             # Parse repository path
             parts = repository.split('/')
@@ -291,7 +525,7 @@ class Orchestrator:
             else:
                 await self.browser.click(f"{repo_name} repository option")
 
-            await asyncio.sleep(1.0)
+            await self.browser.wait_for_selector(_DROPDOWN_SELECTOR, timeout=1.0, state="hidden")
             logger.info(f"Repository {repository} selected")
 
         except Exception as e:
@@ -309,7 +543,7 @@ class Orchestrator:
         try:
             # Fill the message input
             await self.browser.fill("Message input textbox", prompt)
-            await asyncio.sleep(1.0)
+            await self.browser.wait_for_selector(_SUBMIT_READY_SELECTOR, timeout=1.0)
 
             # Click submit button (will be enabled after text is entered)
             await self.browser.click("Submit button")
@@ -330,12 +564,12 @@ class Orchestrator:
             Session ID if found, None otherwise
         """
         # Format: https://claude.ai/code/<session-id>
-        if "/code/" in url:
-            parts = url.split("/code/")
-            if len(parts) > 1:
-                session_id = parts[1].split("?")[0].split("#")[0]
-                return session_id if session_id else None
-        return None
+        _, found, rest = url.partition("/code/")
+        if not found:
+            return None
+        # The ID ends at the next path, query or fragment delimiter
+        session_id = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+        return session_id or None
 
     def _extract_branch_name_from_page(self, page_text: str) -> Optional[str]:
         """
@@ -347,29 +581,23 @@ class Orchestrator:
         Returns:
             Branch name if found, None otherwise
         """
-        # Look for branch patterns like "claude/feature-name"
-        import re
-
-        # Common patterns for branch names in Claude Code UI
-        patterns = [
-            r"branch[:\s]+([a-zA-Z0-9/_-]+)",
-            r"claude/([a-zA-Z0-9/_-]+)",
-        ]
+        # One pass over the page; a labelled branch wins over a bare claude/ one
+        claude_branch = None
+        for match in _BRANCH_RE.finditer(page_text):
+            if match.group("labelled"):
+                return f"claude/{match.group('labelled')}"
+            if claude_branch is None:
+                claude_branch = match.group("claude")
 
-        for pattern in patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                return match.group(1) if "claude/" in pattern else f"claude/{match.group(1)}"
-
-        return None
+        return claude_branch
 
     async def _wait_for_task_completion(
         self,
         task: Task,
         tab_index: int,
         timeout: int = 600,
-        check_interval: float = 10.0,
-    ) -> None:
+        check_interval: float = 1.0,
+    ) -> Optional[Dict[str, Any]]:
         """
         Wait for a task to complete by monitoring the browser tab.
 
@@ -377,85 +605,117 @@ class Orchestrator:
             task: Task being executed
             tab_index: Index of the tab running the task
             timeout: Maximum time to wait in seconds
-            check_interval: How often to check for completion
+            check_interval: Delay after a page change; grows while the page is idle
 
-        Raises:
-            TimeoutError: If task doesn't complete within timeout
+        Returns:
+            The last completion probe, see BrowserController.probe_completion,
+            or None if the page could never be probed
         """
-        import time
-
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        interval = check_interval
+        last_length = None
+        next_log = 30
+        probe = None
 
         logger.info(f"Waiting up to {timeout}s for task {task.id} to complete")
 
-        while time.time() - start_time < timeout:
-            try:
-                # Switch to the task's tab
-                await self.browser.switch_tab(tab_index)
-
-                # Get page snapshot/text to check for completion
-                page_text = await self.browser.get_text("body")
-
-                # Primary indicator: Check if "Create PR" button is enabled
-                if self.browser.is_create_pr_button_enabled(page_text):
-                    logger.info(f"Task {task.id} completed - Create PR button enabled")
-                    return
-
-                # Secondary indicators: Look for branch name pattern
-                if self.browser.extract_branch_name(page_text):
-                    # Also check for other completion signs
-                    completion_keywords = [
-                        "pushed to branch",
-                        "create pr",
-                        "pull request",
-                        "committed",
-                        "merged"
-                    ]
-                    page_text_lower = page_text.lower()
-                    if any(keyword in page_text_lower for keyword in completion_keywords):
-                        logger.info(f"Task {task.id} appears to be complete (branch created)")
-                        return
-
-                # Log progress
-                elapsed = int(time.time() - start_time)
-                if elapsed % 30 == 0:  # Log every 30 seconds
-                    logger.debug(f"Task {task.id} still running ({elapsed}s elapsed)")
-
-                # Wait before next check
-                await asyncio.sleep(check_interval)
-
-            except Exception as e:
-                logger.debug(f"Error checking task completion: {e}")
-                await asyncio.sleep(check_interval)
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    try:
+                        # All completion signals come back from one in-page evaluation
+                        async with self._browser_lock:
+                            await self.browser.switch_tab(tab_index)
+                            probe = await self.browser.probe_completion(
+                                _COMPLETION_SELECTOR,
+                                _BRANCH_SELECTOR,
+                                _COMPLETION_RE.pattern,
+                                tail_chars=_TEXT_TAIL_CHARS,
+                            )
+
+                        if probe["indicator"]:
+                            logger.info(f"Task {task.id} completed - completion indicator present")
+                            return probe
+
+                        # Primary indicator: Check if "Create PR" button is enabled
+                        if probe["pr_enabled"]:
+                            logger.info(f"Task {task.id} completed - Create PR button enabled")
+                            return probe
+
+                        # Secondary indicators: a branch name plus other completion signs
+                        if probe["branch"] and probe["keyword"]:
+                            logger.info(f"Task {task.id} appears to be complete (branch created)")
+                            return probe
+
+                        # Poll quickly while the conversation is moving, back off when idle
+                        if probe["length"] != last_length:
+                            last_length = probe["length"]
+                            interval = check_interval
+                        else:
+                            interval = min(interval * _CHECK_BACKOFF, _MAX_CHECK_INTERVAL)
+
+                        # Log progress
+                        elapsed = loop.time() - start_time
+                        if elapsed >= next_log:
+                            logger.debug(f"Task {task.id} still running ({int(elapsed)}s elapsed)")
+                            next_log = elapsed + 30
+
+                    except Exception as e:
+                        logger.debug(f"Error checking task completion: {e}")
+                        interval = min(interval * _CHECK_BACKOFF, _MAX_CHECK_INTERVAL)
+
+                    # Sleep until the next poll, waking early if execution is cancelled
+                    try:
+                        await asyncio.wait_for(self._cancel_event.wait(), timeout=interval)
+                        logger.info(f"Stopped waiting for task {task.id} - execution cancelled")
+                        return probe
+                    except TimeoutError:
+                        pass
+        except TimeoutError:
+            pass
 
         logger.warning(f"Task {task.id} timed out after {timeout}s")
-        logger.info("Task may still be running - check the browser tab manually")
+        logger.info("Task may still be running - check the Claude session manually")
+        return probe
 
     def _show_summary(self) -> None:
         """Show execution summary."""
-        console.print("[bold cyan]Execution Summary[/bold cyan]\n")
-
-        completed = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.COMPLETED)
-        failed = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.FAILED)
-        skipped = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.SKIPPED)
+        counts = self.task_list.status_counts()
 
-        console.print(f"  Completed: [green]{completed}[/green]")
-        console.print(f"  Failed: [red]{failed}[/red]")
-        console.print(f"  Skipped: [yellow]{skipped}[/yellow]")
+        table = Table.grid(padding=(0, 1))
+        table.add_row("  Completed:", f"[green]{counts[TaskStatus.COMPLETED]}[/green]")
+        table.add_row("  Failed:", f"[red]{counts[TaskStatus.FAILED]}[/red]")
+        table.add_row("  Skipped:", f"[yellow]{counts[TaskStatus.SKIPPED]}[/yellow]")
+        parts = ["[bold cyan]Execution Summary[/bold cyan]\n", table]
 
         # Show branches created
         branches = self.session_manager.get_all_branches()
         if branches:
-            console.print(f"\n[bold]Branches created:[/bold]")
-            for branch in branches:
-                console.print(f"  • {branch}")
+            parts.append("\n[bold]Branches created:[/bold]")
+            parts.append("\n".join(f"  • {branch}" for branch in branches))
+
+        # Render everything in one write rather than a print per line
+        console.print(Group(*parts))
 
     async def _cleanup(self) -> None:
         """Clean up resources."""
+        # browser_close travels over the MCP session, and the session's
+        # transport contexts must be exited by the task that entered them, so
+        # the two steps stay sequential; a hung server just can't stall exit
         if self.browser:
-            await self.browser.close()
-
-        if self.mcp_client and self.mcp_client.is_connected:
+            try:
+                async with asyncio.timeout(_CLEANUP_TIMEOUT):
+                    await self.browser.close()
+            except TimeoutError:
+                logger.warning(f"Browser did not close within {_CLEANUP_TIMEOUT}s")
+
+        # Shared clients stay connected for reuse and are closed on exit
+        if (
+            self.mcp_client
+            and self.mcp_client.is_connected
+            and not self.config.mcp.reuse_connection
+        ):
             await self.mcp_client.disconnect()
 
         console.print("\n[dim]Cleanup complete[/dim]")
@@ -1,12 +1,18 @@
 """
 Parallel orchestrator for concurrent task execution.
-Implements configurable parallel execution with semaphore-based concurrency control.
+Implements configurable parallel execution with a dependency-aware task dispatcher.
 """
 
 import asyncio
+import contextlib
+import heapq
 import logging
-from typing import Optional, List, Dict, Callable, Awaitable, Any
+import re
+import traceback
+from collections import defaultdict, deque
+from typing import Optional, List, Dict, Set, Tuple, Callable, Awaitable, Any
 from datetime import datetime
+from time import monotonic, time_ns
 
 from conductor.mcp.client import MCPClient
 from conductor.mcp.browser import BrowserController
@@ -14,19 +20,64 @@ from conductor.browser.auth import AuthenticationFlow, AuthStatus
 from conductor.browser.session import SessionManager
 from conductor.tasks.models import TaskList, Task, TaskStatus
 from conductor.utils.config import Config
-from conductor.utils.retry import exponential_backoff
+from conductor.utils.retry import exponential_backoff, wait_until
 from conductor.tui.app import ConductorTUI
 
 
 logger = logging.getLogger(__name__)
 
+# Branch names in Claude Code UI: after a "branch:" label, or a bare
+# "claude/..." name, matched in a single scan
+_BRANCH_RE = re.compile(
+    r"branch[:\s]+(?P<labelled>[a-zA-Z0-9/_-]+)|claude/(?P<claude>[a-zA-Z0-9/_-]+)",
+    re.IGNORECASE,
+)
+
+# Seconds to wait for the browser to close on shutdown
+_CLEANUP_TIMEOUT = 10.0
+
+# Authenticated browsers on shared MCP clients, keyed by server URL. The next
+# run in this process reuses them instead of logging in again; they go away
+# with their client in MCPClient.close_shared()
+_WARM_BROWSERS: Dict[str, Tuple[MCPClient, BrowserController]] = {}
+
+# Completion polling backs off by this factor up to the cap (seconds) while
+# the page is idle, and drops back to the initial interval when it changes
+_CHECK_BACKOFF = 1.5
+_MAX_CHECK_INTERVAL = 15.0
+
+# Seconds between TUI repaints while tasks run
+_REPAINT_INTERVAL = 0.1
+
+# Page that starts a new Claude Code session
+_NEW_SESSION_URL = "https://claude.ai/code/new"
+
+# Readiness selectors that replace fixed sleeps while driving the page. Their
+# timeouts match the old sleeps, so a selector that never matches costs no more
+_PAGE_READY_SELECTOR = "textarea, [contenteditable='true']"
+_DROPDOWN_SELECTOR = "[role='menu'], [role='listbox']"
+_SUBMIT_READY_SELECTOR = "button[type='submit']:not([disabled])"
+
+# Element carrying the pushed branch name, in an attribute or as its text
+_BRANCH_SELECTOR = "[data-branch-name], .git-branch-badge"
+
+# Explicit completion indicator checked by the completion probe
+_COMPLETION_SELECTOR = "[data-testid='task-complete'], .completion-indicator"
+
+# Only the tail of the conversation is scanned for completion messages
+_TEXT_TAIL_CHARS = 4096
+
+# Completion phrases, matched case-insensitively without lowercasing the page
+_COMPLETION_KEYWORDS = ("pushed to branch", "create pr", "pull request", "committed", "merged")
+_COMPLETION_RE = re.compile("|".join(_COMPLETION_KEYWORDS), re.IGNORECASE)
+
 
 class ParallelOrchestrator:
     """
     Orchestrates parallel task execution with configurable concurrency.
 
     Features:
-    - Semaphore-based concurrency control
+    - Dispatcher-based concurrency control
     - Configurable max parallel tasks (1-10)
     - Independent browser sessions per task
     - Real-time TUI updates for all running tasks
@@ -48,21 +99,76 @@ class ParallelOrchestrator:
         self.session_manager = SessionManager()
         self.start_time = datetime.now()
 
-        # Concurrency control
+        # Concurrency limit, enforced by the task dispatcher
         self.max_parallel = config.execution.max_parallel_tasks
-        self.semaphore = asyncio.Semaphore(self.max_parallel)
+
+        # Tabs are opened lazily as tasks need them and recycled through the
+        # pool, so a run never holds more tabs than it runs tasks at once
+        self.tab_reuse_mode = config.execution.tab_reuse_mode
+        if self.tab_reuse_mode == "single":
+            self.max_parallel = 1
+        self._tab_pool: asyncio.Queue[int] = asyncio.Queue()
+        self._tabs_created = 0
 
         # Lock browser interactions to prevent tasks from stomping on each other
         self.browser_lock = asyncio.Lock()
 
         # Track running tasks
-        self.running_tasks: Dict[str, Task] = {}
+        self.running_tasks: Set[str] = set()
         self.completed_tasks: List[Task] = []
         self.failed_tasks: List[Task] = []
+        self.skipped_tasks: List[Task] = []
+
+        # Workers only record UI state here; _repaint pushes it to the TUI
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        self._progress_dirty = False
+        self._queue_current: Optional[str] = None
+        self._queue_dirty = False
+        self._browser_preview: Optional[Dict[str, str]] = None
 
         # Single MCP client and browser (shared with all tasks)
         self.mcp_client: Optional[MCPClient] = None
         self.browser: Optional[BrowserController] = None
+        self._authenticated = False
+
+        # Set on shutdown so workers waiting to retry give up immediately
+        self._shutdown = asyncio.Event()
+
+    def cancel(self) -> None:
+        """Stop retrying failed tasks and don't start any more of them."""
+        self._shutdown.set()
+
+    @classmethod
+    async def create_authenticated(
+        cls, config: Config, task_list: TaskList, app: Optional[ConductorTUI] = None
+    ) -> "ParallelOrchestrator":
+        """
+        Create an orchestrator with its MCP connection up and the browser logged in.
+
+        Lets the TUI runner log in from the terminal before the TUI takes it
+        over; run() then goes straight to executing tasks.
+
+        Raises:
+            RuntimeError: If authentication fails
+        """
+        orchestrator = cls(config, task_list, app=app)
+        try:
+            await orchestrator._initialize_mcp()
+            await orchestrator._authenticate()
+        except Exception:
+            # Nothing will run on this connection, so don't leave it open. The
+            # login error is what matters, so a failed or hung close can't hide it
+            if orchestrator.browser:
+                with contextlib.suppress(Exception):
+                    await asyncio.wait_for(orchestrator.browser.close(), _CLEANUP_TIMEOUT)
+            # A shared client stays connected for later runs and closes with
+            # MCPClient.close_shared()
+            client = orchestrator.mcp_client
+            if not config.mcp.reuse_connection and client and client.is_connected:
+                with contextlib.suppress(Exception):
+                    await client.disconnect()
+            raise
+        return orchestrator
 
     async def _run_in_tab(
         self,
@@ -81,6 +187,32 @@ class ParallelOrchestrator:
             await browser.switch_tab(tab_index)
             return await func(*args, **kwargs)
 
+    async def _wait_in_tab(
+        self,
+        browser: BrowserController,
+        tab_index: int,
+        selector: str,
+        timeout: float,
+        state: str = "visible",
+    ) -> bool:
+        """
+        Wait for a selector in a tab without holding the browser lock throughout.
+
+        An in-page wait would keep every other task's browser calls queued
+        behind the lock for its whole duration, so this polls with instant
+        checks instead and takes the lock only for each of them.
+
+        Returns:
+            True if the state was reached, False on timeout
+        """
+
+        async def reached() -> bool:
+            return await self._run_in_tab(
+                browser, tab_index, browser.wait_for_selector, selector, timeout=0, state=state
+            )
+
+        return bool(await wait_until(reached, timeout=timeout))
+
     async def run(self) -> None:
         """Run parallel orchestration."""
         try:
@@ -97,13 +229,7 @@ class ParallelOrchestrator:
                 await self._initialize_mcp()
 
             # Step 2: Authenticate (skip if already authenticated by pre-init)
-            if not self.browser:
-                await self._authenticate()
-            else:
-                if self.app:
-                    self.app.notify(
-                        "Already authenticated!", title="Auth", severity="information"
-                    )
+            await self._authenticate()
 
             # Step 3: Execute tasks in parallel
             await self._execute_tasks_parallel()
@@ -112,10 +238,16 @@ class ParallelOrchestrator:
             self._show_completion()
 
         except KeyboardInterrupt:
+            self.cancel()
             logger.warning("Interrupted by user")
             if self.app:
                 self.app.notify("Interrupted by user", title="Warning", severity="warning")
 
+        except asyncio.CancelledError:
+            # Wake workers waiting to retry before the dispatcher unwinds
+            self.cancel()
+            raise
+
         except Exception as e:
             logger.exception("Parallel orchestration failed")
             if self.app:
@@ -126,29 +258,49 @@ class ParallelOrchestrator:
 
     async def _initialize_mcp(self) -> None:
         """Initialize single MCP connection and browser."""
-        if self.app:
-            self.app.notify("Initializing MCP connection...", title="MCP")
+        self._notify("Initializing MCP connection...", title="MCP")
 
-        self.mcp_client = MCPClient(
+        client_factory = MCPClient.get_shared if self.config.mcp.reuse_connection else MCPClient
+        self.mcp_client = client_factory(
             server_url=self.config.mcp.server_url,
             timeout=self.config.mcp.timeout,
             max_retries=self.config.mcp.max_retries,
+            server_args=self.config.mcp.server_args(),
         )
 
-        await self.mcp_client.connect()
+        # A browser left logged in by an earlier run on this shared client is
+        # still usable as long as the client never disconnected in between
+        warm = (
+            _WARM_BROWSERS.get(self.mcp_client.server_url)
+            if self.config.mcp.reuse_connection
+            else None
+        )
+        if warm and warm[0] is self.mcp_client and self.mcp_client.is_connected:
+            self.browser = warm[1]
+            self._authenticated = True
+            self._notify("Reusing authenticated browser session", title="MCP")
+            return
+
+        await self.mcp_client.ensure_connected()
         self.browser = BrowserController(self.mcp_client)
 
-        if self.app:
-            self.app.notify("MCP connected successfully", title="MCP", severity="information")
+        self._notify("MCP connected successfully", title="MCP", severity="information")
 
     async def _authenticate(self) -> None:
-        """Run authentication flow."""
-        if self.app:
-            self.app.notify(
-                "Browser opening - log in to Claude Code, then press Enter in terminal",
-                title="Authentication",
-                timeout=10,
-            )
+        """Run authentication flow, unless the browser is already logged in."""
+        if self._authenticated:
+            self._notify("Already authenticated!", title="Auth", severity="information")
+            return
+
+        self._notify(
+            "Browser opening - log in to Claude Code, then press Enter in terminal",
+            title="Authentication",
+            timeout=10,
+        )
+
+        # Batched browser calls check the server's tool list first; fetch it
+        # while the user logs in instead of on the first task's critical path
+        tools_prefetch = asyncio.create_task(self.mcp_client.list_tools())
 
         auth_flow = AuthenticationFlow(
             browser=self.browser,
@@ -161,17 +313,30 @@ class ParallelOrchestrator:
             wait_for_user_input=True
         )
 
-        if status == AuthStatus.AUTHENTICATED:
-            if self.app:
-                self.app.notify(
-                    "Authentication successful!", title="Auth", severity="information"
-                )
-        else:
+        if status != AuthStatus.AUTHENTICATED:
+            tools_prefetch.cancel()
             error_msg = f"Authentication failed: {status}"
-            if self.app:
-                self.app.notify(error_msg, title="Auth", severity="error")
+            self._notify(error_msg, title="Auth", severity="error")
             raise RuntimeError(error_msg)
 
+        self._authenticated = True
+        self._notify("Authentication successful!", title="Auth", severity="information")
+
+        try:
+            await tools_prefetch
+        except Exception as e:
+            logger.debug(f"Could not prefetch MCP tools: {e}")
+
+        if self.config.mcp.reuse_connection:
+            _WARM_BROWSERS[self.mcp_client.server_url] = (self.mcp_client, self.browser)
+
+    def _notify(self, message: str, **kwargs: Any) -> None:
+        """Show a notification in the TUI, or print it while there is none yet."""
+        if self.app:
+            self.app.notify(message, **kwargs)
+        else:
+            print(message)
+
     async def _execute_tasks_parallel(self) -> None:
         """Execute tasks in parallel with concurrency control."""
         if self.app:
@@ -180,103 +345,255 @@ class ParallelOrchestrator:
                 title="Execution",
             )
 
-        # Create tasks for all runnable tasks
-        task_coroutines = []
+        # One dispatcher for the whole run: every time a task finishes, start
+        # whatever it unblocked instead of waiting for its siblings
+        dependents, remaining = self._build_dependency_index()
+        priority = self._schedule_priorities()
+
+        # Ready tasks wait here until a slot frees up, so a free slot always
+        # goes to the most important one
+        ready: List[Tuple[int, int, Task]] = [
+            priority[task.id]
+            for task in self.task_list.tasks
+            if task.status == TaskStatus.PENDING and not remaining[task.id]
+        ]
+        heapq.heapify(ready)
+        workers: Dict[asyncio.Task, Task] = {}
+        repaint = asyncio.create_task(self._repaint()) if self.app else None
 
-        for task in self.task_list.tasks:
-            # Only start tasks that have no dependencies or whose dependencies are met
-            if not task.dependencies:
-                task_coroutines.append(self._execute_task_with_semaphore(task))
+        # Bound once, these run for every task that starts or finishes
+        max_parallel = self.max_parallel
+        run_task = self._run_task
+        heappush, heappop = heapq.heappush, heapq.heappop
 
-        # Wait for all initial tasks to complete
-        if task_coroutines:
-            await asyncio.gather(*task_coroutines, return_exceptions=True)
+        shutdown = self._shutdown
 
-        # Process dependent tasks as their dependencies complete
-        await self._process_dependent_tasks()
+        try:
+            while workers or (ready and not shutdown.is_set()):
+                while ready and len(workers) < max_parallel and not shutdown.is_set():
+                    _, _, task = heappop(ready)
+                    workers[asyncio.create_task(run_task(task))] = task
+
+                done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_COMPLETED)
+                for worker in done:
+                    task = workers.pop(worker)
+                    if not worker.cancelled() and worker.exception():
+                        logger.error(f"Task worker for {task.id} crashed: {worker.exception()}")
+
+                    if task.status != TaskStatus.COMPLETED:
+                        self._skip_dependents(task, dependents)
+                        continue
+                    for dependent in dependents[task.id]:
+                        remaining[dependent.id] -= 1
+                        if not remaining[dependent.id] and dependent.status == TaskStatus.PENDING:
+                            heappush(ready, priority[dependent.id])
+        finally:
+            # Like a TaskGroup, don't return while any worker is still unwinding
+            for worker in workers:
+                worker.cancel()
+            if workers:
+                await asyncio.wait(workers)
+            if repaint:
+                repaint.cancel()
+                self._flush_ui()
+
+        # Anything still pending waits on a task that failed or was skipped
+        # before this run started, so it can never be released, or was never
+        # started because the run was cancelled
+        stranded = [t for t in self.task_list.tasks if t.status == TaskStatus.PENDING]
+        if stranded:
+            logger.warning(
+                "Skipping tasks with unfinished dependencies: "
+                + ", ".join(t.id for t in stranded)
+            )
+            for task in stranded:
+                task.skip()
+            self.skipped_tasks.extend(stranded)
 
         if self.app:
             self.app.notify("All tasks processed!", title="Complete", severity="information")
 
-    async def _process_dependent_tasks(self) -> None:
-        """Process tasks that have dependencies."""
-        max_iterations = len(self.task_list) * 2  # Prevent infinite loops
-        iteration = 0
+    def _skip_dependents(self, failed: Task, dependents: Dict[str, List[Task]]) -> None:
+        """
+        Skip every task that depends, directly or transitively, on a failed task.
 
-        while iteration < max_iterations:
-            iteration += 1
+        Args:
+            failed: Task that did not complete
+            dependents: Tasks depending on each task ID
+        """
+        queue = deque((dependent, failed.id) for dependent in dependents[failed.id])
+        while queue:
+            task, cause = queue.popleft()
+            if task.status != TaskStatus.PENDING:
+                continue
 
-            # Find tasks that are now runnable
-            runnable = []
-            for task in self.task_list.tasks:
-                if task.status != TaskStatus.PENDING:
-                    continue
+            logger.warning(f"Skipping {task.id}: dependency {cause} did not complete")
+            task.skip()
+            self.skipped_tasks.append(task)
+            queue.extend((dependent, task.id) for dependent in dependents[task.id])
 
-                # Check if all dependencies are completed
-                deps_met = all(
-                    self.task_list.get_task(dep_id).status == TaskStatus.COMPLETED
-                    for dep_id in task.dependencies
-                )
+        self._queue_dirty = True
 
-                if deps_met:
-                    runnable.append(task)
+    def _report_progress(
+        self,
+        task: Task,
+        progress: float,
+        start_time: float,
+        retries: Optional[int] = None,
+        ramp_to: Optional[float] = None,
+        ramp_seconds: float = 0.0,
+    ) -> None:
+        """
+        Record a task's progress for the next repaint.
 
-            if not runnable:
-                break  # No more runnable tasks
+        Args:
+            task: Task being executed
+            progress: Completion estimate from 0.0 to 1.0
+            start_time: Monotonic time when task execution started
+            retries: Retry count to show; defaults to the task's own count
+            ramp_to: If given, the repaint loop moves progress linearly
+                towards this value over ``ramp_seconds``
+            ramp_seconds: Duration of the ramp in seconds
+        """
+        ramp = None
+        if ramp_to is not None and ramp_seconds > 0:
+            ramp = (monotonic(), ramp_seconds, ramp_to)
+
+        # Re-insert so the most recently updated task is shown
+        self._progress.pop(task.id, None)
+        self._progress[task.id] = {
+            "task": task,
+            "progress": progress,
+            "start_time": start_time,
+            "retries": task.retry_count if retries is None else retries,
+            "ramp": ramp,
+        }
+        self._progress_dirty = True
+
+    def _report_preview(self, url: str, branch: str, preview: str) -> None:
+        """Record the browser preview for the next repaint; the latest one wins."""
+        self._browser_preview = {"url": url, "branch": branch, "preview": preview}
+
+    def _flush_ui(self) -> None:
+        """Push UI state recorded since the last repaint to the TUI."""
+        snapshot = next(reversed(self._progress.values()), None)
+        if snapshot and (self._progress_dirty or snapshot["ramp"]):
+            now = monotonic()
+            progress = snapshot["progress"]
+            if snapshot["ramp"]:
+                began, seconds, target = snapshot["ramp"]
+                progress += (target - progress) * min(1.0, (now - began) / seconds)
+
+            self.app.update_execution(
+                task=snapshot["task"],
+                progress=progress,
+                elapsed=now - snapshot["start_time"],
+                retries=snapshot["retries"],
+            )
+        if self._queue_dirty:
+            # Also refreshes the metrics panel
+            self.app.update_task_queue(current_task_id=self._queue_current)
+        if self._browser_preview:
+            self.app.update_browser(**self._browser_preview)
+            self._browser_preview = None
+        self._progress_dirty = self._queue_dirty = False
+
+    async def _repaint(self) -> None:
+        """Repaint the TUI from recorded state at a fixed rate until cancelled."""
+        while True:
+            self._flush_ui()
+            await asyncio.sleep(_REPAINT_INTERVAL)
+
+    def _build_dependency_index(self) -> Tuple[Dict[str, List[Task]], Dict[str, int]]:
+        """
+        Index the task graph once for the dispatcher.
+
+        Returns:
+            Tasks depending on each task ID, and the number of unfinished
+            dependencies of each task
+        """
+        status = {task.id: task.status for task in self.task_list.tasks}
+        dependents: Dict[str, List[Task]] = defaultdict(list)
+        remaining: Dict[str, int] = {}
+
+        for task in self.task_list.tasks:
+            remaining[task.id] = 0
+            for dep_id in task.dependencies:
+                dependents[dep_id].append(task)
+                if status[dep_id] != TaskStatus.COMPLETED:
+                    remaining[task.id] += 1
 
-            # Execute runnable tasks
-            coroutines = [
-                self._execute_task_with_semaphore(task) for task in runnable
-            ]
-            await asyncio.gather(*coroutines, return_exceptions=True)
+        return dependents, remaining
+
+    def _schedule_priorities(self) -> Dict[str, Tuple[int, int, Task]]:
+        """
+        Rank tasks for dispatch according to ``execution.schedule_policy``.
+
+        With "descendants", tasks that more tasks transitively depend on go
+        first, so long dependency chains start early; "fifo" keeps task file
+        order. Ties are broken by task file order.
+
+        Returns:
+            Heap entry for each task ID; smaller entries are dispatched first
+        """
+        if self.config.execution.schedule_policy == "descendants":
+            weight = self.task_list.descendant_counts()
+        else:
+            weight = {}
+        return {
+            task.id: (-weight.get(task.id, 0), position, task)
+            for position, task in enumerate(self.task_list.tasks)
+        }
 
-    async def _execute_task_with_semaphore(self, task: Task) -> None:
+    async def _run_task(self, task: Task) -> None:
         """
-        Execute a single task with semaphore control.
+        Execute a single task, tracking it while it runs.
+
+        The dispatcher starts at most max_parallel of these at a time.
 
         Args:
             task: Task to execute
         """
-        async with self.semaphore:
-            # Track running task
-            self.running_tasks[task.id] = task
+        # Track running task
+        self.running_tasks.add(task.id)
 
-            # Update TUI
-            if self.app:
-                self.app.update_task_queue(current_task_id=task.id)
+        # Update TUI
+        self._queue_current = task.id
+        self._queue_dirty = True
 
-            try:
-                # Use the shared browser - tasks will time-slice via the browser lock
-                await self._execute_task_with_retry(task, self.browser)
-                self.completed_tasks.append(task)
-
-                if self.app:
-                    self.app.notify(
-                        f"Task {task.id} completed",
-                        title="Success",
-                        severity="information",
-                    )
+        app = self.app
+        try:
+            # Use the shared browser - tasks will time-slice via the browser lock
+            await self._execute_task_with_retry(task, self.browser)
+            self.completed_tasks.append(task)
+
+            if app:
+                app.notify(
+                    f"Task {task.id} completed",
+                    title="Success",
+                    severity="information",
+                )
 
-            except Exception as e:
-                logger.error(f"Task {task.id} failed: {e}")
-                task.fail(str(e))
-                self.failed_tasks.append(task)
-
-                if self.app:
-                    self.app.notify(
-                        f"Task {task.id} failed: {str(e)}",
-                        title="Task Failed",
-                        severity="error",
-                    )
+        except Exception as e:
+            logger.error(f"Task {task.id} failed: {e}")
+            task.fail(str(e))
+            self.failed_tasks.append(task)
+
+            if app:
+                app.notify(
+                    f"Task {task.id} failed: {str(e)}",
+                    title="Task Failed",
+                    severity="error",
+                )
 
-            finally:
-                # Remove from running tasks
-                self.running_tasks.pop(task.id, None)
+        finally:
+            # Remove from running tasks
+            self.running_tasks.discard(task.id)
 
-                # Update TUI
-                if self.app:
-                    self.app.update_task_queue()
-                    self.app.update_metrics()
+            # Update TUI
+            if self._queue_current == task.id:
+                self._queue_current = None
+            self._queue_dirty = True
 
     async def _execute_task_with_retry(self, task: Task, browser: BrowserController) -> None:
         """
@@ -287,19 +604,12 @@ class ParallelOrchestrator:
             browser: Browser to use
         """
         task.start()
-        start_time = datetime.now()
+        start_time = monotonic()
 
         for attempt in range(task.retry_policy.max_attempts):
             try:
                 # Update execution panel
-                if self.app:
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    self.app.update_execution(
-                        task=task,
-                        progress=0.0,
-                        elapsed=elapsed,
-                        retries=attempt,
-                    )
+                self._report_progress(task, 0.0, start_time, retries=attempt)
 
                 # Execute the task
                 await self._execute_single_task(task, browser, start_time)
@@ -328,13 +638,18 @@ class ParallelOrchestrator:
                             timeout=5,
                         )
 
-                    await asyncio.sleep(delay)
+                    try:
+                        await asyncio.wait_for(self._shutdown.wait(), timeout=delay)
+                    except TimeoutError:
+                        continue
+                    logger.info(f"Not retrying {task.id}: shutting down")
+                    raise
                 else:
                     # All retries exhausted
                     raise
 
     async def _execute_single_task(
-        self, task: Task, browser: BrowserController, start_time: datetime
+        self, task: Task, browser: BrowserController, start_time: float
     ) -> None:
         """
         Execute a single task attempt.
@@ -342,37 +657,30 @@ class ParallelOrchestrator:
         Args:
             task: Task to execute
             browser: Browser to use
-            start_time: When execution started
+            start_time: Monotonic time when execution started
         """
         session_id: Optional[str] = None
         tab_index: Optional[int] = None
 
         try:
-            # Step 1: Create tab (serialize creation to avoid race condition)
+            # Step 1: Take a tab and start a new session in it
+            # (serialize tab handling to avoid race conditions); new tabs open
+            # straight at it, reused ones route in-app from their finished
+            # session instead of reloading the whole app
             async with self.browser_lock:
-                logger.info(f"Creating new tab for task {task.id}")
-                tab_index = await browser.create_tab()
+                logger.info(f"Opening a new session for task {task.id}")
+                tab_index, reused = await self._acquire_tab(browser, _NEW_SESSION_URL)
+                if reused and not await self._open_in_app(browser, tab_index, _NEW_SESSION_URL):
+                    await browser.switch_and_navigate(tab_index, _NEW_SESSION_URL)
 
-            # Give Playwright a moment to register the tab
-            await asyncio.sleep(0.5)
-
-            logger.info(f"Switching to tab {tab_index} for task {task.id}")
-            await self._run_in_tab(browser, tab_index, browser.navigate, "https://claude.ai/code/new")
-
-            # Wait for page to load fully before interacting
-            await asyncio.sleep(3.0)
+            # Wait for page to load before interacting
+            await self._wait_in_tab(browser, tab_index, _PAGE_READY_SELECTOR, timeout=3.0)
 
             # Update progress
-            if self.app:
-                self.app.update_execution(
-                    task=task,
-                    progress=0.2,
-                    elapsed=(datetime.now() - start_time).total_seconds(),
-                    retries=task.retry_count,
-                )
+            self._report_progress(task, 0.2, start_time)
 
             # Step 2: Repository selection (per tab)
-            repository = getattr(task, "repository", None) or self.config.default_repository
+            repository = task.repository or self.config.default_repository
             if repository:
                 try:
                     logger.info(f"Selecting repository: {repository}")
@@ -380,7 +688,7 @@ class ParallelOrchestrator:
                         await self._run_in_tab(browser, tab_index, browser.click, "repository selector button")
                     except Exception:
                         await self._run_in_tab(browser, tab_index, browser.click, "Select repository button")
-                    await asyncio.sleep(2.0)
+                    await self._wait_in_tab(browser, tab_index, _DROPDOWN_SELECTOR, timeout=2.0)
 
                     parts = repository.split('/')
                     if len(parts) >= 2:
@@ -400,18 +708,14 @@ class ParallelOrchestrator:
                             f"{repository} repository option",
                         )
 
-                    await asyncio.sleep(1.0)
+                    await self._wait_in_tab(
+                        browser, tab_index, _DROPDOWN_SELECTOR, timeout=1.0, state="hidden"
+                    )
                 except Exception as e:
                     logger.warning(f"Could not select repository: {e}")
 
             # Update progress
-            if self.app:
-                self.app.update_execution(
-                    task=task,
-                    progress=0.3,
-                    elapsed=(datetime.now() - start_time).total_seconds(),
-                    retries=task.retry_count,
-                )
+            self._report_progress(task, 0.3, start_time)
 
             # Step 3: Submit task prompt
             logger.info(f"Submitting task prompt for task {task.id}")
@@ -423,80 +727,66 @@ class ParallelOrchestrator:
                     "Message input textbox",
                     task.prompt,
                 )
-                await asyncio.sleep(1.0)
+                await self._wait_in_tab(browser, tab_index, _SUBMIT_READY_SELECTOR, timeout=1.0)
                 await self._run_in_tab(browser, tab_index, browser.click, "Submit button")
-                await asyncio.sleep(3.0)
-                current_url = await self._run_in_tab(browser, tab_index, browser.get_current_url)
-                session_source = self._normalize_session_url(current_url) or current_url or ""
-                session_id = self._extract_session_id_from_url(session_source)
+
+                # The session URL shows up once the submission is accepted
+                async def read_session_id() -> Optional[str]:
+                    current_url = await self._run_in_tab(
+                        browser, tab_index, browser.get_current_url
+                    )
+                    session_source = self._normalize_session_url(current_url) or current_url or ""
+                    return self._extract_session_id_from_url(session_source)
+
+                session_id = await wait_until(read_session_id, timeout=3.0)
                 await self._run_in_tab(browser, tab_index, browser.dismiss_notification_dialog)
             except Exception as e:
                 logger.warning(f"Could not submit prompt automatically: {e}")
                 raise
 
             # Update progress
-            if self.app:
-                self.app.update_execution(
-                    task=task,
-                    progress=0.4,
-                    elapsed=(datetime.now() - start_time).total_seconds(),
-                    retries=task.retry_count,
-                )
+            self._report_progress(task, 0.4, start_time)
 
             # Step 5: Monitor for completion
             logger.info(f"Waiting for task {task.id} to complete...")
-            await self._wait_for_task_completion(task, browser, tab_index, start_time)
+            probe = await self._wait_for_task_completion(
+                task, browser, tab_index, start_time, timeout=task.timeout
+            )
 
             # Update progress
-            if self.app:
-                self.app.update_execution(
-                    task=task,
-                    progress=0.9,
-                    elapsed=(datetime.now() - start_time).total_seconds(),
-                    retries=task.retry_count,
-                )
+            self._report_progress(task, 0.9, start_time)
 
-            # Step 6: Extract branch name
-            branch_name = f"claude/{task.id.lower()}"
-            try:
-                page_text = await self._run_in_tab(browser, tab_index, browser.get_text, "body")
-                # Use browser's extract_branch_name method which looks for the correct pattern
-                extracted_branch = browser.extract_branch_name(page_text)
-                if extracted_branch:
-                    branch_name = extracted_branch
-                else:
-                    # Fallback: try the old extraction method
-                    extracted_branch = self._extract_branch_name_from_page(page_text)
-                    if extracted_branch:
-                        branch_name = extracted_branch
-            except Exception as e:
-                logger.debug(f"Could not extract branch name: {e}")
+            # Step 6: Extract branch name, normally from the last completion
+            # probe, so page text is only fetched without one
+            branch_name = probe["branch"] if probe else None
+            if not branch_name:
+                try:
+                    page_text = await self._run_in_tab(
+                        browser, tab_index, browser.get_text, "main", max_chars=_TEXT_TAIL_CHARS
+                    )
+                    branch_name = browser.extract_branch_name(
+                        page_text
+                    ) or self._extract_branch_name_from_page(page_text)
+                except Exception as e:
+                    logger.debug(f"Could not extract branch name: {e}")
+            branch_name = branch_name or f"claude/{task.id.lower()}"
 
             # Step 7: Record session
+            # One fallback ID for both records; time_ns keeps concurrent tasks apart
+            session_id = session_id or f"session_{task.id}_{time_ns()}"
             final_url = await self._run_in_tab(browser, tab_index, browser.get_current_url)
             self.session_manager.add_session(
-                session_id=session_id or f"session_{task.id}_{int(datetime.now().timestamp())}",
+                session_id=session_id,
                 task_id=task.id,
                 branch_name=branch_name,
                 url=final_url,
             )
 
-            # Update browser preview
-            if self.app:
-                self.app.update_browser(
-                    url=final_url,
-                    branch=branch_name,
-                    preview=f"Task {task.id} completed",
-                )
-                self.app.update_execution(
-                    task=task,
-                    progress=1.0,
-                    elapsed=(datetime.now() - start_time).total_seconds(),
-                    retries=task.retry_count,
-                )
+            self._report_preview(final_url, branch_name, f"Task {task.id} completed")
+            self._report_progress(task, 1.0, start_time)
 
             task.complete(
-                session_id=session_id or f"session_{task.id}",
+                session_id=session_id,
                 branch_name=branch_name,
             )
 
@@ -504,14 +794,81 @@ class ParallelOrchestrator:
             logger.error(f"Task {task.id} execution failed: {e}")
             raise
 
+        finally:
+            # The session stays reachable through its recorded URL
+            if tab_index is not None:
+                self._release_tab(tab_index)
+
+    async def _acquire_tab(self, browser: BrowserController, url: str) -> Tuple[int, bool]:
+        """
+        Take an idle tab from the pool, opening a new one while under the pool size.
+
+        Must be called while holding the browser lock.
+
+        Args:
+            browser: Browser controller
+            url: URL to open when a new tab is needed; reused tabs are
+                returned as they are
+
+        Returns:
+            Index of the tab to use, and whether it ran an earlier task
+        """
+        if self.tab_reuse_mode == "per_task":
+            return await browser.open_new_task_tab(url), False
+
+        if not self._tab_pool.empty() or self._tabs_created >= self.max_parallel:
+            return await self._tab_pool.get(), True
+
+        # Claim the slot before opening so concurrent callers can't overshoot,
+        # and give it back if the tab never opens
+        self._tabs_created += 1
+        try:
+            return await browser.open_new_task_tab(url), False
+        except BaseException:
+            self._tabs_created -= 1
+            raise
+
+    async def _open_in_app(self, browser: BrowserController, tab_index: int, url: str) -> bool:
+        """
+        Open a URL in a tab by following an in-app link to it.
+
+        Must be called while holding the browser lock.
+
+        Args:
+            browser: Browser controller
+            tab_index: Index of the tab
+            url: URL to open
+
+        Returns:
+            True if the page routed in place, False if a full navigation is needed
+        """
+        try:
+            await browser.switch_tab(tab_index)
+            return await browser.follow_link(url)
+        except Exception as e:
+            logger.debug(f"Could not open {url} in-app in tab {tab_index}: {e}")
+            return False
+
+    def _release_tab(self, tab_index: int) -> None:
+        """
+        Return a tab to the pool, leaving its finished session open.
+
+        In "per_task" mode the tab is simply left open.
+
+        Args:
+            tab_index: Index of the tab to release
+        """
+        if self.tab_reuse_mode != "per_task":
+            self._tab_pool.put_nowait(tab_index)
+
     def _extract_session_id_from_url(self, url: str) -> Optional[str]:
         """Extract session ID from Claude Code URL."""
-        if "/code/" in url:
-            parts = url.split("/code/")
-            if len(parts) > 1:
-                session_id = parts[1].split("?")[0].split("#")[0]
-                return session_id if session_id else None
-        return None
+        _, found, rest = url.partition("/code/")
+        if not found:
+            return None
+        # The ID ends at the next path, query or fragment delimiter
+        session_id = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+        return session_id or None
 
     def _normalize_session_url(self, url: Optional[str]) -> Optional[str]:
         """Clean up the browser-reported URL."""
@@ -523,97 +880,106 @@ class ParallelOrchestrator:
 
     def _extract_branch_name_from_page(self, page_text: str) -> Optional[str]:
         """Extract git branch name from page content."""
-        import re
-
-        patterns = [
-            r"branch[:\s]+([a-zA-Z0-9/_-]+)",
-            r"claude/([a-zA-Z0-9/_-]+)",
-        ]
+        # One pass over the page; a labelled branch wins over a bare claude/ one
+        claude_branch = None
+        for match in _BRANCH_RE.finditer(page_text):
+            if match.group("labelled"):
+                return f"claude/{match.group('labelled')}"
+            if claude_branch is None:
+                claude_branch = match.group("claude")
 
-        for pattern in patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                return match.group(1) if "claude/" in pattern else f"claude/{match.group(1)}"
-
-        return None
+        return claude_branch
 
     async def _wait_for_task_completion(
         self,
         task: Task,
         browser: BrowserController,
         tab_index: int,
-        start_time: datetime,
+        start_time: float,
         timeout: int = 600,
-        check_interval: float = 10.0,
-    ) -> None:
+        check_interval: float = 2.0,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Wait for a task to complete by periodically loading its session.
+        Wait for a task to complete by periodically probing its tab.
 
         Args:
             task: Task being executed
             browser: Browser controller
-            session_url: URL of the Claude session for this task
-            start_time: When task execution started
+            tab_index: Index of the tab running the task
+            start_time: Monotonic time when task execution started
             timeout: Maximum time to wait in seconds
-            check_interval: How often to check for completion
-        """
-        import time
+            check_interval: Delay after a page change; grows while the page is idle
 
-        # Use task-specific timeout if available
-        if hasattr(task, 'timeout'):
-            timeout = task.timeout
-
-        check_start = time.time()
+        Returns:
+            The last completion probe, see BrowserController.probe_completion,
+            or None if the page could never be probed
+        """
+        check_start = monotonic()
+        interval = check_interval
+        last_length = None
+        next_log = 30
         logger.info(f"Waiting up to {timeout}s for task {task.id} to complete")
 
-        while time.time() - check_start < timeout:
+        # Progress from 0.4 to 0.9 based on time elapsed, advanced by the
+        # repaint loop rather than by each poll
+        self._report_progress(task, 0.4, start_time, ramp_to=0.9, ramp_seconds=timeout)
+
+        probe = None
+        while monotonic() - check_start < timeout:
             try:
-                page_text = await self._run_in_tab(browser, tab_index, browser.get_text, "body")
+                # All completion signals come back from one in-page evaluation.
+                # The tab is shared, so this polls rather than waiting in the
+                # page; each poll takes the browser lock, so an idle page is
+                # polled less and less often, and is answered from the
+                # probe's cached summary when it is
+                probe = await self._run_in_tab(
+                    browser,
+                    tab_index,
+                    browser.probe_completion,
+                    _COMPLETION_SELECTOR,
+                    _BRANCH_SELECTOR,
+                    _COMPLETION_RE.pattern,
+                    tail_chars=_TEXT_TAIL_CHARS,
+                )
+
+                if probe["indicator"]:
+                    logger.info(f"Task {task.id} completed - completion indicator present")
+                    return probe
 
                 # Primary indicator: Check if "Create PR" button is enabled
-                if browser.is_create_pr_button_enabled(page_text):
+                if probe["pr_enabled"]:
                     logger.info(f"Task {task.id} completed - Create PR button enabled")
-                    return
-
-                # Secondary indicators: Look for branch name and completion keywords
-                if browser.extract_branch_name(page_text):
-                    completion_keywords = [
-                        "pushed to branch",
-                        "create pr",
-                        "pull request",
-                        "committed",
-                        "merged"
-                    ]
-                    page_text_lower = page_text.lower()
-                    if any(keyword in page_text_lower for keyword in completion_keywords):
-                        logger.info(f"Task {task.id} appears to be complete (branch created)")
-                        return
-
-                # Update progress based on elapsed time
-                if self.app:
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    # Progress from 0.4 to 0.9 based on time elapsed
-                    progress = min(0.9, 0.4 + (0.5 * (time.time() - check_start) / timeout))
-                    self.app.update_execution(
-                        task=task,
-                        progress=progress,
-                        elapsed=elapsed,
-                        retries=task.retry_count,
-                    )
+                    return probe
 
-                # Log progress periodically
-                elapsed_total = int(time.time() - check_start)
-                if elapsed_total % 30 == 0:  # Log every 30 seconds
-                    logger.debug(f"Task {task.id} still running ({elapsed_total}s elapsed)")
+                # Secondary indicators: a branch name plus completion keywords
+                if probe["branch"] and probe["keyword"]:
+                    logger.info(f"Task {task.id} appears to be complete (branch created)")
+                    return probe
 
-                await asyncio.sleep(check_interval)
+                # Poll quickly while the conversation is moving, back off when idle
+                if probe["length"] != last_length:
+                    last_length = probe["length"]
+                    interval = check_interval
+                else:
+                    interval = min(interval * _CHECK_BACKOFF, _MAX_CHECK_INTERVAL)
+
+                # Log progress
+                elapsed = monotonic() - check_start
+                if elapsed >= next_log:
+                    logger.debug(f"Task {task.id} still running ({int(elapsed)}s elapsed)")
+                    next_log = elapsed + 30
 
             except Exception as e:
                 logger.debug(f"Error checking task completion: {e}")
-                await asyncio.sleep(check_interval)
+                interval = min(interval * _CHECK_BACKOFF, _MAX_CHECK_INTERVAL)
+
+            # Never sleep past the deadline
+            remaining = timeout - (monotonic() - check_start)
+            await asyncio.sleep(max(0.0, min(interval, remaining)))
 
         logger.warning(f"Task {task.id} timed out after {timeout}s")
         logger.info("Task may still be running - check the Claude session manually")
+        return probe
 
     def _show_completion(self) -> None:
         """Show completion summary."""
@@ -621,9 +987,7 @@ class ParallelOrchestrator:
 
         completed = len(self.completed_tasks)
         failed = len(self.failed_tasks)
-        skipped = sum(
-            1 for t in self.task_list.tasks if t.status == TaskStatus.SKIPPED
-        )
+        skipped = len(self.skipped_tasks)
 
         summary = (
             f"Parallel Execution Complete!\n\n"
@@ -646,6 +1010,7 @@ class ParallelOrchestrator:
         we should NOT close them as they're managed externally.
         """
         logger.info("Cleaning up parallel orchestrator resources")
+        self._shutdown.set()
 
         # Don't close browser/MCP if they were passed in from outside
         # Check if we initialized them ourselves by seeing if they were None at start
@@ -656,6 +1021,21 @@ class ParallelOrchestrator:
             self.app.notify("Cleanup complete", title="Shutdown")
 
 
+async def close_warm_browsers() -> None:
+    """Close the browsers kept logged in between runs."""
+    warm = list(_WARM_BROWSERS.values())
+    _WARM_BROWSERS.clear()
+
+    for client, browser in warm:
+        if not client.is_connected:
+            continue
+        try:
+            async with asyncio.timeout(_CLEANUP_TIMEOUT):
+                await browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+
+
 async def run_with_tui_parallel(config: Config, task_list: TaskList) -> None:
     """
     Run parallel orchestrator with TUI.
@@ -665,62 +1045,19 @@ async def run_with_tui_parallel(config: Config, task_list: TaskList) -> None:
         config: Configuration
         task_list: Tasks to execute
     """
-    from conductor.tui.app import ConductorTUI
-
     # STEP 1: Do browser authentication BEFORE creating TUI
     # This prevents the TUI from getting stuck waiting for auth callbacks
     logger.info("Initializing MCP and authenticating BEFORE starting TUI...")
-
-    # Initialize single MCP client for all parallel tasks
-    print(f"\n🔧 Initializing browser (will juggle {config.execution.max_parallel_tasks} tasks by hopping between sessions)...")
-
-    mcp_client = MCPClient(
-        server_url=config.mcp.server_url,
-        timeout=config.mcp.timeout,
-        max_retries=config.mcp.max_retries,
+    print(
+        f"\n🔧 Initializing browser (will juggle {config.execution.max_parallel_tasks} tasks "
+        "by hopping between sessions)...\n"
     )
 
-    await mcp_client.connect()
-    browser = BrowserController(mcp_client)
+    # Created without the app, so login prompts go to the terminal
+    orchestrator = await ParallelOrchestrator.create_authenticated(config, task_list)
 
-    print("✅ Browser initialized\n")
-
-    # Run authentication flow
-    print("🔐 Opening browser for authentication...")
-    print("Please log in to Claude Code, then press Enter in this terminal.\n")
-
-    auth_flow = AuthenticationFlow(
-        browser=browser,
-        timeout=config.auth.timeout,
-        check_interval=config.auth.check_interval,
-    )
-
-    status = await auth_flow.start(
-        headless=config.auth.headless,
-        wait_for_user_input=True
-    )
-
-    if status != AuthStatus.AUTHENTICATED:
-        print(f"\n❌ Authentication failed: {status}")
-        await browser.close()
-        await mcp_client.disconnect()
-        raise RuntimeError(f"Authentication failed: {status}")
-
-    print("✅ Authentication successful!\n")
-
-    # STEP 2: Now that we're authenticated, create orchestrator and TUI
-    logger.info("Creating ParallelOrchestrator...")
-    try:
-        # Create orchestrator without the app first
-        orchestrator = ParallelOrchestrator(config, task_list, app=None)
-        orchestrator.mcp_client = mcp_client
-        orchestrator.browser = browser
-        logger.info(f"ParallelOrchestrator created successfully")
-        logger.info(f"  - mcp_client: {orchestrator.mcp_client}")
-        logger.info(f"  - browser: {orchestrator.browser}")
-    except Exception as e:
-        logger.exception("Failed to create ParallelOrchestrator")
-        raise
+    persistent = config.mcp.reuse_connection
+    mcp_client, browser = orchestrator.mcp_client, orchestrator.browser
 
     # Create TUI with orchestrator - TUI will start orchestrator as worker in on_mount()
     logger.info("Creating ConductorTUI with orchestrator...")
@@ -746,19 +1083,27 @@ async def run_with_tui_parallel(config: Config, task_list: TaskList) -> None:
     except Exception as e:
         logger.exception("=== ERROR IN TUI SETUP ===")
         print(f"\n❌ TUI setup failed: {e}\n")
-        import traceback
         traceback.print_exc()
 
     finally:
-        # Clean up browser and MCP connection we created
+        # Clean up browser and MCP connection we created. browser_close
+        # travels over the MCP session, whose transport contexts must be
+        # exited by the task that entered them, so the two steps can't overlap;
+        # a hung server just can't stall exit. A persistent browser stays
+        # logged in for the next run and closes with the shared client
         logger.info("=== CLEANUP STARTED ===")
-        if browser:
+        if persistent:
+            logger.info("Keeping browser session for the next run")
+        elif browser:
             try:
-                await browser.close()
+                async with asyncio.timeout(_CLEANUP_TIMEOUT):
+                    await browser.close()
+            except TimeoutError:
+                logger.warning(f"Browser did not close within {_CLEANUP_TIMEOUT}s")
             except Exception as e:
                 logger.warning(f"Error closing browser: {e}")
 
-        if mcp_client and mcp_client.is_connected:
+        if not persistent and mcp_client and mcp_client.is_connected:
             try:
                 await mcp_client.disconnect()
             except Exception as e:
@@ -4,8 +4,10 @@ TUI-based orchestrator for task execution.
 
 import asyncio
 import logging
-from typing import Optional
+import re
+from typing import Any, Dict, Optional
 from datetime import datetime
+from time import monotonic, time_ns
 from textual import work
 
 from conductor.mcp.client import MCPClient
@@ -14,12 +16,41 @@ from conductor.browser.auth import AuthenticationFlow, AuthStatus
 from conductor.browser.session import SessionManager
 from conductor.tasks.models import TaskList, Task, TaskStatus
 from conductor.utils.config import Config
-from conductor.utils.retry import retry_async, exponential_backoff
+from conductor.utils.retry import retry_async, exponential_backoff, wait_until
 from conductor.tui.app import ConductorTUI
 
 
 logger = logging.getLogger(__name__)
 
+# Branch names in Claude Code UI: after a "branch:" label, or a bare
+# "claude/..." name, matched in a single scan
+_BRANCH_RE = re.compile(
+    r"branch[:\s]+(?P<labelled>[a-zA-Z0-9/_-]+)|claude/(?P<claude>[a-zA-Z0-9/_-]+)",
+    re.IGNORECASE,
+)
+
+# Readiness selectors that replace fixed sleeps while driving the page. Their
+# timeouts match the old sleeps, so a selector that never matches costs no more
+_PAGE_READY_SELECTOR = "textarea, [contenteditable='true']"
+_DROPDOWN_SELECTOR = "[role='menu'], [role='listbox']"
+_SUBMIT_READY_SELECTOR = "button[type='submit']:not([disabled])"
+
+# Completion signals besides the keywords: an explicit indicator and the
+# element carrying the pushed branch name
+_COMPLETION_SELECTOR = "[data-testid='task-complete'], .completion-indicator"
+_BRANCH_SELECTOR = "[data-branch-name], .git-branch-badge"
+
+# Seconds to wait for the browser to close on shutdown
+_CLEANUP_TIMEOUT = 10.0
+
+# Only the tail of the conversation is scanned for branch names and
+# completion messages, which Claude Code writes at the end
+_TEXT_TAIL_CHARS = 4096
+
+# Completion phrases, matched case-insensitively without lowercasing the page
+_COMPLETION_KEYWORDS = ("completed", "finished", "done", "push")
+_COMPLETION_RE = re.compile("|".join(_COMPLETION_KEYWORDS), re.IGNORECASE)
+
 
 class TUIOrchestrator:
     """
@@ -39,6 +70,8 @@ class TUIOrchestrator:
         """
         self.config = config
         self.task_list = task_list
+        # Dependency checks look tasks up by ID; the task list is fixed for a run
+        self._task_index: Dict[str, Task] = {t.id: t for t in task_list.tasks}
         self.app = app
         self.mcp_client: Optional[MCPClient] = None
         self.browser: Optional[BrowserController] = None
@@ -83,13 +116,15 @@ class TUIOrchestrator:
         """Initialize MCP connection."""
         self.app.notify("Initializing MCP connection...", title="MCP")
 
-        self.mcp_client = MCPClient(
+        client_factory = MCPClient.get_shared if self.config.mcp.reuse_connection else MCPClient
+        self.mcp_client = client_factory(
             server_url=self.config.mcp.server_url,
             timeout=self.config.mcp.timeout,
             max_retries=self.config.mcp.max_retries,
+            server_args=self.config.mcp.server_args(),
         )
 
-        await self.mcp_client.connect()
+        await self.mcp_client.ensure_connected()
 
         self.browser = BrowserController(self.mcp_client)
 
@@ -135,7 +170,8 @@ class TUIOrchestrator:
             f"Executing {len(self.task_list)} tasks", title="Execution"
         )
 
-        for task in self.task_list.tasks:
+        # Run dependencies first even if the task file lists them later
+        for task in self.task_list.in_dependency_order():
             # Update task queue display
             self.app.update_task_queue(current_task_id=task.id)
 
@@ -151,7 +187,7 @@ class TUIOrchestrator:
                 continue
 
             # Execute task with retries
-            task_start = datetime.now()
+            task_start = monotonic()
 
             try:
                 await self._execute_task_with_retry(task, task_start)
@@ -178,26 +214,26 @@ class TUIOrchestrator:
 
     def _dependencies_met(self, task: Task) -> bool:
         """Check if task dependencies are met."""
-        for dep_id in task.dependencies:
-            dep_task = self.task_list.get_task(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                return False
-        return True
+        return all(
+            (dep := self._task_index.get(dep_id)) is not None
+            and dep.status == TaskStatus.COMPLETED
+            for dep_id in task.dependencies
+        )
 
-    async def _execute_task_with_retry(self, task: Task, start_time: datetime) -> None:
+    async def _execute_task_with_retry(self, task: Task, start_time: float) -> None:
         """
         Execute a single task with retry logic.
 
         Args:
             task: Task to execute
-            start_time: When task execution started
+            start_time: Monotonic time when task execution started
         """
         task.start()
 
         for attempt in range(task.retry_policy.max_attempts):
             try:
                 # Update execution panel
-                elapsed = (datetime.now() - start_time).total_seconds()
+                elapsed = monotonic() - start_time
                 self.app.update_execution(
                     task=task,
                     progress=0.0,
@@ -236,13 +272,13 @@ class TUIOrchestrator:
                     # All retries exhausted
                     raise
 
-    async def _execute_single_task(self, task: Task, start_time: datetime) -> None:
+    async def _execute_single_task(self, task: Task, start_time: float) -> None:
         """
         Execute a single task attempt in its own browser tab.
 
         Args:
             task: Task to execute
-            start_time: When execution started
+            start_time: Monotonic time when execution started
         """
         tab_index = None
 
@@ -254,13 +290,10 @@ class TUIOrchestrator:
             logger.info(f"Switching to tab {tab_index} for task {task.id}")
             await self.browser.switch_tab(tab_index)
 
-            # Give browser a moment to actually switch tabs
-            await asyncio.sleep(0.5)
-
             self.app.update_execution(
                 task=task,
                 progress=0.1,
-                elapsed=(datetime.now() - start_time).total_seconds(),
+                elapsed=monotonic() - start_time,
                 retries=task.retry_count,
             )
 
@@ -268,17 +301,17 @@ class TUIOrchestrator:
             logger.info(f"Navigating to Claude Code for task {task.id}")
             await self.browser.navigate("https://claude.ai/code")
             logger.info(f"Navigation to Claude Code completed for task {task.id}")
-            await asyncio.sleep(3.0)
+            await self.browser.wait_for_selector(_PAGE_READY_SELECTOR, timeout=3.0)
 
             self.app.update_execution(
                 task=task,
                 progress=0.2,
-                elapsed=(datetime.now() - start_time).total_seconds(),
+                elapsed=monotonic() - start_time,
                 retries=task.retry_count,
             )
 
             # Step 3: Select repository if specified (fallback to config default)
-            repository = getattr(task, "repository", None) or self.config.default_repository
+            repository = task.repository or self.config.default_repository
             if repository:
                 try:
                     logger.info(f"Selecting repository: {repository}")
@@ -286,7 +319,7 @@ class TUIOrchestrator:
                         await self.browser.click("repository selector button")
                     except Exception:
                         await self.browser.click("Select repository button")
-                    await asyncio.sleep(2.0)
+                    await self.browser.wait_for_selector(_DROPDOWN_SELECTOR, timeout=2.0)
 
                     parts = repository.split('/')
                     if len(parts) >= 2:
@@ -296,14 +329,16 @@ class TUIOrchestrator:
                     else:
                         await self.browser.click(f"{repository} repository option")
 
-                    await asyncio.sleep(1.0)
+                    await self.browser.wait_for_selector(
+                        _DROPDOWN_SELECTOR, timeout=1.0, state="hidden"
+                    )
                 except Exception as e:
                     logger.warning(f"Could not select repository: {e}")
 
             self.app.update_execution(
                 task=task,
                 progress=0.3,
-                elapsed=(datetime.now() - start_time).total_seconds(),
+                elapsed=monotonic() - start_time,
                 retries=task.retry_count,
             )
 
@@ -311,16 +346,17 @@ class TUIOrchestrator:
             logger.info(f"Submitting task prompt for task {task.id}")
             try:
                 await self.browser.fill("Message input textbox", task.prompt)
-                await asyncio.sleep(1.0)
+                await self.browser.wait_for_selector(_SUBMIT_READY_SELECTOR, timeout=1.0)
                 await self.browser.click("Submit button")
             except Exception as e:
                 logger.warning(f"Could not submit prompt automatically: {e}")
                 raise
 
             # Step 5: Wait for session URL to update
-            await asyncio.sleep(3.0)
-            current_url = await self.browser.get_current_url()
-            session_id = self._extract_session_id_from_url(current_url)
+            async def read_session_id() -> Optional[str]:
+                return self._extract_session_id_from_url(await self.browser.get_current_url())
+
+            session_id = await wait_until(read_session_id, timeout=3.0)
 
             # Dismiss notification dialog if present
             await self.browser.dismiss_notification_dialog()
@@ -328,35 +364,40 @@ class TUIOrchestrator:
             self.app.update_execution(
                 task=task,
                 progress=0.4,
-                elapsed=(datetime.now() - start_time).total_seconds(),
+                elapsed=monotonic() - start_time,
                 retries=task.retry_count,
             )
 
             # Step 6: Monitor for completion
             logger.info(f"Waiting for task {task.id} to complete...")
-            await self._wait_for_task_completion(task, tab_index, start_time)
+            probe = await self._wait_for_task_completion(
+                task, tab_index, start_time, timeout=task.timeout
+            )
 
             self.app.update_execution(
                 task=task,
                 progress=0.9,
-                elapsed=(datetime.now() - start_time).total_seconds(),
+                elapsed=monotonic() - start_time,
                 retries=task.retry_count,
             )
 
-            # Step 7: Extract branch name
-            branch_name = f"claude/{task.id.lower()}"
-            try:
-                page_text = await self.browser.get_text("body")
-                extracted_branch = self._extract_branch_name_from_page(page_text)
-                if extracted_branch:
-                    branch_name = extracted_branch
-            except Exception as e:
-                logger.debug(f"Could not extract branch name: {e}")
+            # Step 7: Extract branch name, normally from the last completion
+            # probe, so page text is only fetched without one
+            branch_name = probe["branch"] if probe else None
+            if not branch_name:
+                try:
+                    page_text = await self.browser.get_text("main", max_chars=_TEXT_TAIL_CHARS)
+                    branch_name = self._extract_branch_name_from_page(page_text)
+                except Exception as e:
+                    logger.debug(f"Could not extract branch name: {e}")
+            branch_name = branch_name or f"claude/{task.id.lower()}"
 
             # Step 8: Record session
+            # One fallback ID for both records; time_ns keeps concurrent tasks apart
+            session_id = session_id or f"session_{task.id}_{time_ns()}"
             final_url = await self.browser.get_current_url()
             self.session_manager.add_session(
-                session_id=session_id or f"session_{task.id}_{int(datetime.now().timestamp())}",
+                session_id=session_id,
                 task_id=task.id,
                 branch_name=branch_name,
                 url=final_url,
@@ -372,12 +413,12 @@ class TUIOrchestrator:
             self.app.update_execution(
                 task=task,
                 progress=1.0,
-                elapsed=(datetime.now() - start_time).total_seconds(),
+                elapsed=monotonic() - start_time,
                 retries=task.retry_count,
             )
 
             task.complete(
-                session_id=session_id or f"session_{task.id}",
+                session_id=session_id,
                 branch_name=branch_name,
             )
 
@@ -387,100 +428,98 @@ class TUIOrchestrator:
 
     def _extract_session_id_from_url(self, url: str) -> Optional[str]:
         """Extract session ID from Claude Code URL."""
-        if "/code/" in url:
-            parts = url.split("/code/")
-            if len(parts) > 1:
-                session_id = parts[1].split("?")[0].split("#")[0]
-                return session_id if session_id else None
-        return None
+        _, found, rest = url.partition("/code/")
+        if not found:
+            return None
+        # The ID ends at the next path, query or fragment delimiter
+        session_id = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+        return session_id or None
 
     def _extract_branch_name_from_page(self, page_text: str) -> Optional[str]:
         """Extract git branch name from page content."""
-        import re
+        # One pass over the page; a labelled branch wins over a bare claude/ one
+        claude_branch = None
+        for match in _BRANCH_RE.finditer(page_text):
+            if match.group("labelled"):
+                return f"claude/{match.group('labelled')}"
+            if claude_branch is None:
+                claude_branch = match.group("claude")
 
-        patterns = [
-            r"branch[:\s]+([a-zA-Z0-9/_-]+)",
-            r"claude/([a-zA-Z0-9/_-]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                return match.group(1) if "claude/" in pattern else f"claude/{match.group(1)}"
-
-        return None
+        return claude_branch
 
     async def _wait_for_task_completion(
         self,
         task: Task,
         tab_index: int,
-        start_time: datetime,
+        start_time: float,
         timeout: int = 600,
         check_interval: float = 10.0,
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Wait for a task to complete by monitoring the browser tab.
 
         Args:
             task: Task being executed
             tab_index: Index of the tab running the task
-            start_time: When task execution started
+            start_time: Monotonic time when task execution started
             timeout: Maximum time to wait in seconds
-            check_interval: How often to check for completion
-        """
-        import time
+            check_interval: Longest single wait in the page before the
+                progress display is refreshed
 
-        check_start = time.time()
+        Returns:
+            The last completion probe, see BrowserController.probe_completion,
+            or None if the page could never be probed
+        """
+        check_start = monotonic()
+        probe = None
 
-        while time.time() - check_start < timeout:
+        while (waited := monotonic() - check_start) < timeout:
             try:
                 # Switch to the task's tab
                 await self.browser.switch_tab(tab_index)
 
-                # Check for completion indicators
-                page_text = await self.browser.get_text("body")
-
-                completion_indicators = [
-                    "completed",
-                    "finished",
-                    "done",
-                    "push",
-                ]
+                # Only this task's tab is driven, so the wait can sit in the
+                # page and return the moment a completion signal shows up
+                probe = await self.browser.wait_for_completion(
+                    _COMPLETION_SELECTOR,
+                    _BRANCH_SELECTOR,
+                    _COMPLETION_RE.pattern,
+                    timeout=min(check_interval, timeout - waited),
+                    tail_chars=_TEXT_TAIL_CHARS,
+                )
 
-                page_text_lower = page_text.lower()
-                if any(indicator in page_text_lower for indicator in completion_indicators):
+                if probe["indicator"] or probe["pr_enabled"] or probe["keyword"]:
                     logger.info(f"Task {task.id} appears to be complete")
-                    return
+                    return probe
 
-                # Update progress based on elapsed time
-                elapsed = (datetime.now() - start_time).total_seconds()
                 # Progress from 0.4 to 0.9 based on time elapsed
-                progress = min(0.9, 0.4 + (0.5 * (time.time() - check_start) / timeout))
+                now = monotonic()
+                progress = min(0.9, 0.4 + (0.5 * (now - check_start) / timeout))
                 self.app.update_execution(
                     task=task,
                     progress=progress,
-                    elapsed=elapsed,
+                    elapsed=now - start_time,
                     retries=task.retry_count,
                 )
 
-                await asyncio.sleep(check_interval)
-
             except Exception as e:
                 logger.debug(f"Error checking task completion: {e}")
-                await asyncio.sleep(check_interval)
+                # Never sleep past the deadline
+                remaining = timeout - (monotonic() - check_start)
+                await asyncio.sleep(max(0.0, min(check_interval, remaining)))
 
         logger.warning(f"Task {task.id} completion check timed out after {timeout}s")
         logger.info("Task may still be running - check the browser tab manually")
+        return probe
 
     def _show_completion(self) -> None:
         """Show completion summary."""
         total_time = (datetime.now() - self.start_time).total_seconds()
 
-        completed = sum(
-            1 for t in self.task_list.tasks if t.status == TaskStatus.COMPLETED
-        )
-        failed = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.FAILED)
-        skipped = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.SKIPPED)
+        counts = self.task_list.status_counts()
+        completed = counts[TaskStatus.COMPLETED]
+        failed = counts[TaskStatus.FAILED]
+        skipped = counts[TaskStatus.SKIPPED]
 
         summary = (
             f"Execution Complete!\n\n"
@@ -518,13 +557,15 @@ async def run_with_tui(config: Config, task_list: TaskList) -> None:
     logger.info("Initializing MCP and authenticating BEFORE starting TUI...")
 
     # Initialize MCP client
-    mcp_client = MCPClient(
+    client_factory = MCPClient.get_shared if config.mcp.reuse_connection else MCPClient
+    mcp_client = client_factory(
         server_url=config.mcp.server_url,
         timeout=config.mcp.timeout,
         max_retries=config.mcp.max_retries,
+        server_args=config.mcp.server_args(),
     )
 
-    await mcp_client.connect()
+    await mcp_client.ensure_connected()
     browser = BrowserController(mcp_client)
 
     # Run authentication flow
@@ -545,7 +586,8 @@ async def run_with_tui(config: Config, task_list: TaskList) -> None:
     if status != AuthStatus.AUTHENTICATED:
         print(f"\n❌ Authentication failed: {status}")
         await browser.close()
-        await mcp_client.disconnect()
+        if not config.mcp.reuse_connection:
+            await mcp_client.disconnect()
         raise RuntimeError(f"Authentication failed: {status}")
 
     print("✅ Authentication successful!\n")
@@ -568,15 +610,19 @@ async def run_with_tui(config: Config, task_list: TaskList) -> None:
         await app.run_async()
 
     finally:
-        # Clean up browser and MCP connection we created
+        # Clean up browser and MCP connection we created. A shared client
+        # stays connected for later runs and closes with MCPClient.close_shared()
         logger.info("Cleaning up browser and MCP connection")
         if browser:
             try:
-                await browser.close()
+                async with asyncio.timeout(_CLEANUP_TIMEOUT):
+                    await browser.close()
+            except TimeoutError:
+                logger.warning(f"Browser did not close within {_CLEANUP_TIMEOUT}s")
             except Exception as e:
                 logger.warning(f"Error closing browser: {e}")
 
-        if mcp_client and mcp_client.is_connected:
+        if not config.mcp.reuse_connection and mcp_client and mcp_client.is_connected:
             try:
                 await mcp_client.disconnect()
             except Exception as e:
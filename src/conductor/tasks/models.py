@@ -2,9 +2,11 @@
 Task data models using Pydantic for validation.
 """
 
+import heapq
+from collections import Counter, deque
 from enum import Enum
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Callable, Dict, Optional, List
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from datetime import datetime
 
 
@@ -56,6 +58,7 @@ class Task(BaseModel):
         expected_deliverable: Description of what should be produced
         priority: Task priority level
         auto_pr_timeout: Seconds before auto-creating PR
+        timeout: Seconds to wait for the task to complete
         pr_strategy: Strategy for PR creation timing
         retry_policy: Retry configuration
         dependencies: List of task IDs that must complete first
@@ -80,6 +83,7 @@ class Task(BaseModel):
     # Optional configuration
     priority: Priority = Field(default=Priority.MEDIUM)
     auto_pr_timeout: int = Field(default=1800, ge=60, le=7200)
+    timeout: int = Field(default=600, ge=1)
     pr_strategy: PRStrategy = Field(default=PRStrategy.NORMAL)
     retry_policy: RetryPolicy = Field(default_factory=RetryPolicy)
     dependencies: List[str] = Field(default_factory=list)
@@ -96,6 +100,12 @@ class Task(BaseModel):
     error_message: Optional[str] = None
     retry_count: int = Field(default=0, ge=0)
 
+    # Called with the task and its previous status after each transition,
+    # set by the TaskList holding the task
+    _on_status_change: Optional[Callable[["Task", "TaskStatus"], None]] = PrivateAttr(
+        default=None
+    )
+
     @field_validator("id")
     @classmethod
     def validate_id(cls, v: str) -> str:
@@ -132,28 +142,34 @@ class Task(BaseModel):
 
     def start(self) -> None:
         """Mark task as started."""
-        self.status = TaskStatus.RUNNING
         self.started_at = datetime.now()
+        self._set_status(TaskStatus.RUNNING)
 
     def complete(self, session_id: Optional[str] = None, branch_name: Optional[str] = None) -> None:
         """Mark task as completed."""
-        self.status = TaskStatus.COMPLETED
         self.completed_at = datetime.now()
         if session_id:
             self.session_id = session_id
         if branch_name:
             self.branch_name = branch_name
+        self._set_status(TaskStatus.COMPLETED)
 
     def fail(self, error: str) -> None:
         """Mark task as failed."""
-        self.status = TaskStatus.FAILED
         self.completed_at = datetime.now()
         self.error_message = error
+        self._set_status(TaskStatus.FAILED)
 
     def skip(self) -> None:
         """Mark task as skipped."""
-        self.status = TaskStatus.SKIPPED
         self.completed_at = datetime.now()
+        self._set_status(TaskStatus.SKIPPED)
+
+    def _set_status(self, status: TaskStatus) -> None:
+        """Change status, reporting the transition to the owning list."""
+        previous, self.status = self.status, status
+        if self._on_status_change:
+            self._on_status_change(self, previous)
 
     def increment_retry(self) -> None:
         """Increment retry counter."""
@@ -169,6 +185,19 @@ class TaskList(BaseModel):
 
     tasks: List[Task] = Field(default_factory=list)
 
+    # Status tallies and completed run time, kept current by the tasks'
+    # status hooks so metrics don't rescan the list
+    _status_counts: Counter = PrivateAttr(default_factory=Counter)
+    _completed_seconds: float = PrivateAttr(default=0.0)
+
+    # Run time each completed task added, taken back out if it leaves COMPLETED
+    _completed_times: Dict[str, float] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Start tallying the tasks the list was created with."""
+        for task in self.tasks:
+            self._track(task)
+
     @field_validator("tasks")
     @classmethod
     def validate_unique_ids(cls, v: List[Task]) -> List[Task]:
@@ -190,29 +219,27 @@ class TaskList(BaseModel):
                 if dep_id not in task_ids:
                     raise ValueError(f"Task {task.id} depends on non-existent task {dep_id}")
 
-        # Check for circular dependencies using DFS
-        def has_cycle(task_id: str, visited: set, rec_stack: set, dep_map: dict) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-
-            for dep in dep_map.get(task_id, []):
-                if dep not in visited:
-                    if has_cycle(dep, visited, rec_stack, dep_map):
-                        return True
-                elif dep in rec_stack:
-                    return True
-
-            rec_stack.remove(task_id)
-            return False
-
-        dep_map = {task.id: task.dependencies for task in v}
-        visited: set = set()
-        rec_stack: set = set()
-
+        # Check for circular dependencies: resolve tasks whose dependencies
+        # are all resolved until none are left (Kahn's algorithm); anything
+        # never resolved is on a cycle or depends on one
+        remaining = {task.id: len(set(task.dependencies)) for task in v}
+        dependents: dict = {task.id: [] for task in v}
         for task in v:
-            if task.id not in visited:
-                if has_cycle(task.id, visited, rec_stack, dep_map):
-                    raise ValueError(f"Circular dependency detected involving task {task.id}")
+            for dep_id in set(task.dependencies):
+                dependents[dep_id].append(task.id)
+
+        ready = deque(task_id for task_id, count in remaining.items() if not count)
+        while ready:
+            for dependent_id in dependents[ready.popleft()]:
+                remaining[dependent_id] -= 1
+                if not remaining[dependent_id]:
+                    ready.append(dependent_id)
+
+        blocked = [task.id for task in v if remaining[task.id]]
+        if blocked:
+            raise ValueError(
+                f"Circular dependency detected involving tasks: {', '.join(blocked)}"
+            )
 
         return v
 
@@ -229,6 +256,9 @@ class TaskList(BaseModel):
 
     def get_runnable_tasks(self) -> List[Task]:
         """Get tasks that can be run (pending with all dependencies met)."""
+        # Resolve dependency statuses from one map instead of a lookup per dependency
+        status = {task.id: task.status for task in self.tasks}
+
         runnable = []
         for task in self.tasks:
             if task.status != TaskStatus.PENDING:
@@ -236,8 +266,7 @@ class TaskList(BaseModel):
 
             # Check if all dependencies are completed
             deps_met = all(
-                self.get_task(dep_id).status == TaskStatus.COMPLETED if self.get_task(dep_id) else False
-                for dep_id in task.dependencies
+                status.get(dep_id) == TaskStatus.COMPLETED for dep_id in task.dependencies
             )
 
             if deps_met:
@@ -245,9 +274,89 @@ class TaskList(BaseModel):
 
         return runnable
 
+    def in_dependency_order(self) -> List[Task]:
+        """
+        Get all tasks ordered so every task comes after its dependencies.
+
+        Tasks keep their file order wherever their dependencies allow it.
+        """
+        position = {task.id: index for index, task in enumerate(self.tasks)}
+        remaining = {task.id: len(set(task.dependencies)) for task in self.tasks}
+        dependents: dict = {task.id: [] for task in self.tasks}
+        for task in self.tasks:
+            for dep_id in set(task.dependencies):
+                dependents[dep_id].append(task)
+
+        ready = [index for index, task in enumerate(self.tasks) if not remaining[task.id]]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            task = self.tasks[heapq.heappop(ready)]
+            ordered.append(task)
+            for dependent in dependents[task.id]:
+                remaining[dependent.id] -= 1
+                if not remaining[dependent.id]:
+                    heapq.heappush(ready, position[dependent.id])
+
+        return ordered
+
+    def descendant_counts(self) -> Dict[str, int]:
+        """Count the tasks depending on each task, directly or transitively."""
+        dependents: dict = {task.id: [] for task in self.tasks}
+        for task in self.tasks:
+            for dep_id in set(task.dependencies):
+                dependents[dep_id].append(task.id)
+
+        # Dependents come later in dependency order, so walking it backwards
+        # has every dependent's descendants ready before they're needed
+        descendants: Dict[str, set] = {}
+        for task in reversed(self.in_dependency_order()):
+            found = set()
+            for dependent_id in dependents[task.id]:
+                found.add(dependent_id)
+                found |= descendants[dependent_id]
+            descendants[task.id] = found
+
+        return {task_id: len(found) for task_id, found in descendants.items()}
+
+    def status_counts(self) -> Counter:
+        """Count tasks by status."""
+        return Counter(self._status_counts)
+
+    def completed_seconds(self) -> float:
+        """Total run time of the completed tasks, in seconds."""
+        return self._completed_seconds
+
     def add_task(self, task: Task) -> None:
         """Add a task to the list."""
         self.tasks.append(task)
+        self._track(task)
+
+    def _track(self, task: Task) -> None:
+        """Count a task and follow its status changes."""
+        self._status_counts[task.status] += 1
+        if task.status == TaskStatus.COMPLETED:
+            self._add_completed_time(task)
+        task._on_status_change = self._status_changed
+
+    def _status_changed(self, task: Task, previous: TaskStatus) -> None:
+        """Move a task between status tallies."""
+        if previous == task.status:
+            return
+
+        self._status_counts[previous] -= 1
+        self._status_counts[task.status] += 1
+        if previous == TaskStatus.COMPLETED:
+            self._completed_seconds -= self._completed_times.pop(task.id, 0.0)
+        if task.status == TaskStatus.COMPLETED:
+            self._add_completed_time(task)
+
+    def _add_completed_time(self, task: Task) -> None:
+        """Add a completed task's run time to the total."""
+        if task.started_at and task.completed_at:
+            seconds = (task.completed_at - task.started_at).total_seconds()
+            self._completed_times[task.id] = seconds
+            self._completed_seconds += seconds
 
     def __len__(self) -> int:
         return len(self.tasks)
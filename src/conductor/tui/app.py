@@ -2,6 +2,10 @@
 Main Textual TUI application for Conductor.
 """
 
+import asyncio
+import logging
+import traceback
+
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static, Label
@@ -16,6 +20,8 @@ from datetime import datetime
 
 from conductor.tasks.models import Task, TaskStatus, TaskList
 
+logger = logging.getLogger(__name__)
+
 
 class TaskQueuePanel(Static):
     """Panel showing the task queue."""
@@ -349,8 +355,6 @@ class ConductorTUI(App):
 
     def compose(self) -> ComposeResult:
         """Create the TUI layout."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("=== TUI compose() CALLED ===")
 
         yield Header(show_clock=True)
@@ -375,8 +379,6 @@ class ConductorTUI(App):
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("=== TUI on_mount() CALLED ===")
 
         # Initialize metrics
@@ -393,16 +395,12 @@ class ConductorTUI(App):
 
     def _start_orchestrator(self) -> None:
         """Start the orchestrator worker after app is fully initialized."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("=== _start_orchestrator() called ===")
         logger.info(f"Starting worker for orchestrator: {self.orchestrator}")
         self.run_worker(self._run_orchestrator(), exclusive=False, name="orchestrator")
 
     async def _run_orchestrator(self):
         """Run the orchestrator and handle completion."""
-        import logging
-        logger = logging.getLogger(__name__)
 
         try:
             logger.info("=== WORKER: Starting orchestrator.run() ===")
@@ -410,7 +408,6 @@ class ConductorTUI(App):
             logger.info("=== WORKER: Orchestrator completed successfully ===")
 
             # Keep app alive for a few seconds after completion
-            import asyncio
             logger.info("Keeping app alive for 5 seconds...")
             await asyncio.sleep(5)
 
@@ -420,10 +417,8 @@ class ConductorTUI(App):
         except Exception as e:
             logger.exception("=== WORKER: Orchestrator failed ===")
             self.notify(f"Orchestrator failed: {e}", title="Error", severity="error", timeout=10)
-            import traceback
             traceback.print_exc()
             # Keep app alive for 10 seconds to show error
-            import asyncio
             await asyncio.sleep(10)
             self.exit()
 
@@ -432,22 +427,16 @@ class ConductorTUI(App):
         if not self.metrics_panel:
             return
 
-        completed = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.COMPLETED)
-        failed = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.FAILED)
-        skipped = sum(1 for t in self.task_list.tasks if t.status == TaskStatus.SKIPPED)
-
-        # Calculate average time
-        completed_tasks = [t for t in self.task_list.tasks if t.status == TaskStatus.COMPLETED]
-        avg_time = 0.0
-        total_time = 0.0
+        # The task list keeps these tallies as tasks change status
+        counts = self.task_list.status_counts()
+        total_time = self.task_list.completed_seconds()
 
-        if completed_tasks:
-            for task in completed_tasks:
-                if task.started_at and task.completed_at:
-                    duration = (task.completed_at - task.started_at).total_seconds()
-                    total_time += duration
+        completed = counts[TaskStatus.COMPLETED]
+        failed = counts[TaskStatus.FAILED]
+        skipped = counts[TaskStatus.SKIPPED]
 
-            avg_time = total_time / len(completed_tasks) if completed_tasks else 0.0
+        # Calculate average time
+        avg_time = total_time / completed if completed else 0.0
 
         self.metrics_panel.update_metrics(
             total=len(self.task_list),
@@ -499,8 +488,20 @@ class ConductorTUI(App):
 
     def action_abort(self):
         """Abort execution."""
+        self._cancel_orchestrator()
         self.notify("Aborting execution...", title="Abort", severity="error")
 
+    async def action_quit(self) -> None:
+        """Stop the orchestrator, then quit."""
+        self._cancel_orchestrator()
+        await super().action_quit()
+
+    def _cancel_orchestrator(self) -> None:
+        """Tell the orchestrator to stop starting and retrying tasks, if it can."""
+        cancel = getattr(self.orchestrator, "cancel", None)
+        if cancel:
+            cancel()
+
     def action_help(self):
         """Show help."""
         help_text = """
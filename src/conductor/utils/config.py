@@ -4,7 +4,7 @@ Configuration management for Conductor.
 
 import yaml
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 from pydantic import BaseModel, Field
 
 
@@ -14,6 +14,23 @@ class MCPConfig(BaseModel):
     server_url: str = Field(default="stdio://playwright-mcp")
     timeout: float = Field(default=30.0, ge=1.0)
     max_retries: int = Field(default=3, ge=1, le=10)
+    reuse_connection: bool = Field(
+        default=True,
+        description="Keep the MCP connection and logged-in browser open across orchestrator runs",
+    )
+    user_data_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Browser profile directory for a stdio Playwright MCP server, "
+            "so the Claude login is kept between conductor processes"
+        ),
+    )
+
+    def server_args(self) -> List[str]:
+        """Command line arguments for a stdio MCP server."""
+        if not self.user_data_dir:
+            return []
+        return ["--user-data-dir", str(Path(self.user_data_dir).expanduser())]
 
 
 class AuthConfig(BaseModel):
@@ -55,6 +72,20 @@ class ExecutionConfig(BaseModel):
     parallel_mode: bool = Field(
         default=False, description="Enable parallel task execution"
     )
+    tab_reuse_mode: Literal["per_task", "pooled", "single"] = Field(
+        default="pooled",
+        description=(
+            "How browser tabs are shared between tasks: a new tab per task, "
+            "a pool of one tab per parallel task, or a single tab for all tasks"
+        ),
+    )
+    schedule_policy: Literal["fifo", "descendants"] = Field(
+        default="descendants",
+        description=(
+            "Order in which runnable tasks take free slots: task file order, or "
+            "tasks with the most dependent tasks first"
+        ),
+    )
 
 
 class Config(BaseModel):
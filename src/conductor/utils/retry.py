@@ -1,11 +1,11 @@
 """
-Retry logic with exponential backoff and jitter.
+Retry logic with exponential backoff and jitter, and condition polling.
 """
 
 import random
 import asyncio
 import logging
-from typing import TypeVar, Callable, Any, Optional
+from typing import TypeVar, Callable, Any, Awaitable, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -112,3 +112,33 @@ async def retry_async(
         raise last_exception
 
     raise RuntimeError("Retry logic error: no exception but no success")
+
+
+async def wait_until(
+    predicate: Callable[[], Awaitable[T]],
+    timeout: float = 5.0,
+    interval: float = 0.15,
+) -> Optional[T]:
+    """
+    Poll an async predicate until it returns a truthy value.
+
+    Args:
+        predicate: Coroutine function to poll
+        timeout: Maximum time to wait in seconds
+        interval: Delay between polls in seconds
+
+    Returns:
+        The first truthy result, or None if the timeout elapsed
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while True:
+        result = await predicate()
+        if result:
+            return result
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(interval, remaining))
@@ -0,0 +1,45 @@
+"""
+Shared helpers and fixtures for the orchestrator tests.
+"""
+
+import pytest
+
+from conductor.tasks.models import Task
+from conductor.utils.config import Config
+
+
+def make_task(task_id: str, dependencies=None) -> Task:
+    """Create a minimal task for scheduling tests."""
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        prompt="Do something",
+        expected_deliverable="Something",
+        dependencies=dependencies or [],
+    )
+
+
+class TabBrowser:
+    """Browser stand-in that tracks tab creation."""
+
+    def __init__(self):
+        self.created = 0
+
+    async def open_new_task_tab(self, url: str) -> int:
+        self.created += 1
+        return self.created
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep the session log out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+
+@pytest.fixture
+def parallel_config():
+    """Configuration allowing three concurrent tasks."""
+    config = Config()
+    config.execution.parallel_mode = True
+    config.execution.max_parallel_tasks = 3
+    return config
@@ -0,0 +1,49 @@
+"""
+Tests for the authentication flow that don't need a live browser.
+"""
+
+from conductor.browser.auth import AuthenticationFlow, AuthStatus
+
+
+class LoginBrowser:
+    """Browser stand-in that is either already logged in or not."""
+
+    def __init__(self, logged_in: bool):
+        self.logged_in = logged_in
+        self.is_launched = False
+        self.waits = []
+
+    async def launch_browser(self, headless=False, url="about:blank"):
+        self.is_launched = True
+
+    async def wait_for_selector(self, selector, timeout=30.0, state="visible"):
+        self.waits.append(selector)
+        return self.logged_in
+
+
+async def test_existing_login_skips_user_prompt(monkeypatch):
+    """Test that a browser that is still logged in isn't asked to log in again."""
+    flow = AuthenticationFlow(LoginBrowser(logged_in=True))
+
+    async def prompt():
+        raise AssertionError("user was prompted")
+
+    monkeypatch.setattr(flow, "_wait_for_user_confirmation", prompt)
+
+    assert await flow.start() == AuthStatus.AUTHENTICATED
+    assert flow.browser.waits == [", ".join(AuthenticationFlow.LOGIN_SUCCESS_SELECTORS)]
+
+
+async def test_missing_login_prompts_user(monkeypatch):
+    """Test that the user is asked to log in when no session is visible."""
+    flow = AuthenticationFlow(LoginBrowser(logged_in=False))
+    prompts = []
+
+    async def prompt():
+        prompts.append(flow.status)
+        return True
+
+    monkeypatch.setattr(flow, "_wait_for_user_confirmation", prompt)
+
+    assert await flow.start() == AuthStatus.AUTHENTICATED
+    assert prompts == [AuthStatus.WAITING_FOR_USER]
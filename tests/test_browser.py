@@ -0,0 +1,208 @@
+"""
+Tests for the MCP browser controller that don't need a live browser.
+"""
+
+import json
+
+import pytest
+
+from conductor.mcp.browser import BrowserController
+
+
+class FakeClient:
+    """MCP client stand-in that returns a fixed tool result."""
+
+    def __init__(self, text: str = "", error: Exception = None):
+        self.text = text
+        self.error = error
+        self.calls = []
+
+    async def call_tool(self, name, arguments=None):
+        self.calls.append((name, arguments or {}))
+        if self.error:
+            raise self.error
+        return {"content": [{"type": "text", "text": self.text}]}
+
+    async def batch_call_tool(self, calls):
+        return [await self.call_tool(call["tool"], call.get("arguments")) for call in calls]
+
+
+async def test_wait_for_selector_single_evaluate():
+    """Test that waiting is done in-page with one evaluate call."""
+    client = FakeClient(text="### Result\ntrue")
+    browser = BrowserController(client)
+
+    assert await browser.wait_for_selector("textarea", timeout=2.5) is True
+
+    assert len(client.calls) == 1
+    name, arguments = client.calls[0]
+    assert name == "browser_evaluate"
+    assert '"textarea"' in arguments["function"]
+    assert "2500" in arguments["function"]
+
+
+async def test_wait_for_selector_reports_timeout_and_errors():
+    """Test that a timeout or failed evaluation returns False."""
+    assert await BrowserController(FakeClient(text="false")).wait_for_selector("div") is False
+    assert (
+        await BrowserController(FakeClient(error=RuntimeError("gone"))).wait_for_selector("div")
+        is False
+    )
+
+
+async def test_wait_for_selector_rejects_unknown_state():
+    """Test that unsupported states are rejected."""
+    with pytest.raises(ValueError):
+        await BrowserController(FakeClient()).wait_for_selector("div", state="enabled")
+
+
+async def test_switch_tab_reselects_after_external_tab_change():
+    """Test that switching back to a tab selects it again after it lost focus."""
+    client = FakeClient()
+    browser = BrowserController(client)
+
+    await browser.switch_tab(1)
+    # Another tab is selected in the browser window, out of the controller's sight
+    await browser.switch_tab(1)
+
+    assert [(name, args) for name, args in client.calls] == [
+        ("browser_tabs", {"action": "select", "index": 1}),
+        ("browser_tabs", {"action": "select", "index": 1}),
+    ]
+
+
+async def test_get_text_tail_decodes_result():
+    """Test that the text tail is decoded from the MCP evaluation result."""
+    tail = 'Pushed to branch "claude/fix-login"\nDone'
+    client = FakeClient(
+        text="### Result\n"
+        + json.dumps(tail)
+        + "\n\n### Ran Playwright code\n```js\nawait page.evaluate('() => ...');\n```"
+    )
+    browser = BrowserController(client)
+
+    assert await browser.get_text("main", max_chars=4096) == tail
+    assert ".slice(-4096)" in client.calls[0][1]["function"]
+
+    client.text = "### Result\nnull"
+    assert await browser.get_text("main", max_chars=10) == ""
+
+
+async def test_probe_completion_decodes_summary():
+    """Test that the completion probe is decoded from one evaluation."""
+    summary = (
+        '{"indicator":false,"pr_enabled":true,"branch":"claude/a-1",'
+        '"keyword":true,"length":42}'
+    )
+    client = FakeClient(text="### Result\n" + json.dumps(summary))
+    browser = BrowserController(client)
+
+    probe = await browser.probe_completion(".done", ".badge", "pushed to branch")
+
+    assert probe == {
+        "indicator": False,
+        "pr_enabled": True,
+        "branch": "claude/a-1",
+        "keyword": True,
+        "length": 42,
+    }
+    assert len(client.calls) == 1
+    function = client.calls[0][1]["function"]
+    assert "MutationObserver" in function
+    assert "toLowerCase" not in function
+
+
+async def test_wait_for_completion_waits_in_page():
+    """Test that the completion wait is one evaluation bounded by the timeout."""
+    summary = '{"indicator":false,"pr_enabled":false,"branch":null,"keyword":true,"length":7}'
+    client = FakeClient(text="### Result\n" + json.dumps(summary))
+    browser = BrowserController(client)
+
+    probe = await browser.wait_for_completion(".done", ".badge", "pushed", timeout=2.5)
+
+    assert probe["keyword"] is True
+    assert probe["branch"] is None
+    assert len(client.calls) == 1
+    assert "2500" in client.calls[0][1]["function"]
+
+
+async def test_follow_link_reports_whether_a_link_was_clicked():
+    """Test that following a link compares URLs without a trailing slash."""
+    client = FakeClient(text="true")
+    browser = BrowserController(client)
+
+    assert await browser.follow_link("https://claude.ai/code/") is True
+    assert '"https://claude.ai/code"' in client.calls[0][1]["function"]
+
+    client.text = "false"
+    assert await browser.follow_link("https://claude.ai/code") is False
+
+
+async def test_open_new_task_tab_creates_and_navigates_in_one_batch():
+    """Test that a new tab is opened at the URL without a separate select."""
+    client = FakeClient(text="Created tab index: 2")
+    browser = BrowserController(client)
+
+    assert await browser.open_new_task_tab("https://claude.ai/code") == 2
+    assert [(name, args.get("action")) for name, args in client.calls] == [
+        ("browser_tabs", "new"),
+        ("browser_navigate", None),
+    ]
+
+
+class TabClient(FakeClient):
+    """Client whose navigation fails, with a scripted tab list."""
+
+    def __init__(self, tab_list: str):
+        super().__init__()
+        self.tab_list = tab_list
+        self.navigations = 0
+
+    async def call_tool(self, name, arguments=None):
+        self.calls.append((name, arguments or {}))
+        if name == "browser_tabs" and arguments["action"] == "list":
+            return {"content": [{"type": "text", "text": self.tab_list}]}
+        if name == "browser_tabs" and arguments["action"] == "new":
+            return {"content": [{"type": "text", "text": "Created tab index: 2"}]}
+        if name == "browser_navigate":
+            self.navigations += 1
+            if self.navigations == 1:
+                raise RuntimeError("navigation timed out")
+        return {"content": []}
+
+
+async def test_open_new_task_tab_reuses_tab_opened_before_failure():
+    """Test that a tab opened before a failure is navigated rather than opening another."""
+    client = TabClient(
+        "### Open tabs\n- 0: [Claude Code] (https://claude.ai/code/session_1)\n"
+        "- 1: (current) [] (about:blank)"
+    )
+    browser = BrowserController(client)
+
+    assert await browser.open_new_task_tab("https://claude.ai/code") == 1
+    actions = [args.get("action") for name, args in client.calls if name == "browser_tabs"]
+    assert actions == ["new", "list", "select"]
+
+
+async def test_open_new_task_tab_opens_tab_when_none_was_opened():
+    """Test that a new tab is still opened if the failed attempt didn't open one."""
+    client = TabClient(
+        "### Open tabs\n- 0: [Claude Code] (https://claude.ai/code/session_1)\n"
+        "- 1: (current) [Claude Code] (https://claude.ai/code/session_2)"
+    )
+    browser = BrowserController(client)
+
+    assert await browser.open_new_task_tab("https://claude.ai/code") == 2
+    actions = [args.get("action") for name, args in client.calls if name == "browser_tabs"]
+    assert actions == ["new", "list", "new", "select"]
+
+
+async def test_launch_browser_opens_requested_page():
+    """Test that the browser can be launched straight onto a page."""
+    client = FakeClient()
+    browser = BrowserController(client)
+
+    await browser.launch_browser(url="https://claude.ai/code")
+
+    assert client.calls == [("browser_navigate", {"url": "https://claude.ai/code"})]
+    assert browser.is_launched
@@ -0,0 +1,225 @@
+"""
+Tests for MCP client behaviour that doesn't need a live server.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from conductor.mcp.client import MCPClient, MCPConnectionError, MCPError
+from conductor.utils.config import MCPConfig
+
+
+class FakeSession:
+    """Stand-in for an MCP ClientSession."""
+
+    def __init__(self, tools=None):
+        self.tools = tools or [
+            SimpleNamespace(name="browser_navigate", description="Navigate", inputSchema={}),
+            SimpleNamespace(name="browser_click", description="Click", inputSchema={}),
+        ]
+        self.list_calls = 0
+
+    async def list_tools(self):
+        self.list_calls += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(tools=self.tools)
+
+
+@pytest.fixture
+def connected_client():
+    """An MCP client wired to a fake session."""
+    client = MCPClient()
+    client._session = FakeSession()
+    client._connected = True
+    return client
+
+
+async def test_list_tools_requires_connection():
+    """Test that listing tools fails when not connected."""
+    client = MCPClient()
+
+    with pytest.raises(MCPError):
+        await client.list_tools()
+
+
+async def test_list_tools_is_cached(connected_client):
+    """Test that repeated list_tools calls reuse the cached result."""
+    first = await connected_client.list_tools()
+    second = await connected_client.list_tools()
+
+    assert [t["name"] for t in first] == ["browser_navigate", "browser_click"]
+    assert second == first
+    assert connected_client._session.list_calls == 1
+
+
+async def test_list_tools_concurrent_callers_share_request(connected_client):
+    """Test that concurrent callers coalesce onto one server request."""
+    results = await asyncio.gather(*(connected_client.list_tools() for _ in range(5)))
+
+    assert all(r == results[0] for r in results)
+    assert connected_client._session.list_calls == 1
+
+
+async def test_list_tools_cache_expires():
+    """Test that the cache is refreshed once the TTL elapses."""
+    client = MCPClient(tools_cache_ttl=0.0)
+    client._session = FakeSession()
+    client._connected = True
+
+    await client.list_tools()
+    await client.list_tools()
+
+    assert client._session.list_calls == 2
+
+
+class RecordingSession(FakeSession):
+    """Fake session that records tool calls."""
+
+    def __init__(self, tools=None):
+        super().__init__(tools)
+        self.calls = []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        return SimpleNamespace(content=[])
+
+
+async def test_batch_call_tool_uses_server_batching():
+    """Test that calls are aggregated when the server offers batch_execute."""
+    schema = {"properties": {"operations": {"type": "array"}, "stopOnError": {}}}
+    client = MCPClient()
+    client._session = RecordingSession(
+        tools=[SimpleNamespace(name="batch_execute", description="", inputSchema=schema)]
+    )
+    client._connected = True
+
+    results = await client.batch_call_tool(
+        [
+            {"tool": "browser_navigate", "arguments": {"url": "about:blank"}},
+            {"tool": "browser_close"},
+        ]
+    )
+
+    assert len(results) == 1
+    name, arguments = client._session.calls[0]
+    assert name == "batch_execute"
+    assert [op["tool"] for op in arguments["operations"]] == ["browser_navigate", "browser_close"]
+    assert arguments["operations"][1]["arguments"] == {}
+    assert arguments["stopOnError"] is True
+    assert "maxConcurrent" not in arguments
+
+
+async def test_batch_call_tool_ignores_incompatible_batch_tool():
+    """Test that a batch tool not taking an operations list isn't used."""
+    client = MCPClient()
+    client._session = RecordingSession(
+        tools=[SimpleNamespace(name="batch_execute", description="", inputSchema={})]
+    )
+    client._connected = True
+
+    results = await client.batch_call_tool(
+        [
+            {"tool": "browser_navigate", "arguments": {"url": "about:blank"}},
+            {"tool": "browser_close"},
+        ]
+    )
+
+    assert len(results) == 2
+    assert [name for name, _ in client._session.calls] == ["browser_navigate", "browser_close"]
+
+
+async def test_batch_call_tool_falls_back_to_individual_calls():
+    """Test that calls are made one by one without server batching."""
+    client = MCPClient()
+    client._session = RecordingSession()
+    client._connected = True
+
+    results = await client.batch_call_tool(
+        [
+            {"tool": "browser_navigate", "arguments": {"url": "about:blank"}},
+            {"tool": "browser_close"},
+        ]
+    )
+
+    assert len(results) == 2
+    assert [name for name, _ in client._session.calls] == ["browser_navigate", "browser_close"]
+
+
+async def test_get_shared_returns_one_client_per_server():
+    """Test that shared clients are reused per server URL."""
+    first = MCPClient.get_shared("http://localhost:8931", timeout=5.0)
+    second = MCPClient.get_shared("http://localhost:8931")
+    other = MCPClient.get_shared("http://localhost:9000")
+
+    assert first is second
+    assert first.timeout == 5.0
+    assert other is not first
+
+    await MCPClient.close_shared()
+
+    assert MCPClient.get_shared("http://localhost:8931") is not first
+    await MCPClient.close_shared()
+
+
+def test_transport_resolved_from_url():
+    """Test that the connection method is chosen from the URL scheme."""
+    assert MCPClient("http://localhost:8931")._connect_impl.__name__ == "_connect_sse"
+    assert MCPClient("stdio://playwright-mcp")._connect_impl.__name__ == "_connect_stdio"
+
+    with pytest.raises(MCPConnectionError):
+        MCPClient("ftp://localhost")
+
+
+def test_server_args_from_config():
+    """Test that a configured browser profile is passed to a stdio server."""
+    assert MCPConfig().server_args() == []
+
+    config = MCPConfig(user_data_dir="~/.conductor/browser")
+    client = MCPClient(config.server_url, server_args=config.server_args())
+
+    assert client.server_args[0] == "--user-data-dir"
+    assert client.server_args[1].endswith("/.conductor/browser")
+    assert not client.server_args[1].startswith("~")
+
+
+async def test_call_tool_cache_opt_in():
+    """Test that cached calls are reused until a state-changing call."""
+    client = MCPClient()
+    client._session = RecordingSession()
+    client._connected = True
+    url_call = ("browser_evaluate", {"function": "() => window.location.href"})
+
+    await client.call_tool(*url_call, cache_ttl=30)
+    await client.call_tool(*url_call, cache_ttl=30)
+    await client.call_tool("browser_snapshot")
+    await client.call_tool(*url_call, cache_ttl=30)
+    assert len(client._session.calls) == 2
+
+    await client.call_tool("browser_click", {"element": "Submit"})
+    await client.call_tool(*url_call, cache_ttl=30)
+    assert len(client._session.calls) == 4
+
+    # Uncached calls always reach the server
+    await client.call_tool(*url_call)
+    assert len(client._session.calls) == 5
+
+
+async def test_concurrent_connects_share_one_handshake():
+    """Test that concurrent connect calls coalesce onto one handshake."""
+    client = MCPClient()
+    handshakes = []
+
+    async def fake_connect_impl():
+        handshakes.append(1)
+        await asyncio.sleep(0.01)
+        client._session = FakeSession()
+
+    client._connect_impl = fake_connect_impl
+
+    await asyncio.gather(*(client.connect() for _ in range(5)))
+    await client.ensure_connected()
+
+    assert len(handshakes) == 1
+    assert client.is_connected
@@ -0,0 +1,408 @@
+"""
+Tests for the console orchestrator's task scheduling.
+"""
+
+import asyncio
+import re
+
+import pytest
+
+from conductor.mcp.client import MCPClient, MCPConnectionError
+from conductor.orchestrator import Orchestrator, console
+from conductor.tasks.models import Task, TaskList, TaskStatus
+from conductor.utils.config import Config
+
+from .conftest import TabBrowser, make_task
+
+
+def stub_execution(orchestrator: Orchestrator, failing=(), delay: float = 0.01):
+    """Replace browser-driven task execution with a fast fake."""
+    started = []
+    running = []
+    peak = [0]
+
+    async def fake_execute(task: Task) -> None:
+        task.start()
+        started.append(task.id)
+        running.append(task.id)
+        peak[0] = max(peak[0], len(running))
+        await asyncio.sleep(delay)
+        running.remove(task.id)
+        if task.id in failing:
+            raise RuntimeError("boom")
+        task.complete(session_id=f"session_{task.id}")
+
+    orchestrator._execute_task = fake_execute
+    return started, peak
+
+
+async def test_dependencies_run_after_prerequisites(parallel_config):
+    """Test that dependent tasks start only after their dependencies complete."""
+    task_list = TaskList(
+        tasks=[
+            make_task("C", ["A", "B"]),
+            make_task("A"),
+            make_task("B", ["A"]),
+        ]
+    )
+    orchestrator = Orchestrator(parallel_config, task_list)
+    started, _ = stub_execution(orchestrator)
+
+    await orchestrator._execute_tasks()
+
+    assert started == ["A", "B", "C"]
+    assert all(t.status == TaskStatus.COMPLETED for t in task_list.tasks)
+
+
+async def test_independent_tasks_run_concurrently(parallel_config):
+    """Test that independent tasks overlap up to max_parallel."""
+    task_list = TaskList(tasks=[make_task(f"T{i}") for i in range(5)])
+    orchestrator = Orchestrator(parallel_config, task_list)
+    _, peak = stub_execution(orchestrator)
+
+    await orchestrator._execute_tasks()
+
+    assert peak[0] == 3
+    assert all(t.status == TaskStatus.COMPLETED for t in task_list.tasks)
+
+
+async def test_dependents_start_before_slow_siblings_finish(parallel_config):
+    """Test that a dependent starts once its own dependency is done, not the whole wave."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("SLOW"), make_task("B", ["A"])])
+    orchestrator = Orchestrator(parallel_config, task_list)
+    events = []
+
+    async def fake_execute(task: Task) -> None:
+        task.start()
+        events.append(("start", task.id))
+        await asyncio.sleep(0.2 if task.id == "SLOW" else 0.01)
+        events.append(("end", task.id))
+        task.complete()
+
+    orchestrator._execute_task = fake_execute
+
+    await orchestrator._execute_tasks()
+
+    assert events.index(("start", "B")) < events.index(("end", "SLOW"))
+
+
+async def test_only_running_tasks_have_coroutines(parallel_config):
+    """Test that waiting tasks don't each hold a coroutine on the event loop."""
+    task_list = TaskList(tasks=[make_task(f"T{i}") for i in range(50)])
+    orchestrator = Orchestrator(parallel_config, task_list)
+    live = []
+
+    async def fake_execute(task: Task) -> None:
+        live.append(len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        task.complete()
+
+    orchestrator._execute_task = fake_execute
+
+    await orchestrator._execute_tasks()
+
+    # The test's own task plus one per concurrency slot
+    assert max(live) <= parallel_config.execution.max_parallel_tasks + 1
+    assert all(t.status == TaskStatus.COMPLETED for t in task_list.tasks)
+
+
+async def test_failed_task_is_recorded_once(parallel_config, monkeypatch):
+    """Test that a task failing in the browser is marked failed exactly once."""
+    task = make_task("A")
+    orchestrator = Orchestrator(parallel_config, TaskList(tasks=[task]))
+    failures = []
+    fail = Task.fail
+
+    def recording_fail(self, error: str) -> None:
+        failures.append(error)
+        fail(self, error)
+
+    async def no_tab(url: str):
+        raise RuntimeError("no tab")
+
+    monkeypatch.setattr(Task, "fail", recording_fail)
+    orchestrator._acquire_tab = no_tab
+
+    await orchestrator._execute_and_report(task)
+
+    assert failures == ["no tab"]
+    assert task.status == TaskStatus.FAILED
+
+
+async def test_sequential_without_parallel_mode():
+    """Test that tasks run one at a time unless parallel mode is enabled."""
+    task_list = TaskList(tasks=[make_task(f"T{i}") for i in range(3)])
+    orchestrator = Orchestrator(Config(), task_list)
+    _, peak = stub_execution(orchestrator)
+
+    await orchestrator._execute_tasks()
+
+    assert peak[0] == 1
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [("descendants", ["B", "C", "A", "D"]), ("fifo", ["A", "B", "C", "D"])],
+)
+async def test_schedule_policy_orders_waiting_tasks(policy, expected):
+    """Test that a free slot goes to the task with the most dependents first."""
+    config = Config()
+    config.execution.schedule_policy = policy
+    task_list = TaskList(
+        tasks=[make_task("A"), make_task("B"), make_task("C", ["B"]), make_task("D", ["C"])]
+    )
+    orchestrator = Orchestrator(config, task_list)
+    started, _ = stub_execution(orchestrator)
+
+    await orchestrator._execute_tasks()
+
+    assert started == expected
+
+
+async def test_failed_dependency_skips_dependents(parallel_config):
+    """Test that tasks depending on a failed task are skipped."""
+    task_list = TaskList(
+        tasks=[
+            make_task("A"),
+            make_task("B", ["A"]),
+            make_task("C", ["B"]),
+            make_task("D"),
+        ]
+    )
+    orchestrator = Orchestrator(parallel_config, task_list)
+    started, _ = stub_execution(orchestrator, failing={"A"})
+
+    await orchestrator._execute_tasks()
+
+    assert "B" not in started and "C" not in started
+    assert task_list.get_task("A").status == TaskStatus.FAILED
+    assert task_list.get_task("B").status == TaskStatus.SKIPPED
+    assert task_list.get_task("C").status == TaskStatus.SKIPPED
+    assert task_list.get_task("D").status == TaskStatus.COMPLETED
+
+
+class FakeBrowser:
+    """Browser stand-in that reports completion after a number of polls."""
+
+    def __init__(self, complete_after: int = 1, branch=None, keyword: bool = False):
+        self.complete_after = complete_after
+        self.branch = branch
+        self.keyword = keyword
+        self.length = 0
+        self.probes = 0
+
+    async def switch_tab(self, index: int) -> None:
+        pass
+
+    async def probe_completion(
+        self, indicator_selector, branch_selector, keyword_pattern, tail_chars
+    ):
+        self.probes += 1
+        return {
+            "indicator": self.probes >= self.complete_after,
+            "pr_enabled": False,
+            "branch": self.branch,
+            "keyword": self.keyword,
+            "length": self.length,
+        }
+
+
+async def test_wait_for_completion_uses_single_probe_per_poll():
+    """Test that completion is detected from the in-page probe."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+    orchestrator.browser = FakeBrowser(complete_after=3)
+
+    probe = await orchestrator._wait_for_task_completion(
+        orchestrator.task_list.tasks[0], tab_index=0, timeout=5, check_interval=0.001
+    )
+
+    assert orchestrator.browser.probes == 3
+    assert probe["indicator"] is True
+
+
+async def test_wait_for_completion_times_out():
+    """Test that waiting stops once the timeout elapses."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+    orchestrator.browser = FakeBrowser(complete_after=10**6)
+
+    await orchestrator._wait_for_task_completion(
+        orchestrator.task_list.tasks[0], tab_index=0, timeout=0.05, check_interval=0.01
+    )
+
+    assert orchestrator.browser.probes >= 1
+
+
+async def test_wait_for_completion_detects_keywords():
+    """Test that a branch plus a completion keyword ends the wait."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+    browser = FakeBrowser(complete_after=10**6, branch="claude/a-1", keyword=True)
+    orchestrator.browser = browser
+
+    probe = await orchestrator._wait_for_task_completion(
+        orchestrator.task_list.tasks[0], tab_index=0, timeout=5, check_interval=0.001
+    )
+
+    assert browser.probes == 1
+    assert probe["branch"] == "claude/a-1"
+
+
+def test_extract_branch_name_from_page():
+    """Test branch name extraction from page text."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+
+    branch = orchestrator._extract_branch_name_from_page("Branch: feature/login")
+    assert branch == "claude/feature/login"
+    assert orchestrator._extract_branch_name_from_page("pushed claude/fix-123") == "fix-123"
+    assert orchestrator._extract_branch_name_from_page("nothing here") is None
+    assert (
+        orchestrator._extract_branch_name_from_page("see claude/old, then Branch: new")
+        == "claude/new"
+    )
+
+
+async def test_tabs_are_recycled_through_pool(parallel_config):
+    """Test that released tabs are reused instead of opening new ones."""
+    orchestrator = Orchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    orchestrator.browser = TabBrowser()
+
+    first, first_reused = await orchestrator._acquire_tab("https://claude.ai/code")
+    second, _ = await orchestrator._acquire_tab("https://claude.ai/code")
+    await orchestrator._release_tab(first)
+    reused, was_reused = await orchestrator._acquire_tab("https://claude.ai/code")
+
+    assert (reused, was_reused) == (first, True)
+    assert second != first and not first_reused
+    assert orchestrator.browser.created == 2
+
+
+async def test_per_task_mode_opens_a_tab_per_task(parallel_config):
+    """Test that per_task mode never reuses tabs."""
+    parallel_config.execution.tab_reuse_mode = "per_task"
+    orchestrator = Orchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    orchestrator.browser = TabBrowser()
+
+    first, _ = await orchestrator._acquire_tab("https://claude.ai/code")
+    await orchestrator._release_tab(first)
+    second, reused = await orchestrator._acquire_tab("https://claude.ai/code")
+
+    assert second != first and not reused
+
+
+def test_single_tab_mode_runs_one_task_at_a_time(parallel_config):
+    """Test that single mode limits concurrency to the one shared tab."""
+    parallel_config.execution.tab_reuse_mode = "single"
+
+    assert Orchestrator(parallel_config, TaskList(tasks=[make_task("A")])).max_parallel == 1
+
+
+def test_extract_session_id_from_url():
+    """Test session ID extraction from Claude Code URLs."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+
+    session_url = "https://claude.ai/code/session_abc"
+    assert orchestrator._extract_session_id_from_url(session_url) == "session_abc"
+    assert orchestrator._extract_session_id_from_url("https://claude.ai/code/abc?x=1#top") == "abc"
+    assert orchestrator._extract_session_id_from_url("https://claude.ai/code/abc/files") == "abc"
+    assert orchestrator._extract_session_id_from_url("https://claude.ai/code/") is None
+    assert orchestrator._extract_session_id_from_url("https://claude.ai/chat/abc") is None
+
+
+async def test_cleanup_does_not_hang_on_browser_close(monkeypatch):
+    """Test that cleanup gives up on a browser that never closes."""
+    monkeypatch.setattr("conductor.orchestrator._CLEANUP_TIMEOUT", 0.01)
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+
+    class HangingBrowser:
+        async def close(self) -> None:
+            await asyncio.sleep(10)
+
+    orchestrator.browser = HangingBrowser()
+
+    await asyncio.wait_for(orchestrator._cleanup(), timeout=1.0)
+
+
+async def test_wait_for_completion_backs_off_while_idle(monkeypatch):
+    """Test that polling slows while the page is idle and resets on change."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+    browser = FakeBrowser(complete_after=6)
+    orchestrator.browser = browser
+    delays = []
+
+    async def record_wait(awaitable, timeout):
+        awaitable.close()
+        delays.append(round(timeout, 4))
+        if len(delays) == 3:
+            browser.length = 100
+        raise TimeoutError
+
+    monkeypatch.setattr("conductor.orchestrator.asyncio.wait_for", record_wait)
+
+    await orchestrator._wait_for_task_completion(
+        orchestrator.task_list.tasks[0], tab_index=0, timeout=60, check_interval=1.0
+    )
+
+    assert delays == [1.0, 1.5, 2.25, 1.0, 1.5]
+
+
+def test_summary_lists_counts_and_branches(monkeypatch):
+    """Test that the summary shows status counts and created branches."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("B"), make_task("C")])
+    task_list.tasks[0].complete(session_id="s1", branch_name="claude/a")
+    task_list.tasks[1].fail("boom")
+    orchestrator = Orchestrator(Config(), task_list)
+    monkeypatch.setattr(
+        orchestrator.session_manager, "get_all_branches", lambda: ["claude/a", "claude/b"]
+    )
+
+    with console.capture() as capture:
+        orchestrator._show_summary()
+    output = capture.get()
+
+    assert re.search(r"Completed:\s+1", output)
+    assert re.search(r"Failed:\s+1", output)
+    assert "• claude/a" in output and "• claude/b" in output
+
+
+async def test_initialize_mcp_requires_live_session(monkeypatch):
+    """Test that initialization fails fast when no session was established."""
+    config = Config()
+    config.mcp.reuse_connection = False
+    orchestrator = Orchestrator(config, TaskList(tasks=[make_task("A")]))
+
+    async def connect_without_session(self):
+        pass
+
+    monkeypatch.setattr(MCPClient, "ensure_connected", connect_without_session)
+
+    with pytest.raises(MCPConnectionError):
+        await orchestrator._initialize_mcp()
+
+
+async def test_cancel_wakes_completion_wait():
+    """Test that cancelling stops a completion wait without sleeping it out."""
+    orchestrator = Orchestrator(Config(), TaskList(tasks=[make_task("A")]))
+    orchestrator.browser = FakeBrowser(complete_after=10**6)
+
+    wait = asyncio.create_task(
+        orchestrator._wait_for_task_completion(
+            orchestrator.task_list.tasks[0], tab_index=0, timeout=60, check_interval=30
+        )
+    )
+    await asyncio.sleep(0.01)
+    orchestrator.cancel()
+
+    probe = await asyncio.wait_for(wait, timeout=1.0)
+    assert probe["indicator"] is False
+
+
+async def test_cancel_skips_tasks_not_yet_started():
+    """Test that queued tasks are skipped once execution is cancelled."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("B")])
+    orchestrator = Orchestrator(Config(), task_list)
+    started, _ = stub_execution(orchestrator)
+    orchestrator.cancel()
+
+    await orchestrator._execute_tasks()
+
+    assert started == []
+    assert all(t.status == TaskStatus.SKIPPED for t in task_list.tasks)
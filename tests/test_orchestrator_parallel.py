@@ -0,0 +1,615 @@
+"""
+Tests for the parallel orchestrator's task scheduling.
+"""
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from conductor.browser.auth import AuthenticationFlow, AuthStatus
+from conductor.mcp.browser import BrowserController
+from conductor.mcp.client import MCPClient
+from conductor.orchestrator_parallel import (
+    _WARM_BROWSERS,
+    ParallelOrchestrator,
+    close_warm_browsers,
+)
+from conductor.tasks.models import Task, TaskList, TaskStatus
+from conductor.tui.app import ConductorTUI
+
+from .conftest import TabBrowser, make_task
+
+
+def stub_execution(orchestrator: ParallelOrchestrator, delays=None, failing=()):
+    """Replace browser-driven task execution with a fake that records events."""
+    events = []
+
+    async def fake_execute(task: Task, browser) -> None:
+        task.start()
+        events.append(("start", task.id))
+        await asyncio.sleep((delays or {}).get(task.id, 0.01))
+        events.append(("end", task.id))
+        if task.id in failing:
+            raise RuntimeError("boom")
+        task.complete(session_id=f"session_{task.id}")
+
+    orchestrator._execute_task_with_retry = fake_execute
+    return events
+
+
+async def test_dependents_start_without_waiting_for_siblings(parallel_config):
+    """Test that a finished task unblocks its dependents immediately."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("B"), make_task("C", ["B"])])
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    events = stub_execution(orchestrator, delays={"A": 0.2})
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert events.index(("start", "C")) < events.index(("end", "A"))
+    assert all(t.status == TaskStatus.COMPLETED for t in task_list.tasks)
+
+
+async def test_task_waits_for_every_dependency(parallel_config):
+    """Test that a task with several dependencies starts after the last one."""
+    task_list = TaskList(
+        tasks=[make_task("A"), make_task("B"), make_task("C", ["A", "B"])]
+    )
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    events = stub_execution(orchestrator, delays={"B": 0.05})
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert events.index(("start", "C")) > events.index(("end", "B"))
+    assert events.count(("start", "C")) == 1
+
+
+async def test_large_dependency_graph_runs_every_task_after_its_dependencies(parallel_config):
+    """Test that a deep, wide graph finishes in one pass with dependencies respected."""
+    # Each task depends on up to three earlier ones, listed in reverse so
+    # file order never matches execution order
+    ids = [f"T{i}" for i in range(300)]
+    tasks = [
+        make_task(task_id, [ids[j] for j in {i // 2, i - 1, i - 7} if 0 <= j < i])
+        for i, task_id in enumerate(ids)
+    ]
+    task_list = TaskList(tasks=tasks[::-1])
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    events = stub_execution(orchestrator, delays=dict.fromkeys(ids, 0))
+
+    await orchestrator._execute_tasks_parallel()
+
+    finished_at = {task_id: n for n, (kind, task_id) in enumerate(events) if kind == "end"}
+    started_at = {task_id: n for n, (kind, task_id) in enumerate(events) if kind == "start"}
+    assert len(started_at) == len(ids)
+    for task in tasks:
+        assert all(finished_at[dep] < started_at[task.id] for dep in task.dependencies)
+
+
+async def test_failed_dependency_skips_dependents(parallel_config):
+    """Test that dependents of a failed task are skipped, transitively."""
+    task_list = TaskList(
+        tasks=[make_task("A"), make_task("B", ["A"]), make_task("C", ["B"]), make_task("D")]
+    )
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    events = stub_execution(orchestrator, failing={"A"})
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert ("start", "B") not in events and ("start", "C") not in events
+    assert task_list.get_task("A").status == TaskStatus.FAILED
+    assert [t.id for t in orchestrator.skipped_tasks] == ["B", "C"]
+    assert all(t.status == TaskStatus.SKIPPED for t in orchestrator.skipped_tasks)
+    assert task_list.get_task("D").status == TaskStatus.COMPLETED
+
+
+async def test_tasks_blocked_before_the_run_are_skipped(parallel_config):
+    """Test that tasks waiting on an already failed task don't stay pending."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("B", ["A"]), make_task("C")])
+    task_list.get_task("A").fail("earlier run")
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    events = stub_execution(orchestrator)
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert events == [("start", "C"), ("end", "C")]
+    assert task_list.get_task("B").status == TaskStatus.SKIPPED
+    assert orchestrator.skipped_tasks == [task_list.get_task("B")]
+
+
+async def test_worker_coroutines_are_created_only_for_free_slots(parallel_config):
+    """Test that a large batch of ready tasks never has more than max_parallel workers."""
+    task_list = TaskList(tasks=[make_task(f"T{i}") for i in range(50)])
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    stub_execution(orchestrator)
+    run_task = orchestrator._run_task
+    live = []
+    peak = 0
+
+    def counting_run_task(task: Task):
+        nonlocal peak
+        live.append(task.id)
+        peak = max(peak, len(live))
+
+        async def run() -> None:
+            try:
+                await run_task(task)
+            finally:
+                live.remove(task.id)
+
+        return run()
+
+    orchestrator._run_task = counting_run_task
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert peak == parallel_config.execution.max_parallel_tasks
+    assert len(orchestrator.completed_tasks) == 50
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [("descendants", ["B", "C", "A", "D"]), ("fifo", ["A", "B", "C", "D"])],
+)
+async def test_schedule_policy_orders_ready_tasks(parallel_config, policy, expected):
+    """Test that free slots go to tasks with the most dependents first."""
+    parallel_config.execution.max_parallel_tasks = 1
+    parallel_config.execution.schedule_policy = policy
+    task_list = TaskList(
+        tasks=[make_task("A"), make_task("B"), make_task("C", ["B"]), make_task("D", ["C"])]
+    )
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    events = stub_execution(orchestrator)
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert [task_id for event, task_id in events if event == "start"] == expected
+
+
+async def test_cancelled_dispatcher_waits_for_workers(parallel_config):
+    """Test that no worker is left running once the dispatcher is cancelled."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("B")])
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    unwound = []
+
+    async def slow_execute(task: Task, browser) -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            # Releasing a tab or lock can take a few loop iterations
+            for _ in range(3):
+                await asyncio.sleep(0)
+            unwound.append(task.id)
+
+    orchestrator._execute_task_with_retry = slow_execute
+    dispatcher = asyncio.create_task(orchestrator._execute_tasks_parallel())
+    await asyncio.sleep(0.01)
+    dispatcher.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await dispatcher
+    assert sorted(unwound) == ["A", "B"]
+    assert not orchestrator.running_tasks
+
+
+async def test_tabs_are_opened_lazily_and_recycled(parallel_config):
+    """Test that tabs are only opened when needed and reused afterwards."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    browser = TabBrowser()
+
+    first, first_reused = await orchestrator._acquire_tab(browser, "https://claude.ai/code/new")
+    orchestrator._release_tab(first)
+    second, second_reused = await orchestrator._acquire_tab(browser, "https://claude.ai/code/new")
+
+    assert (second, second_reused) == (first, True)
+    assert not first_reused
+    assert browser.created == 1
+
+
+class RoutingBrowser:
+    """Browser stand-in whose pages may or may not link to the target URL."""
+
+    def __init__(self, has_link=True, error=None):
+        self.has_link = has_link
+        self.error = error
+
+    async def switch_tab(self, tab_index: int) -> None:
+        if self.error:
+            raise self.error
+
+    async def follow_link(self, url: str) -> bool:
+        return self.has_link
+
+
+async def test_reused_tab_routes_in_app_when_it_can(parallel_config):
+    """Test that a reused tab follows an in-app link and otherwise asks for a reload."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    url = "https://claude.ai/code/new"
+
+    assert await orchestrator._open_in_app(RoutingBrowser(), 1, url) is True
+    assert await orchestrator._open_in_app(RoutingBrowser(has_link=False), 1, url) is False
+    assert await orchestrator._open_in_app(RoutingBrowser(error=RuntimeError()), 1, url) is False
+
+
+async def test_concurrent_tasks_never_share_a_tab(parallel_config):
+    """Test that tasks starting together get distinct tabs and extra ones wait."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    browser = TabBrowser()
+    url = "https://claude.ai/code/new"
+
+    acquired = await asyncio.gather(*(orchestrator._acquire_tab(browser, url) for _ in range(3)))
+    waiting = asyncio.create_task(orchestrator._acquire_tab(browser, url))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    orchestrator._release_tab(acquired[1][0])
+    assert await asyncio.wait_for(waiting, timeout=1.0) == (acquired[1][0], True)
+    assert sorted(index for index, _ in acquired) == [1, 2, 3]
+
+
+class LoadingPage:
+    """Browser stand-in whose page becomes ready after a few checks."""
+
+    def __init__(self, ready_after: int):
+        self.ready_after = ready_after
+        self.checks = 0
+
+    async def switch_tab(self, tab_index: int) -> None:
+        pass
+
+    async def wait_for_selector(self, selector, timeout=30.0, state="visible"):
+        self.checks += 1
+        return self.checks >= self.ready_after
+
+
+async def test_readiness_wait_leaves_browser_lock_free(parallel_config):
+    """Test that other tasks can use the browser while one waits for its page."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    page = LoadingPage(ready_after=3)
+
+    waiting = asyncio.create_task(orchestrator._wait_in_tab(page, 1, "textarea", timeout=2.0))
+    await asyncio.sleep(0.05)
+    async with orchestrator.browser_lock:
+        assert not waiting.done()
+
+    assert await waiting is True
+    assert page.checks == 3
+
+
+class RecordingApp:
+    """TUI stand-in that records panel updates."""
+
+    def __init__(self):
+        self.executions = []
+        self.queue_updates = 0
+        self.previews = []
+
+    def notify(self, *args, **kwargs):
+        pass
+
+    def update_execution(self, task=None, progress=0.0, elapsed=0.0, retries=0):
+        self.executions.append((task.id, progress))
+
+    def update_task_queue(self, current_task_id=None):
+        self.queue_updates += 1
+
+    def update_browser(self, url="", branch="", preview=""):
+        self.previews.append(branch)
+
+
+async def test_progress_updates_are_coalesced_into_repaints(parallel_config):
+    """Test that workers' progress reports reach the TUI in batched repaints."""
+    app = RecordingApp()
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]), app=app)
+
+    async def chatty_execute(task: Task, browser) -> None:
+        task.start()
+        start_time = monotonic()
+        for step in range(100):
+            orchestrator._report_progress(task, step / 100, start_time)
+        await asyncio.sleep(0.01)
+        orchestrator._report_progress(task, 1.0, start_time)
+        task.complete(session_id="session_A")
+
+    orchestrator._execute_task_with_retry = chatty_execute
+
+    await orchestrator._execute_tasks_parallel()
+
+    assert len(app.executions) <= 3
+    assert app.executions[-1] == ("A", 1.0)
+    assert app.queue_updates >= 1
+
+
+def test_browser_previews_are_coalesced_into_repaints(parallel_config):
+    """Test that a burst of finished tasks shows only the latest preview."""
+    app = RecordingApp()
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]), app=app)
+
+    for branch in ("claude/a", "claude/b", "claude/c"):
+        orchestrator._report_preview("https://claude.ai/code", branch, "done")
+    orchestrator._flush_ui()
+    orchestrator._flush_ui()
+
+    assert app.previews == ["claude/c"]
+
+
+async def test_repaint_advances_progress_ramp(parallel_config):
+    """Test that time-based progress is interpolated by the repaint loop."""
+    app = RecordingApp()
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]), app=app)
+    task = orchestrator.task_list.tasks[0]
+    start_time = monotonic()
+
+    orchestrator._report_progress(task, 0.4, start_time, ramp_to=0.9, ramp_seconds=0.05)
+    orchestrator._flush_ui()
+    await asyncio.sleep(0.06)
+    orchestrator._flush_ui()
+
+    first, last = app.executions
+    assert 0.4 <= first[1] < 0.9
+    assert last == ("A", 0.9)
+
+
+async def test_failed_tab_open_frees_its_pool_slot(parallel_config):
+    """Test that a tab that fails to open doesn't use up a pool slot."""
+    parallel_config.execution.max_parallel_tasks = 1
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    browser = TabBrowser()
+
+    async def broken_open(url: str) -> int:
+        raise RuntimeError("tab crashed")
+
+    working_open = browser.open_new_task_tab
+    browser.open_new_task_tab = broken_open
+    with pytest.raises(RuntimeError):
+        await orchestrator._acquire_tab(browser, "https://claude.ai/code/new")
+
+    browser.open_new_task_tab = working_open
+    tab_index, reused = await asyncio.wait_for(
+        orchestrator._acquire_tab(browser, "https://claude.ai/code/new"), timeout=1.0
+    )
+
+    assert (tab_index, reused) == (1, False)
+
+
+async def test_cancel_interrupts_retry_backoff(parallel_config):
+    """Test that cancelling stops a task waiting to retry instead of sleeping."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    task = orchestrator.task_list.tasks[0]
+    attempts = []
+
+    async def failing_attempt(task: Task, browser, start_time: float) -> None:
+        attempts.append(task.id)
+        raise RuntimeError("boom")
+
+    orchestrator._execute_single_task = failing_attempt
+    worker = asyncio.create_task(orchestrator._execute_task_with_retry(task, None))
+    await asyncio.sleep(0.01)
+    orchestrator.cancel()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(worker, timeout=1.0)
+    assert attempts == ["A"]
+
+
+
+async def test_tui_abort_cancels_retry_and_pending_tasks(parallel_config):
+    """Test that aborting from the TUI stops a retry backoff and unstarted tasks."""
+    task_list = TaskList(tasks=[make_task("A"), make_task("B")])
+    orchestrator = ParallelOrchestrator(parallel_config, task_list)
+    orchestrator.max_parallel = 1
+    # Already set up and logged in, as run_with_tui_parallel leaves it
+    orchestrator.mcp_client, orchestrator._authenticated = object(), True
+    attempts = []
+
+    async def failing_attempt(task: Task, browser, start_time: float) -> None:
+        attempts.append(task.id)
+        raise RuntimeError("boom")
+
+    orchestrator._execute_single_task = failing_attempt
+    app = ConductorTUI(task_list=task_list, orchestrator=orchestrator)
+    orchestrator.app = app
+
+    async with app.run_test() as pilot:
+        while not attempts:
+            await pilot.pause(0.05)
+        await pilot.press("a")
+        for _ in range(40):
+            if task_list.tasks[1].status == TaskStatus.SKIPPED:
+                break
+            await pilot.pause(0.05)
+
+    assert attempts == ["A"]
+    assert [t.status for t in task_list.tasks] == [TaskStatus.FAILED, TaskStatus.SKIPPED]
+
+
+async def test_initialize_mcp_reuses_shared_client(parallel_config, monkeypatch):
+    """Test that orchestrator runs share one MCP client when reuse is enabled."""
+    async def connect(self):
+        pass
+
+    monkeypatch.setattr(MCPClient, "ensure_connected", connect)
+    first = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    second = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("B")]))
+
+    await first._initialize_mcp()
+    await second._initialize_mcp()
+
+    assert first.mcp_client is second.mcp_client
+    assert first.browser.client is second.mcp_client
+    await MCPClient.close_shared()
+
+
+@pytest.fixture
+def fake_login(monkeypatch):
+    """Connect MCP clients and log in without a server, recording each login."""
+    logins = []
+
+    async def connect(self):
+        self._connected, self._session = True, object()
+
+    async def disconnect(self):
+        self._connected, self._session = False, None
+
+    async def list_tools(self):
+        return []
+
+    async def start(self, headless=False, wait_for_user_input=True):
+        logins.append(self.browser)
+        return AuthStatus.AUTHENTICATED
+
+    monkeypatch.setattr(MCPClient, "ensure_connected", connect)
+    monkeypatch.setattr(MCPClient, "disconnect", disconnect)
+    monkeypatch.setattr(MCPClient, "list_tools", list_tools)
+    monkeypatch.setattr(AuthenticationFlow, "start", start)
+    yield logins
+    _WARM_BROWSERS.clear()
+
+
+async def test_run_logs_in_after_its_own_init(parallel_config, fake_login):
+    """Test that run() authenticates a browser it set up itself."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    stub_execution(orchestrator)
+
+    await orchestrator.run()
+
+    assert fake_login == [orchestrator.browser]
+    await MCPClient.close_shared()
+
+
+async def test_create_authenticated_reuses_logged_in_browser(parallel_config, fake_login):
+    """Test that orchestrators on a shared client log in only once."""
+    task_list = TaskList(tasks=[make_task("A")])
+
+    first = await ParallelOrchestrator.create_authenticated(parallel_config, task_list)
+    second = await ParallelOrchestrator.create_authenticated(parallel_config, task_list)
+
+    assert second.browser is first.browser
+    assert fake_login == [first.browser]
+    await MCPClient.close_shared()
+
+
+async def test_create_authenticated_keeps_login_error(parallel_config, fake_login, monkeypatch):
+    """Test that a failing browser close doesn't hide why the login failed."""
+
+    async def failed_login(self, headless=False, wait_for_user_input=True):
+        return AuthStatus.TIMEOUT
+
+    async def failed_close(self):
+        raise RuntimeError("browser already gone")
+
+    monkeypatch.setattr(AuthenticationFlow, "start", failed_login)
+    monkeypatch.setattr(BrowserController, "close", failed_close)
+
+    with pytest.raises(RuntimeError, match="Authentication failed"):
+        await ParallelOrchestrator.create_authenticated(
+            parallel_config, TaskList(tasks=[make_task("A")])
+        )
+
+    # The shared client keeps its session for the next run
+    assert MCPClient.get_shared(parallel_config.mcp.server_url).is_connected
+    await MCPClient.close_shared()
+
+
+class ClosingBrowser:
+    """Browser stand-in that records being closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_close_warm_browsers_skips_disconnected_clients():
+    """Test that kept browsers are closed only while their client is connected."""
+    connected, dropped = MCPClient(), MCPClient("http://localhost:9000")
+    connected._connected, connected._session = True, object()
+    live, stale = ClosingBrowser(), ClosingBrowser()
+    _WARM_BROWSERS[connected.server_url] = (connected, live)
+    _WARM_BROWSERS[dropped.server_url] = (dropped, stale)
+
+    await close_warm_browsers()
+
+    assert live.closed and not stale.closed
+    assert not _WARM_BROWSERS
+
+
+class ProbeBrowser:
+    """Browser stand-in that reports completion after a number of probes."""
+
+    def __init__(self, complete_after: int, length=None):
+        self.complete_after = complete_after
+        self.probes = 0
+        self.length = length
+
+    async def switch_tab(self, tab_index: int) -> None:
+        pass
+
+    async def probe_completion(self, indicator, branch, keywords, tail_chars=4096):
+        self.probes += 1
+        done = self.probes >= self.complete_after
+        return {
+            "indicator": False,
+            "pr_enabled": False,
+            "branch": "claude/a-1" if done else None,
+            "keyword": done,
+            "length": self.probes if self.length is None else self.length,
+        }
+
+
+async def test_wait_for_completion_polls_with_probe(parallel_config):
+    """Test that completion is detected from in-page probes without reading the page."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    task = orchestrator.task_list.tasks[0]
+    browser = ProbeBrowser(complete_after=2)
+
+    probe = await orchestrator._wait_for_task_completion(
+        task, browser, 1, monotonic(), timeout=5, check_interval=0.01
+    )
+
+    assert probe["branch"] == "claude/a-1"
+    assert browser.probes == 2
+
+
+async def test_wait_for_completion_backs_off_while_idle(parallel_config, monkeypatch):
+    """Test that an idle page is polled less often, and quickly again once it changes."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    browser = ProbeBrowser(complete_after=6, length=0)
+    delays = []
+
+    async def record_sleep(delay):
+        delays.append(round(delay, 4))
+        if len(delays) == 3:
+            browser.length = 100
+
+    monkeypatch.setattr("conductor.orchestrator_parallel.asyncio.sleep", record_sleep)
+
+    await orchestrator._wait_for_task_completion(
+        orchestrator.task_list.tasks[0], browser, 1, monotonic(), timeout=60, check_interval=1.0
+    )
+
+    assert delays == [1.0, 1.5, 2.25, 1.0, 1.5]
+
+
+async def test_wait_for_completion_logs_progress_with_irregular_polls(
+    parallel_config, monkeypatch, caplog
+):
+    """Test that progress is logged every 30s even when polls never land on a multiple of 30."""
+    orchestrator = ParallelOrchestrator(parallel_config, TaskList(tasks=[make_task("A")]))
+    browser = ProbeBrowser(complete_after=40, length=0)
+    clock = [1000.0]
+
+    async def advance(delay):
+        clock[0] += delay + 0.37
+
+    monkeypatch.setattr("conductor.orchestrator_parallel.monotonic", lambda: clock[0])
+    monkeypatch.setattr("conductor.orchestrator_parallel.asyncio.sleep", advance)
+    caplog.set_level("DEBUG", logger="conductor.orchestrator_parallel")
+
+    await orchestrator._wait_for_task_completion(
+        orchestrator.task_list.tasks[0], browser, 1, clock[0], timeout=600, check_interval=1.0
+    )
+
+    logged = [r.message for r in caplog.records if "still running" in r.message]
+    assert len(logged) >= 5
@@ -3,7 +3,7 @@ Tests for retry logic with exponential backoff and jitter.
 """
 
 import pytest
-from conductor.utils.retry import exponential_backoff, calculate_jitter
+from conductor.utils.retry import exponential_backoff, calculate_jitter, wait_until
 
 
 def test_exponential_backoff_first_attempt():
@@ -165,3 +165,21 @@ async def test_retry_async_all_failures():
         )
 
     assert call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_until_returns_first_truthy_result():
+    """Test that polling stops as soon as the predicate holds."""
+    polls = []
+
+    async def predicate():
+        polls.append(1)
+        return "session_abc" if len(polls) == 3 else None
+
+    assert await wait_until(predicate, timeout=5, interval=0.001) == "session_abc"
+    assert len(polls) == 3
+
+    async def never():
+        return None
+
+    assert await wait_until(never, timeout=0.01, interval=0.001) is None
@@ -0,0 +1,40 @@
+"""
+Tests for session tracking and the branch log.
+"""
+
+import json
+
+from conductor.browser.session import SessionManager
+
+
+def test_get_all_branches_reads_log_once(tmp_path, monkeypatch):
+    """Test that branches are loaded from the log once and then kept up to date."""
+    log_file = tmp_path / "sessions.jsonl"
+    log_file.write_text(
+        json.dumps({"session_id": "old", "task_id": "A", "branch_name": "claude/old"}) + "\n"
+    )
+    manager = SessionManager(log_file=log_file)
+    manager.add_session("s1", "B", branch_name="claude/b")
+
+    loads = []
+    original = manager._load_all_branches_from_log
+
+    def counting_load():
+        loads.append(1)
+        return original()
+
+    monkeypatch.setattr(manager, "_load_all_branches_from_log", counting_load)
+
+    assert manager.get_all_branches() == ["claude/old", "claude/b"]
+
+    manager.add_session("s2", "C", branch_name="claude/c")
+    manager.add_session("s3", "D", branch_name="claude/b")
+    manager.update_session("s1", branch_name="claude/b-renamed")
+
+    assert manager.get_all_branches() == [
+        "claude/old",
+        "claude/b",
+        "claude/c",
+        "claude/b-renamed",
+    ]
+    assert len(loads) == 1
@@ -80,3 +80,42 @@ def test_submission_result_failure():
     assert result.success is False
     assert result.session_id is None
     assert result.error_message == "Connection failed"
+
+
+class RecordingBrowser:
+    """Browser stand-in whose waits succeed immediately."""
+
+    def __init__(self):
+        self.waits = []
+
+    async def wait_for_selector(self, selector, timeout=30.0, state="visible"):
+        self.waits.append(selector)
+        return True
+
+    async def click(self, selector, timeout=30.0):
+        pass
+
+    async def fill(self, selector, text, timeout=30.0):
+        pass
+
+    async def get_current_url(self):
+        return "https://claude.ai/code/session_0123456789"
+
+
+async def test_submit_task_waits_on_page_state(sample_task):
+    """Test that each step waits for the UI rather than a fixed delay."""
+    browser = RecordingBrowser()
+    submitter = TaskSubmitter(browser, repository="test/repo")
+
+    result = await submitter.submit_task(sample_task)
+
+    assert result.success is True
+    assert result.session_id == "session_0123456789"
+    assert browser.waits == [
+        "[data-testid='repository-select']",
+        "input[placeholder*='repository']",
+        "[role='listbox']",
+        "textarea[placeholder*='message']",
+        "button[type='submit']:not([disabled])",
+        "[data-testid='session-active']",
+    ]
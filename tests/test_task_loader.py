@@ -5,7 +5,7 @@ Tests for task loading from YAML files.
 import pytest
 from pathlib import Path
 from conductor.tasks.loader import TaskLoader, TaskLoadError
-from conductor.tasks.models import Task, Priority, PRStrategy
+from conductor.tasks.models import Task, TaskList, TaskStatus, Priority, PRStrategy
 
 
 def test_load_simple_task():
@@ -27,6 +27,7 @@ tasks:
     assert task.prompt == "Do something"
     assert task.expected_deliverable == "Something done"
     assert task.priority == Priority.MEDIUM  # Default
+    assert task.timeout == 600  # Default
 
 
 def test_load_task_with_all_fields():
@@ -39,6 +40,7 @@ tasks:
     expected_deliverable: "Complex thing done"
     priority: high
     auto_pr_timeout: 3600
+    timeout: 900
     pr_strategy: aggressive
     retry_policy:
       max_attempts: 5
@@ -57,6 +59,7 @@ tasks:
     assert task.priority == Priority.HIGH
     assert task.pr_strategy == PRStrategy.AGGRESSIVE
     assert task.auto_pr_timeout == 3600
+    assert task.timeout == 900
     assert task.retry_policy.max_attempts == 5
     assert task.retry_policy.backoff_factor == 1.5
     assert task.repository == "user/repo"
@@ -109,6 +112,19 @@ tasks:
     assert len(task_list) == 2
     dependent = task_list.get_task("DEPENDENT-001")
     assert dependent.dependencies == ["BASE-001"]
+    assert task_list.get_task("MISSING") is None
+
+    task_list.add_task(Task(id="LATE-001", name="Late", prompt="p", expected_deliverable="d"))
+    assert task_list.get_task("LATE-001").name == "Late"
+
+    # Tasks changed in place are found without going through add_task
+    replacement = Task(id="BASE-001", name="Replaced", prompt="p", expected_deliverable="d")
+    task_list.tasks[0] = replacement
+    assert task_list.get_task("BASE-001") is replacement
+
+    replacement.id = "RENAMED-001"
+    assert task_list.get_task("RENAMED-001") is replacement
+    assert task_list.get_task("BASE-001") is None
 
 
 def test_invalid_yaml_syntax():
@@ -196,6 +212,26 @@ tasks:
         TaskLoader.load_from_yaml_string(yaml_content)
 
 
+def test_circular_dependency_names_blocked_tasks():
+    """Test that every task stuck behind a cycle is reported, and long chains are fine."""
+    from conductor.tasks.models import TaskList
+
+    def task(task_id, dependencies):
+        return Task(
+            id=task_id,
+            name=task_id,
+            prompt="Do thing",
+            expected_deliverable="Thing done",
+            dependencies=dependencies,
+        )
+
+    with pytest.raises(ValueError, match="involving tasks: A, B"):
+        TaskList(tasks=[task("A", ["A"]), task("B", ["A"]), task("C", [])])
+
+    chain = [task("T0", [])] + [task(f"T{i}", [f"T{i - 1}"]) for i in range(1, 2000)]
+    assert len(TaskList(tasks=chain[::-1])) == 2000
+
+
 def test_nonexistent_dependency():
     """Test that nonexistent dependencies are detected."""
     yaml_content = """
@@ -248,3 +284,78 @@ tasks:
     runnable = task_list.get_runnable_tasks()
     runnable_ids = [t.id for t in runnable]
     assert "DEPENDENT-001" in runnable_ids
+
+
+def test_in_dependency_order():
+    """Test that tasks come after their dependencies, otherwise in file order."""
+    yaml_content = """
+tasks:
+  - id: "DEPENDENT-001"
+    name: "Dependent Task"
+    prompt: "Do dependent thing"
+    expected_deliverable: "Dependent thing done"
+    dependencies:
+      - "BASE-001"
+  - id: "INDEPENDENT-001"
+    name: "Independent Task"
+    prompt: "Do independent thing"
+    expected_deliverable: "Independent thing done"
+  - id: "BASE-001"
+    name: "Base Task"
+    prompt: "Do base thing"
+    expected_deliverable: "Base thing done"
+"""
+
+    task_list = TaskLoader.load_from_yaml_string(yaml_content)
+
+    assert [t.id for t in task_list.in_dependency_order()] == [
+        "INDEPENDENT-001",
+        "BASE-001",
+        "DEPENDENT-001",
+    ]
+
+
+def test_status_counts_follow_transitions():
+    """Test that status tallies track tasks as they change status."""
+    tasks = [
+        Task(id=f"T-{i}", name=f"Task {i}", prompt="p", expected_deliverable="d")
+        for i in range(3)
+    ]
+    task_list = TaskList(tasks=tasks)
+    assert task_list.status_counts()[TaskStatus.PENDING] == 3
+
+    tasks[0].start()
+    tasks[0].complete()
+    tasks[1].start()
+    tasks[1].fail("boom")
+    task_list.add_task(Task(id="T-3", name="Late", prompt="p", expected_deliverable="d"))
+    task_list.get_task("T-3").skip()
+
+    counts = task_list.status_counts()
+    assert counts[TaskStatus.COMPLETED] == 1
+    assert counts[TaskStatus.FAILED] == 1
+    assert counts[TaskStatus.SKIPPED] == 1
+    assert counts[TaskStatus.PENDING] == 1
+    assert counts[TaskStatus.RUNNING] == 0
+    assert task_list.completed_seconds() >= 0.0
+
+
+def test_completed_seconds_follow_reruns():
+    """Test that a task's run time is counted once, for its latest completion."""
+    task = Task(id="T-0", name="Task", prompt="p", expected_deliverable="d")
+    task_list = TaskList(tasks=[task])
+
+    task.start()
+    task.complete()
+    first = (task.completed_at - task.started_at).total_seconds()
+    task.complete()
+    assert task_list.completed_seconds() == first
+    assert task_list.status_counts()[TaskStatus.COMPLETED] == 1
+
+    # Running it again takes the earlier run back out of the total
+    task.start()
+    assert task_list.completed_seconds() == 0.0
+
+    task.complete()
+    assert task_list.completed_seconds() == (task.completed_at - task.started_at).total_seconds()
+    assert task_list.status_counts()[TaskStatus.COMPLETED] == 1
@@ -3,8 +3,13 @@ Tests for TUI components.
 """
 
 import pytest
+from conductor.browser.auth import AuthenticationFlow, AuthStatus
+from conductor.mcp.browser import BrowserController
+from conductor.mcp.client import MCPClient
+from conductor.orchestrator_tui import TUIOrchestrator, run_with_tui
 from conductor.tui.app import ConductorTUI, TaskQueuePanel, ExecutionPanel, MetricsPanel
 from conductor.tasks.models import Task, TaskList, TaskStatus, Priority
+from conductor.utils.config import Config
 
 
 @pytest.fixture
@@ -121,3 +126,58 @@ def test_conductor_tui_initialization(sample_tasks):
 
     assert app.task_list == task_list
     assert app.TITLE == "🎭 Conductor - Claude Code Orchestration"
+
+
+
+async def test_run_with_tui_keeps_shared_client_connected(sample_tasks, monkeypatch, tmp_path):
+    """Test that a shared MCP client stays connected after the TUI exits."""
+
+    async def connect(self):
+        self._connected, self._session = True, object()
+
+    async def start(self, headless=False, wait_for_user_input=True):
+        return AuthStatus.AUTHENTICATED
+
+    async def nothing(self, *args, **kwargs):
+        pass
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(MCPClient, "ensure_connected", connect)
+    monkeypatch.setattr(AuthenticationFlow, "start", start)
+    monkeypatch.setattr(BrowserController, "close", nothing)
+    monkeypatch.setattr(ConductorTUI, "run_async", nothing)
+    config = Config()
+    config.mcp.reuse_connection = True
+
+    await run_with_tui(config, TaskList(tasks=sample_tasks))
+
+    shared = MCPClient.get_shared(config.mcp.server_url)
+    assert shared.is_connected
+    shared._connected, shared._session = False, None
+    await MCPClient.close_shared()
+
+
+async def test_completion_wait_errors_stop_at_the_deadline(sample_tasks, monkeypatch):
+    """Test that a failing completion check doesn't sleep past the task timeout."""
+
+    class BrokenBrowser:
+        async def switch_tab(self, tab_index):
+            raise RuntimeError("tab gone")
+
+    clock = [0.0]
+    delays = []
+
+    async def advance(delay):
+        delays.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr("conductor.orchestrator_tui.monotonic", lambda: clock[0])
+    monkeypatch.setattr("conductor.orchestrator_tui.asyncio.sleep", advance)
+    orchestrator = TUIOrchestrator(Config(), TaskList(tasks=sample_tasks), app=None)
+    orchestrator.browser = BrokenBrowser()
+
+    await orchestrator._wait_for_task_completion(
+        sample_tasks[0], 1, 0.0, timeout=25, check_interval=10.0
+    )
+
+    assert delays == [10.0, 10.0, 5.0]